@@ -9,6 +9,9 @@ from .agentic_career_navigator import (
     ReroutingAgent,
     FeedbackAgent,
     call_llm,
+    acall_llm,
+    chat_llm,
+    achat_llm,
     extract_json,
 )
 
@@ -20,5 +23,8 @@ __all__ = [
     "ReroutingAgent",
     "FeedbackAgent",
     "call_llm",
+    "acall_llm",
+    "chat_llm",
+    "achat_llm",
     "extract_json",
 ]
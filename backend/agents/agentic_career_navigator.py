@@ -18,6 +18,7 @@ Usage:
   python agentic_career_navigator.py
 """
 
+import asyncio
 import json
 import re
 import os
@@ -25,6 +26,7 @@ import sys
 import time
 import shutil
 from datetime import date, timedelta, datetime
+from types import SimpleNamespace
 from typing import Optional, Dict, Any, List
 from pathlib import Path
 
@@ -39,10 +41,36 @@ try:
 except ImportError:
     pass
 
-from groq import AuthenticationError, Groq
+from groq import (
+    APIConnectionError,
+    AsyncGroq,
+    AuthenticationError,
+    Groq,
+    InternalServerError,
+    NotFoundError,
+    RateLimitError,
+)
 
 # Import database modules
 from backend.core.user_context import UserContextManager
+from backend.core.llm_cache import LLMCache
+from backend.core.singleflight import SingleFlight
+from backend.core.llm_governor import (
+    LLMGovernor,
+    LLMThrottledError,
+    estimate_tokens,
+    retry_after_seconds,
+)
+from backend.core.telemetry import LLMTelemetry
+from backend.core.llm_backends import GroqBackend, LLMBackend, LLMResult, backend_from_env
+from backend.core.json_stream import IncrementalJSONValidator, StreamDiverged, StreamShape
+from backend.core.hedging import HedgePolicy, ahedge, hedge_sync
+from backend.core.json_repair import json_repair_stats, repair_json
+from backend.core.model_router import ModelRouter
+from backend.core.agent_graph import AgentGraph
+from backend.core.prompt_builder import PromptBuilder, compile_schema
+from backend.core.answer_screen import answer_screen
+from backend.core.role_graph import role_graph
 from backend.database.db import db
 
 # Import resume analysis dependencies
@@ -70,9 +98,10 @@ except ImportError:
 # ═══════════════════════════════════════════════════════════════════
 
 API_ENV_VAR = "GROQ_API_KEY"
-MODEL = "openai/gpt-oss-120b"  # Groq-hosted GPT-style model
+MODEL = "openai/gpt-oss-120b"  # Groq-hosted GPT-style model (default / heavy tier)
 
-_client: Optional[Groq] = None
+# Errors worth retrying on the next model in the tier (transport, 5xx, retired model)
+_FALLBACK_ERRORS = (APIConnectionError, InternalServerError, NotFoundError)
 
 
 def _get_api_key() -> str:
@@ -85,56 +114,410 @@ def _get_api_key() -> str:
     return key
 
 
+# Active LLM backend — LLM_BACKEND=stub swaps in the offline stand-in
+# (see backend/core/llm_backends.py). The Groq backend always exists for get_client().
+llm_backend: LLMBackend = backend_from_env(_get_api_key)
+_groq_backend = llm_backend if isinstance(llm_backend, GroqBackend) else GroqBackend(_get_api_key)
+
+
 def get_client() -> Groq:
     """Lazily initialize and return the shared Groq client."""
-    global _client
-    if _client is None:
-        api_key = _get_api_key()
-        _client = Groq(api_key=api_key)
-    return _client
+    return _groq_backend.client
 
 
-def call_llm(system_prompt: str, user_prompt: str, max_tokens: int = 2048) -> str:
-    """
-    Central function for ALL LLM calls in the system.
-    Every agent must use this — no direct Groq calls elsewhere.
+def get_async_client() -> AsyncGroq:
+    """Lazily initialize and return the shared async Groq client (API path)."""
+    return _groq_backend.async_client
 
-    Returns the raw string content from the model.
-    Raises RuntimeError with clear error messages.
-    """
-    client = get_client()
-    try:
-        response = client.chat.completions.create(
-            model=MODEL,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            max_completion_tokens=max_tokens,
-            stream=False,
-        )
-        return response.choices[0].message.content.strip()
-        
-    except AuthenticationError as exc:
+
+def _llm_messages(system_prompt: str, user_prompt: str) -> list:
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_prompt},
+    ]
+
+
+def _wrap_llm_error(exc: Exception) -> RuntimeError:
+    """Translate SDK exceptions into the RuntimeError messages callers expect."""
+    if isinstance(exc, AuthenticationError):
         error_msg = (
             f"❌ Groq API Authentication Failed\n"
             f"   Check your {API_ENV_VAR} in .env file\n"
             f"   Error: {str(exc)}"
         )
-        raise RuntimeError(error_msg) from exc
-        
-    except Exception as exc:
+    else:
         error_msg = (
             f"❌ Groq API Error\n"
             f"   {type(exc).__name__}: {str(exc)}"
         )
-        raise RuntimeError(error_msg) from exc
+    return RuntimeError(error_msg)
+
+
+# Process-wide response cache (see backend/core/llm_cache.py)
+llm_cache = LLMCache.from_env()
+
+# Coalesces concurrent identical async LLM requests (see backend/core/singleflight.py)
+llm_flight = SingleFlight("llm")
+
+# Rate budget + adaptive concurrency + priorities (see backend/core/llm_governor.py)
+llm_governor = LLMGovernor.from_env()
+
+# Per-agent latency / token / error metrics served on /metrics (see backend/core/telemetry.py)
+llm_telemetry = LLMTelemetry()
+
+# Agent.op → model tier, with latency-aware fallbacks (see backend/core/model_router.py)
+llm_router = ModelRouter.from_env(MODEL)
+
+# Opt-in duplicate requests at a learned latency percentile (see backend/core/hedging.py)
+llm_hedge = HedgePolicy.from_env()
+
+# Extra attempts when a streamed completion diverges from its StreamShape
+# (see backend/core/json_stream.py). The last attempt always runs to completion
+# so downstream parsing/repair sees the full output. 0 = no streaming validation.
+LLM_STREAM_RETRIES = int(os.getenv("LLM_STREAM_RETRIES", "1"))
+
+# Targeted re-requests for missing / malformed roadmap months before RoadmapAgent gives up
+ROADMAP_REPAIR_ATTEMPTS = int(os.getenv("ROADMAP_REPAIR_ATTEMPTS", "2"))
+
+# Compact schemas + per-agent token budgets for prompt inputs (see backend/core/prompt_builder.py)
+prompt_builder = PromptBuilder.from_env()
 
 
-def extract_json(raw: str) -> dict:
+def call_llm(system_prompt: str, user_prompt: str, max_tokens: int = 2048,
+             agent: str = "default", op: str = "call",
+             shape: Optional[StreamShape] = None, use_cache: bool = True) -> str:
+    """
+    Central function for ALL LLM calls in the system.
+    Every agent must use this — no direct Groq calls elsewhere.
+
+    Identical (model, system, user, max_tokens) requests are served from
+    llm_cache within the calling agent's TTL; `use_cache=False` skips the
+    lookup (explicit regeneration) and stores the new answer. The model comes from
+    llm_router (per-op tier, falling back to the next model on errors).
+    Calls honour the governor's rate budget and are retried with backoff
+    when Groq returns 429.
+    Latency, token usage, errors and retries are recorded per (agent, op).
+
+    With a `shape`, the completion is streamed and validated as it arrives;
+    output that diverges from the shape is aborted and re-requested.
+
+    Returns the raw string content from the model.
+    Raises RuntimeError with clear error messages (LLMThrottledError when
+    Groq is still throttling after all retries).
+    """
+    key = llm_cache.make_key(llm_router.primary(agent, op), system_prompt, user_prompt, max_tokens)
+    cached = llm_cache.get(key, agent) if use_cache else None
+    if cached is not None:
+        return cached
+
+    messages = _llm_messages(system_prompt, user_prompt)
+    if shape is None and llm_hedge.enabled(agent, op):
+        content, latency = _complete_hedged(messages, max_tokens, agent, op)
+    else:
+        content, latency = _complete(messages, max_tokens, agent, op, shape)
+    llm_cache.set(key, content, agent, latency=latency)
+    return content
+
+
+def forget_llm(system_prompt: str, user_prompt: str, max_tokens: int,
+               agent: str = "default", op: str = "call") -> None:
+    """Drop the cached answer to this request so the next identical call reaches the model."""
+    llm_cache.discard(llm_cache.make_key(llm_router.primary(agent, op), system_prompt, user_prompt, max_tokens))
+
+
+async def aforget_llm(system_prompt: str, user_prompt: str, max_tokens: int,
+                      agent: str = "default", op: str = "call") -> None:
+    """Async twin of forget_llm()."""
+    await llm_cache.adiscard(
+        llm_cache.make_key(llm_router.primary(agent, op), system_prompt, user_prompt, max_tokens))
+
+
+def chat_llm(messages: List[dict], max_tokens: int = 1500,
+             agent: str = "HandsOnAgent", op: str = "chat") -> str:
+    """Multi-turn chat through the active backend (no caching — every turn is new)."""
+    content, _ = _complete(messages, max_tokens, agent, op)
+    return content
+
+
+def _complete(messages: List[dict], max_tokens: int, agent: str, op: str,
+              shape: Optional[StreamShape] = None) -> tuple:
+    """Sync backend round trip → (content, latency), re-requesting diverged streams."""
+    for attempt in range(LLM_STREAM_RETRIES + 1 if shape else 1):
+        try:
+            return _complete_once(messages, max_tokens, agent, op,
+                                  shape if attempt < LLM_STREAM_RETRIES else None)
+        except StreamDiverged as exc:
+            _note_divergence(agent, op, exc)
+
+
+def _complete_once(messages: List[dict], max_tokens: int, agent: str, op: str,
+                   shape: Optional[StreamShape]) -> tuple:
+    """One logical call with admission, model fallback, 429 retries and telemetry."""
+    tokens = estimate_tokens(*(str(m.get("content", "")) for m in messages)) + max_tokens
+    models = llm_router.candidates(agent, op)
+    for attempt in range(llm_governor.max_retries + 1):
+        model = models[attempt % len(models)]
+        llm_governor.acquire_sync(tokens)
+        started = time.time()
+        try:
+            if shape is None:
+                result = llm_backend.complete(model, messages, max_tokens, agent=agent, op=op)
+            else:
+                result = _stream_validated(model, messages, max_tokens, agent, op, shape)
+            content = result.content.strip()
+        except RateLimitError as exc:
+            llm_router.record(model, agent, op, ok=False, throttled=True)
+            llm_governor.release_sync(ok=False, throttled=True)
+            llm_telemetry.count_error(agent, op, "rate_limit")
+            if attempt >= llm_governor.max_retries:
+                raise _throttled_error(exc, attempt) from exc
+            llm_telemetry.count_retry(agent, op)
+            if (attempt + 1) % len(models) == 0:      # every model throttled → back off
+                time.sleep(retry_after_seconds(exc, attempt))
+            continue
+        except StreamDiverged:
+            llm_governor.release_sync(ok=True)
+            raise
+        except _FALLBACK_ERRORS as exc:
+            llm_router.record(model, agent, op, ok=False)
+            llm_governor.release_sync(ok=False)
+            llm_telemetry.count_error(agent, op, type(exc).__name__)
+            if attempt >= llm_governor.max_retries or len(models) == 1:
+                raise _wrap_llm_error(exc) from exc
+            llm_telemetry.count_retry(agent, op)
+            _note_fallback(model, models[(attempt + 1) % len(models)], agent, op, exc)
+            continue
+        except BaseException as exc:
+            llm_governor.release_sync(ok=False)
+            if isinstance(exc, Exception):
+                llm_telemetry.count_error(agent, op, type(exc).__name__)
+                raise _wrap_llm_error(exc) from exc
+            raise
+
+        latency = time.time() - started
+        llm_router.record(model, agent, op, ok=True, latency=latency)
+        llm_governor.release_sync(ok=True, latency=latency)
+        llm_telemetry.observe(agent, op, latency, result.usage)
+        return content, latency
+
+
+def _complete_hedged(messages: List[dict], max_tokens: int, agent: str, op: str) -> tuple:
+    """_complete() with a duplicate request after the op's hedge deadline."""
+    outcome = hedge_sync(
+        lambda: _complete(messages, max_tokens, agent, op),
+        llm_hedge.delay(agent, op, llm_telemetry),
+        llm_governor.has_capacity,
+    )
+    _note_hedge(agent, op, outcome)
+    return outcome.value
+
+
+def _note_hedge(agent: str, op: str, outcome) -> None:
+    if not outcome.hedged:
+        return
+    llm_telemetry.count_hedge(agent, op, outcome.hedge_won)
+    if outcome.loser_elapsed is not None:
+        # Keep the cancelled slow attempt in the window the deadline is learned from
+        llm_telemetry.observe(agent, op, outcome.loser_elapsed, outcome="hedge_cancelled")
+
+
+def _stream_validated(model: str, messages: List[dict], max_tokens: int, agent: str, op: str,
+                      shape: StreamShape) -> LLMResult:
+    """Stream a completion through the shape validator; stops reading once the JSON closes."""
+    validator = IncrementalJSONValidator(shape)
+    parts = []
+    stream = llm_backend.stream(model, messages, max_tokens, agent=agent, op=op)
+    try:
+        for chunk in stream:
+            parts.append(chunk)
+            if validator.feed(chunk):
+                break
+    finally:
+        stream.close()
+    return _streamed_result(messages, "".join(parts))
+
+
+async def _astream_validated(model: str, messages: List[dict], max_tokens: int, agent: str, op: str,
+                             shape: StreamShape) -> LLMResult:
+    """Async variant of _stream_validated()."""
+    validator = IncrementalJSONValidator(shape)
+    parts = []
+    stream = llm_backend.astream(model, messages, max_tokens, agent=agent, op=op)
+    try:
+        async for chunk in stream:
+            parts.append(chunk)
+            if validator.feed(chunk):
+                break
+    finally:
+        await stream.aclose()
+    return _streamed_result(messages, "".join(parts))
+
+
+def _streamed_result(messages: List[dict], content: str) -> LLMResult:
+    # Streamed responses carry no usage block — estimate it for telemetry
+    usage = SimpleNamespace(
+        prompt_tokens=estimate_tokens(*(str(m.get("content", "")) for m in messages)),
+        completion_tokens=estimate_tokens(content),
+    )
+    return LLMResult(content, usage)
+
+
+def _note_fallback(model: str, next_model: str, agent: str, op: str, exc: Exception) -> None:
+    print(f"  [LLM] {agent}.{op}: {model} failed ({type(exc).__name__}) — falling back to {next_model}")
+
+
+def _note_divergence(agent: str, op: str, exc: StreamDiverged) -> None:
+    llm_telemetry.count_error(agent, op, "stream_diverged")
+    llm_telemetry.count_retry(agent, op)
+    print(f"  [LLM] {agent}.{op}: output diverged ({exc.reason}) — aborted after {exc.chars} chars, retrying")
+
+
+async def acall_llm(system_prompt: str, user_prompt: str, max_tokens: int = 2048,
+                    agent: str = "default", op: str = "call",
+                    priority: Optional[int] = None,
+                    shape: Optional[StreamShape] = None, use_cache: bool = True) -> str:
+    """
+    Async twin of call_llm() used by the FastAPI path.
+    Awaits the Groq round trip so a slow completion never blocks the
+    event loop — one worker can keep many LLM calls in flight at once.
+    Concurrent identical requests are coalesced into one Groq call, and
+    admission goes through llm_governor (priority defaults per agent).
+    """
+    key = llm_cache.make_key(llm_router.primary(agent, op), system_prompt, user_prompt, max_tokens)
+    cached = await llm_cache.aget(key, agent) if use_cache else None
+    if cached is not None:
+        return cached
+
+    priority = llm_governor.priority_for(agent, priority)
+
+    async def _miss() -> str:
+        messages = _llm_messages(system_prompt, user_prompt)
+        if shape is None and llm_hedge.enabled(agent, op):
+            content, latency = await _acomplete_hedged(messages, max_tokens, agent, op, priority)
+        else:
+            content, latency = await _acomplete(messages, max_tokens, agent, op, priority, shape)
+        await llm_cache.aset(key, content, agent, latency=latency)
+        return content
+
+    # A bypassing call must not join an identical in-flight request it would echo
+    return await llm_flight.do(key if use_cache else f"{key}:fresh", _miss)
+
+
+async def achat_llm(messages: List[dict], max_tokens: int = 1500,
+                    agent: str = "HandsOnAgent", op: str = "chat",
+                    priority: Optional[int] = None) -> str:
+    """Async multi-turn chat (hands-on mentor) through the active backend."""
+    content, _ = await _acomplete(
+        messages, max_tokens, agent, op, llm_governor.priority_for(agent, priority)
+    )
+    return content
+
+
+async def _acomplete(messages: List[dict], max_tokens: int, agent: str, op: str,
+                     priority: int, shape: Optional[StreamShape] = None) -> tuple:
+    """Async backend round trip → (content, latency), re-requesting diverged streams."""
+    for attempt in range(LLM_STREAM_RETRIES + 1 if shape else 1):
+        try:
+            return await _acomplete_once(messages, max_tokens, agent, op, priority,
+                                         shape if attempt < LLM_STREAM_RETRIES else None)
+        except StreamDiverged as exc:
+            _note_divergence(agent, op, exc)
+
+
+async def _acomplete_hedged(messages: List[dict], max_tokens: int, agent: str, op: str,
+                            priority: int) -> tuple:
+    """_acomplete() raced against a duplicate sent after the op's hedge deadline."""
+    outcome = await ahedge(
+        lambda: _acomplete(messages, max_tokens, agent, op, priority),
+        llm_hedge.delay(agent, op, llm_telemetry),
+        llm_governor.has_capacity,
+    )
+    _note_hedge(agent, op, outcome)
+    return outcome.value
+
+
+async def _acomplete_once(messages: List[dict], max_tokens: int, agent: str, op: str,
+                          priority: int, shape: Optional[StreamShape]) -> tuple:
+    """One logical call with admission, model fallback, 429 retries and telemetry."""
+    tokens = estimate_tokens(*(str(m.get("content", "")) for m in messages)) + max_tokens
+    models = llm_router.candidates(agent, op)
+    for attempt in range(llm_governor.max_retries + 1):
+        model = models[attempt % len(models)]
+        await llm_governor.acquire(priority, tokens)
+        started = time.time()
+        try:
+            if shape is None:
+                result = await llm_backend.acomplete(model, messages, max_tokens, agent=agent, op=op)
+            else:
+                result = await _astream_validated(model, messages, max_tokens, agent, op, shape)
+            content = result.content.strip()
+        except RateLimitError as exc:
+            llm_router.record(model, agent, op, ok=False, throttled=True)
+            llm_governor.release(ok=False, throttled=True)
+            llm_telemetry.count_error(agent, op, "rate_limit")
+            if attempt >= llm_governor.max_retries:
+                raise _throttled_error(exc, attempt) from exc
+            llm_telemetry.count_retry(agent, op)
+            if (attempt + 1) % len(models) == 0:      # every model throttled → back off
+                await asyncio.sleep(retry_after_seconds(exc, attempt))
+            continue
+        except StreamDiverged:
+            llm_governor.release(ok=True)
+            raise
+        except _FALLBACK_ERRORS as exc:
+            llm_router.record(model, agent, op, ok=False)
+            llm_governor.release(ok=False)
+            llm_telemetry.count_error(agent, op, type(exc).__name__)
+            if attempt >= llm_governor.max_retries or len(models) == 1:
+                raise _wrap_llm_error(exc) from exc
+            llm_telemetry.count_retry(agent, op)
+            _note_fallback(model, models[(attempt + 1) % len(models)], agent, op, exc)
+            continue
+        except BaseException as exc:
+            llm_governor.release(ok=False)
+            if isinstance(exc, Exception):
+                llm_telemetry.count_error(agent, op, type(exc).__name__)
+                raise _wrap_llm_error(exc) from exc
+            raise
+
+        latency = time.time() - started
+        llm_router.record(model, agent, op, ok=True, latency=latency)
+        llm_governor.release(ok=True, latency=latency)
+        llm_telemetry.observe(agent, op, latency, result.usage)
+        return content, latency
+
+
+def _throttled_error(exc: Exception, attempt: int) -> LLMThrottledError:
+    return LLMThrottledError(
+        f"❌ Groq API rate limit — still throttled after {attempt + 1} attempts. Please retry shortly.",
+        retry_after=retry_after_seconds(exc, attempt),
+    )
+
+
+def _avoid_block(avoid: Optional[list]) -> str:
+    """Prompt lines listing already-banked questions the model should not repeat."""
+    if not avoid:
+        return ""
+    lines = "\n".join(f"- {q[:200]}" for q in avoid[:15])
+    return f"Do NOT repeat or paraphrase these existing questions:\n{lines}\n\n"
+
+
+def _dropped_block(dropped: int) -> str:
+    """Prompt line telling the evaluator about answers screened out locally."""
+    if not dropped:
+        return ""
+    return (f"Note: {dropped} further answer(s) were blank, non-answers or copies of the "
+            "question and are omitted — count them as incorrect.\n\n")
+
+
+def extract_json(raw: str, repairs: Optional[list] = None) -> dict:
     """
     Robustly parse JSON from a model response that may contain
     markdown fences, prose preambles, or trailing text.
+
+    If plain parsing fails, a local repair pass (backend/core/json_repair.py)
+    fixes trailing commas, comments, single quotes, truncated output, etc.
+    The names of the repairs applied are appended to `repairs` when given.
     """
     # Strip markdown fences
     cleaned = re.sub(r"^```(?:json)?\s*", "", raw.strip(), flags=re.IGNORECASE)
@@ -154,6 +537,20 @@ def extract_json(raw: str) -> dict:
         except json.JSONDecodeError:
             pass
 
+    # Local repair pass — no extra LLM round trip
+    repaired, applied = repair_json(cleaned)
+    if applied:
+        try:
+            result = json.loads(repaired)
+        except json.JSONDecodeError:
+            json_repair_stats.record(applied, ok=False)
+        else:
+            json_repair_stats.record(applied, ok=True)
+            print(f"  [JSON] Repaired model output locally: {', '.join(applied)}")
+            if repairs is not None:
+                repairs.extend(applied)
+            return result
+
     raise ValueError(f"Could not extract valid JSON from LLM response:\n{raw[:500]}")
 
 
@@ -194,7 +591,33 @@ class ResumeAnalyzerAgent:
         skill_gap_analysis: dict
         career_recommendations: dict
     """
-    
+
+    _SCHEMA = compile_schema({
+        "parsed_profile": {
+            "name": "string or null",
+            "email": "string or null",
+            "phone": "string or null",
+            "location": "string or null",
+            "linkedin": "string or null",
+            "github": "string or null",
+            "experience_years": 0,
+            "job_titles": [],
+            "education": [],
+            "certifications": []
+        },
+        "extracted_skills": {
+            "programming_languages": ["Java", "Python", "C++"],
+            "frameworks": ["React", "Django", "Spring"],
+            "databases": ["MongoDB", "MySQL", "PostgreSQL"],
+            "cloud_platforms": ["AWS", "Azure", "GCP"],
+            "tools": ["Git", "GitHub", "Docker", "Jenkins"],
+            "soft_skills": ["Leadership", "Communication", "Problem-solving", "Teamwork"]
+        },
+        "projects": [{"name": "string", "description": "string", "technologies": []}],
+        "achievements": [],
+        "languages": []
+    })
+
     def __init__(self):
         self.name = "ResumeAnalyzerAgent"
         self.context_manager = UserContextManager()
@@ -268,25 +691,27 @@ class ResumeAnalyzerAgent:
         else:
             return "", "unsupported"
 
-    def parse_resume(self, resume_text: str) -> Dict[str, Any]:
-        """Parse resume text using LLM to extract structured information"""
-        if len(resume_text) < 50:
-            print(f"  [Resume] Warning: Extracted text too short ({len(resume_text)} chars). Resume may not have readable content.")
-            return {
-                "parsed_profile": {},
-                "extracted_skills": {
-                    "programming_languages": [],
-                    "frameworks": [],
-                    "databases": [],
-                    "cloud_platforms": [],
-                    "tools": [],
-                    "soft_skills": []
-                },
-                "projects": [],
-                "achievements": [],
-                "languages": []
-            }
+    @staticmethod
+    def _empty_parse() -> Dict[str, Any]:
+        """Empty parse result returned when the resume cannot be parsed."""
+        return {
+            "parsed_profile": {},
+            "extracted_skills": {
+                "programming_languages": [],
+                "frameworks": [],
+                "databases": [],
+                "cloud_platforms": [],
+                "tools": [],
+                "soft_skills": []
+            },
+            "projects": [],
+            "achievements": [],
+            "languages": []
+        }
 
+    def _resume_prompt(self, resume_text: str) -> tuple:
+        """Build the (system, user) prompt pair for resume parsing."""
+        resume_text = prompt_builder.text(self.name, "resume_text", resume_text)
         system = (
             "You are a professional resume parser. Extract technical skills, soft skills, and profile information.\n"
             "\nTECHNICAL SKILLS:"
@@ -300,92 +725,66 @@ class ResumeAnalyzerAgent:
             "\n\nReturn ONLY valid JSON matching the provided schema. No explanations."
         )
 
-        schema = {
-            "parsed_profile": {
-                "name": "string or null",
-                "email": "string or null",
-                "phone": "string or null",
-                "location": "string or null",
-                "linkedin": "string or null",
-                "github": "string or null",
-                "experience_years": 0,
-                "job_titles": [],
-                "education": [],
-                "certifications": []
-            },
-            "extracted_skills": {
-                "programming_languages": ["Java", "Python", "C++"],
-                "frameworks": ["React", "Django", "Spring"],
-                "databases": ["MongoDB", "MySQL", "PostgreSQL"],
-                "cloud_platforms": ["AWS", "Azure", "GCP"],
-                "tools": ["Git", "GitHub", "Docker", "Jenkins"],
-                "soft_skills": ["Leadership", "Communication", "Problem-solving", "Teamwork"]
-            },
-            "projects": [{"name": "string", "description": "string", "technologies": []}],
-            "achievements": [],
-            "languages": []
-        }
-
         user = (
-            f"Extract ALL information from this resume:\n\n{resume_text[:4000]}\n\n"
+            f"Extract ALL information from this resume:\n\n{resume_text}\n\n"
             f"IMPORTANT: For SOFT SKILLS, extract EVERY soft skill and competency mentioned in the resume. "
             f"For TOOLS, use ONLY: Git/GitHub/GitLab, Jenkins/GitHub Actions, Docker/Kubernetes, Jest/JUnit/Pytest, VS Code/IntelliJ. "
             f"Do NOT include: JWT, OAuth, OTP, REST, HTTP, SOAP, Render, Heroku, Vercel, generic 'CI/CD', or generic 'API'.\n\n"
-            f"Return this exact JSON schema with extracted data:\n{json.dumps(schema, indent=2)}"
+            f"Return this exact JSON schema with extracted data:\n{self._SCHEMA.render()}"
         )
+        return system, user
 
+    def _parse_resume_response(self, response: str) -> Dict[str, Any]:
+        """Turn the raw LLM response into the parsed resume dict (empty on failure)."""
+        print(f"  [Resume] LLM response received ({len(response)} chars)")
         try:
-            print(f"  [Resume] Calling Groq LLM for resume parsing...")
-            response = call_llm(system, user, max_tokens=2500)
-            print(f"  [Resume] LLM response received ({len(response)} chars)")
-            
             response = response.replace("```json", "").replace("```", "").strip()
             parsed = extract_json(response)
             print(f"  [Resume] JSON parsing successful")
             print(f"  [Resume] Found {len(parsed.get('extracted_skills', {}).get('programming_languages', []))} programming languages")
             return parsed
-            
-        except RuntimeError as auth_err:
-            # Re-raise authentication errors - these are critical
-            print(f"  ✗ [Resume] AUTHENTICATION ERROR: {str(auth_err)}")
-            raise auth_err
-            
+
         except json.JSONDecodeError as json_err:
             print(f"  ✗ [Resume] JSON parsing failed: {str(json_err)[:100]}")
             print(f"  [Resume] Raw response: {response[:200]}...")
-            return {
-                "parsed_profile": {},
-                "extracted_skills": {
-                    "programming_languages": [],
-                    "frameworks": [],
-                    "databases": [],
-                    "cloud_platforms": [],
-                    "tools": [],
-                    "soft_skills": []
-                },
-                "projects": [],
-                "achievements": [],
-                "languages": []
-            }
-            
+            return self._empty_parse()
+
         except Exception as e:
             print(f"  ✗ [Resume] Unexpected error: {str(e)[:100]}")
             import traceback
             traceback.print_exc()
-            return {
-                "parsed_profile": {},
-                "extracted_skills": {
-                    "programming_languages": [],
-                    "frameworks": [],
-                    "databases": [],
-                    "cloud_platforms": [],
-                    "tools": [],
-                    "soft_skills": []
-                },
-                "projects": [],
-                "achievements": [],
-                "languages": []
-            }
+            return self._empty_parse()
+
+    def parse_resume(self, resume_text: str) -> Dict[str, Any]:
+        """Parse resume text using LLM to extract structured information"""
+        if len(resume_text) < 50:
+            print(f"  [Resume] Warning: Extracted text too short ({len(resume_text)} chars). Resume may not have readable content.")
+            return self._empty_parse()
+
+        system, user = self._resume_prompt(resume_text)
+        try:
+            print(f"  [Resume] Calling Groq LLM for resume parsing...")
+            response = call_llm(system, user, max_tokens=2500, agent=self.name, op="parse_resume")
+        except RuntimeError as auth_err:
+            # Re-raise authentication errors - these are critical
+            print(f"  ✗ [Resume] AUTHENTICATION ERROR: {str(auth_err)}")
+            raise auth_err
+        return self._parse_resume_response(response)
+
+    async def aparse_resume(self, resume_text: str) -> Dict[str, Any]:
+        """Async variant of parse_resume() for the API path."""
+        if len(resume_text) < 50:
+            print(f"  [Resume] Warning: Extracted text too short ({len(resume_text)} chars). Resume may not have readable content.")
+            return self._empty_parse()
+
+        system, user = self._resume_prompt(resume_text)
+        try:
+            print(f"  [Resume] Calling Groq LLM for resume parsing...")
+            response = await acall_llm(system, user, max_tokens=2500, agent=self.name, op="parse_resume")
+        except RuntimeError as auth_err:
+            print(f"  ✗ [Resume] AUTHENTICATION ERROR: {str(auth_err)}")
+            raise auth_err
+        return self._parse_resume_response(response)
 
     def normalize_skills(self, extracted_skills: Dict[str, List[str]]) -> List[str]:
         """Flatten and normalize TECHNICAL skills only (exclude soft skills and non-skill terms)"""
@@ -471,6 +870,104 @@ class ResumeAnalyzerAgent:
             "high_impact_missing": missing_skills[:3]  # Top 3 critical
         }
 
+    def _store_analysis(self, user_id: str, file_name: str, parsed_data: Dict[str, Any],
+                        extraction_method: str, start_time: float) -> dict:
+        """Normalize parsed resume data, persist it to the user context and build the result."""
+        print(f"  [3/3] Normalizing skills...")
+        extracted_skills_dict = parsed_data.get("extracted_skills", {})
+        normalized_skills = self.normalize_skills(extracted_skills_dict)
+        soft_skills = self.extract_soft_skills(extracted_skills_dict)
+        
+        # NOTE: Skill gap analysis moved to ReadinessAssessmentAgent
+        # Gap analysis requires knowing target_role, which is selected AFTER resume upload
+        
+        processing_time = time.time() - start_time
+        
+        # Update context with resume data
+        context = self.context_manager.load_context(user_id)
+        parsed_profile = parsed_data.get("parsed_profile", {})
+        
+        # Map to profile section
+        context["profile"].update({
+            "name": parsed_profile.get("name"),
+            "email": parsed_profile.get("email"),
+            "phone": parsed_profile.get("phone"),
+            "experience_years": parsed_profile.get("experience_years", 0),
+            "resume_uploaded": True,
+            "resume_uploaded_at": datetime.now().isoformat(),
+            "resume_file_name": file_name
+        })
+        
+        # Map education
+        education_list = parsed_profile.get("education", [])
+        if education_list and len(education_list) > 0:
+            edu_str = education_list[0] if isinstance(education_list[0], str) else ""
+            if edu_str:
+                context["profile"]["education"]["degree"] = edu_str
+        
+        # Map skills
+        if extracted_skills_dict:
+            context["profile"]["skills"] = {
+                "technical": extracted_skills_dict.get("programming_languages", []),
+                "frameworks": extracted_skills_dict.get("frameworks", []),
+                "databases": extracted_skills_dict.get("databases", []),
+                "tools": extracted_skills_dict.get("tools", []) + extracted_skills_dict.get("cloud_platforms", []),
+                "soft_skills": extracted_skills_dict.get("soft_skills", [])
+            }
+        
+        # Map other fields
+        context["profile"]["projects"] = parsed_data.get("projects", [])
+        context["profile"]["certifications"] = parsed_data.get("certifications", []) or parsed_profile.get("certifications", [])
+        context["profile"]["achievements"] = parsed_data.get("achievements", [])
+        context["profile"]["languages"] = parsed_data.get("languages", [])
+        context["profile"]["linkedin"] = parsed_profile.get("linkedin")
+        context["profile"]["github"] = parsed_profile.get("github")
+        
+        # Note: Skill gap analysis will be done during readiness assessment
+        # after target role is selected
+        
+        # Store analysis
+        context["resume_analysis"] = {
+            "parsed_profile": parsed_profile,
+            "extracted_skills": extracted_skills_dict,
+            "normalized_skills": normalized_skills,
+            "soft_skills": soft_skills,
+            "extraction_method": extraction_method,
+            "processing_time_seconds": round(processing_time, 2)
+        }
+        
+        self.context_manager.save_context(user_id, context)
+        
+        # Sync to MongoDB
+        db.upsert_user(user_id, context)
+        
+        print(f"  ✓ Resume analysis complete in {processing_time:.2f}s")
+        print(f"  ✓ {len(normalized_skills)} technical skills extracted")
+        print(f"  ✓ {len(soft_skills)} soft skills identified")
+        
+        return {
+            "status": "success",
+            "parsed_profile": parsed_profile,
+            "extracted_skills": extracted_skills_dict,
+            "normalized_skills": normalized_skills,
+            "soft_skills": soft_skills
+        }
+
+    def _run_error(self, exc: Exception) -> dict:
+        """Shared error handling for run()/arun()."""
+        if isinstance(exc, RuntimeError):
+            # Authentication errors should be raised immediately - these are critical
+            if "authentication" in str(exc).lower():
+                print(f"  ✗ CRITICAL: {str(exc)}")
+                raise exc
+            print(f"  ✗ Resume analysis failed: {str(exc)[:100]}")
+            return {"status": "error", "message": str(exc)}
+
+        print(f"  ✗ Resume analysis failed: {str(exc)[:100]}")
+        import traceback
+        traceback.print_exc()
+        return {"status": "error", "message": str(exc)}
+
     def run(self, input_data: dict) -> dict:
         """Complete resume analysis workflow - Extract and normalize skills only (gap analysis happens during readiness)"""
         user_id = input_data["user_id"]
@@ -488,101 +985,39 @@ class ResumeAnalyzerAgent:
             
             print(f"  [2/3] Parsing resume structure...")
             parsed_data = self.parse_resume(raw_text)
-            
-            print(f"  [3/3] Normalizing skills...")
-            extracted_skills_dict = parsed_data.get("extracted_skills", {})
-            normalized_skills = self.normalize_skills(extracted_skills_dict)
-            soft_skills = self.extract_soft_skills(extracted_skills_dict)
-            
-            # NOTE: Skill gap analysis moved to ReadinessAssessmentAgent
-            # Gap analysis requires knowing target_role, which is selected AFTER resume upload
-            
-            processing_time = time.time() - start_time
-            
-            # Update context with resume data
-            context = self.context_manager.load_context(user_id)
-            parsed_profile = parsed_data.get("parsed_profile", {})
-            
-            # Map to profile section
-            context["profile"].update({
-                "name": parsed_profile.get("name"),
-                "email": parsed_profile.get("email"),
-                "phone": parsed_profile.get("phone"),
-                "experience_years": parsed_profile.get("experience_years", 0),
-                "resume_uploaded": True,
-                "resume_uploaded_at": datetime.now().isoformat(),
-                "resume_file_name": file_name
-            })
-            
-            # Map education
-            education_list = parsed_profile.get("education", [])
-            if education_list and len(education_list) > 0:
-                edu_str = education_list[0] if isinstance(education_list[0], str) else ""
-                if edu_str:
-                    context["profile"]["education"]["degree"] = edu_str
-            
-            # Map skills
-            if extracted_skills_dict:
-                context["profile"]["skills"] = {
-                    "technical": extracted_skills_dict.get("programming_languages", []),
-                    "frameworks": extracted_skills_dict.get("frameworks", []),
-                    "databases": extracted_skills_dict.get("databases", []),
-                    "tools": extracted_skills_dict.get("tools", []) + extracted_skills_dict.get("cloud_platforms", []),
-                    "soft_skills": extracted_skills_dict.get("soft_skills", [])
-                }
-            
-            # Map other fields
-            context["profile"]["projects"] = parsed_data.get("projects", [])
-            context["profile"]["certifications"] = parsed_data.get("certifications", []) or parsed_profile.get("certifications", [])
-            context["profile"]["achievements"] = parsed_data.get("achievements", [])
-            context["profile"]["languages"] = parsed_data.get("languages", [])
-            context["profile"]["linkedin"] = parsed_profile.get("linkedin")
-            context["profile"]["github"] = parsed_profile.get("github")
-            
-            # Note: Skill gap analysis will be done during readiness assessment
-            # after target role is selected
-            
-            # Store analysis
-            context["resume_analysis"] = {
-                "parsed_profile": parsed_profile,
-                "extracted_skills": extracted_skills_dict,
-                "normalized_skills": normalized_skills,
-                "soft_skills": soft_skills,
-                "extraction_method": extraction_method,
-                "processing_time_seconds": round(processing_time, 2)
-            }
-            
-            self.context_manager.save_context(user_id, context)
-            
-            # Sync to MongoDB
-            db.upsert_user(user_id, context)
-            
-            print(f"  ✓ Resume analysis complete in {processing_time:.2f}s")
-            print(f"  ✓ {len(normalized_skills)} technical skills extracted")
-            print(f"  ✓ {len(soft_skills)} soft skills identified")
-            
-            return {
-                "status": "success",
-                "parsed_profile": parsed_profile,
-                "extracted_skills": extracted_skills_dict,
-                "normalized_skills": normalized_skills,
-                "soft_skills": soft_skills
-            }
-            
-        except RuntimeError as auth_err:
-            # Authentication errors should be raised immediately - these are critical
-            if "authentication" in str(auth_err).lower():
-                print(f"  ✗ CRITICAL: {str(auth_err)}")
-                raise auth_err
-            else:
-                print(f"  ✗ Resume analysis failed: {str(auth_err)[:100]}")
-                return {"status": "error", "message": str(auth_err)}
-                
+            return self._store_analysis(user_id, file_name, parsed_data, extraction_method, start_time)
         except Exception as e:
-            print(f"  ✗ Resume analysis failed: {str(e)[:100]}")
-            import traceback
-            traceback.print_exc()
-            return {"status": "error", "message": str(e)}
+            return self._run_error(e)
+
+    async def arun(self, input_data: dict) -> dict:
+        """
+        Async variant of run(). Text extraction (pdfminer/OCR) and the
+        context write are blocking, so they run in a worker thread while
+        the parse call is awaited.
+        """
+        user_id = input_data["user_id"]
+        file_path = input_data["file_path"]
+        file_name = input_data.get("file_name", "resume")
+
+        start_time = time.time()
+
+        try:
+            print(f"  [1/3] Extracting text from {file_name}...")
+            raw_text, extraction_method = await asyncio.to_thread(self.extract_text, file_path)
+
+            if not raw_text or len(raw_text) < 50:
+                return {"status": "error", "message": "Could not extract text from resume"}
+
+            print(f"  [2/3] Parsing resume structure...")
+            parsed_data = await self.aparse_resume(raw_text)
+            return await asyncio.to_thread(
+                self._store_analysis, user_id, file_name, parsed_data, extraction_method, start_time
+            )
+        except LLMThrottledError:
+            # Saturated — the API answers 503 + Retry-After instead of an error payload
+            raise
+        except Exception as e:
+            return self._run_error(e)
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -608,11 +1043,19 @@ class ReadinessAssessmentAgent:
     Note: Q&A is kept in-memory only — NOT stored in persistent state.
     """
 
+    _EVALUATE_SCHEMA = compile_schema({
+        "readiness_score": "<int 0-100>",
+        "readiness_status": "<'underqualified'|'qualified'|'overqualified'>",
+        "evaluation_summary": "<string>",
+        "safer_adjacent_roles": ["<role1>", "<role2>", "<role3>"],
+        "advanced_adjacent_roles": ["<role1>", "<role2>"]
+    })
+
     def __init__(self):
         self.name = "ReadinessAssessmentAgent"
 
-    def _generate_questions(self, target_role: str, skills: list, strengths: list) -> list[str]:
-        """Ask the LLM to produce 10 readiness-evaluation questions."""
+    def _questions_prompt(self, target_role: str, skills: list, strengths: list,
+                          avoid: Optional[list] = None) -> tuple:
         system = (
             "You are an expert career assessment interviewer. "
             "Generate exactly 10 concise, specific questions to evaluate a candidate's "
@@ -621,12 +1064,15 @@ class ReadinessAssessmentAgent:
         )
         user = (
             f"Target Role: {target_role}\n"
-            f"Candidate Skills: {', '.join(skills)}\n"
-            f"Candidate Strengths: {', '.join(strengths)}\n\n"
+            f"Candidate Skills: {prompt_builder.items(self.name, 'skills', skills)}\n"
+            f"Candidate Strengths: {prompt_builder.items(self.name, 'strengths', strengths)}\n\n"
+            f"{_avoid_block(avoid)}"
             "Return format: [\"question1\", \"question2\", ..., \"question10\"]"
         )
-        raw = call_llm(system, user, max_tokens=800)
+        return system, user
 
+    @staticmethod
+    def _parse_questions(raw: str) -> list[str]:
         # Parse array
         match = re.search(r"\[.*\]", raw, re.DOTALL)
         if match:
@@ -635,6 +1081,19 @@ class ReadinessAssessmentAgent:
         lines = [l.strip().lstrip("0123456789.)- ") for l in raw.splitlines() if l.strip()]
         return lines[:10] if len(lines) >= 10 else lines
 
+    def _generate_questions(self, target_role: str, skills: list, strengths: list) -> list[str]:
+        """Ask the LLM to produce 10 readiness-evaluation questions."""
+        system, user = self._questions_prompt(target_role, skills, strengths)
+        raw = call_llm(system, user, max_tokens=800, agent=self.name, op="questions")
+        return self._parse_questions(raw)
+
+    async def _agenerate_questions(self, target_role: str, skills: list, strengths: list,
+                                   avoid: Optional[list] = None) -> list[str]:
+        """Async variant of _generate_questions(); `avoid` lists questions not to repeat."""
+        system, user = self._questions_prompt(target_role, skills, strengths, avoid)
+        raw = await acall_llm(system, user, max_tokens=800, agent=self.name, op="questions")
+        return self._parse_questions(raw)
+
     def _collect_answers(self, questions: list[str]) -> list[dict]:
         """Collect answers from the user via CLI. Q&A stays in memory only."""
         qa_pairs = []
@@ -646,29 +1105,49 @@ class ReadinessAssessmentAgent:
             print()
         return qa_pairs  # ephemeral — not written to persistent state
 
-    def _evaluate(self, target_role: str, qa_pairs: list[dict]) -> dict:
-        """Send Q&A to LLM for evaluation. Returns structured result."""
+    def _evaluate_prompt(self, target_role: str, qa_pairs: list[dict], dropped: int = 0) -> tuple:
         system = (
             "You are a senior career evaluation AI. "
             "Evaluate the candidate's readiness based on their Q&A responses. "
             "Return ONLY valid JSON matching the exact schema provided."
         )
-        qa_text = "\n".join(
-            f"Q: {p['question']}\nA: {p['answer']}" for p in qa_pairs
-        )
-        schema = json.dumps({
-            "readiness_score": "<int 0-100>",
-            "readiness_status": "<'underqualified'|'qualified'|'overqualified'>",
-            "evaluation_summary": "<string>",
-            "safer_adjacent_roles": ["<role1>", "<role2>", "<role3>"],
-            "advanced_adjacent_roles": ["<role1>", "<role2>"]
-        }, indent=2)
+        qa_text = prompt_builder.qa(self.name, "qa", qa_pairs)
         user = (
             f"Target Role: {target_role}\n\n"
             f"Q&A Session:\n{qa_text}\n\n"
-            f"Return this exact JSON schema filled in:\n{schema}"
+            f"{_dropped_block(dropped)}"
+            f"Return this exact JSON schema filled in:\n{self._EVALUATE_SCHEMA.render()}"
         )
-        raw = call_llm(system, user, max_tokens=1000)
+        return system, user
+
+    @staticmethod
+    def _local_result(screen) -> dict:
+        """Deterministic result for a submission with no real answers."""
+        print(f"  ✓ Scored locally (no answers given: {screen.reasons}).")
+        return {
+            "readiness_score": screen.local_score,
+            "readiness_status": "underqualified",
+            "evaluation_summary": screen.summary(),
+            "safer_adjacent_roles": [],
+            "advanced_adjacent_roles": [],
+        }
+
+    def _evaluate(self, target_role: str, qa_pairs: list[dict]) -> dict:
+        """Send Q&A to LLM for evaluation. Returns structured result."""
+        screen = answer_screen.screen(qa_pairs, context=target_role)
+        if screen.short_circuit:
+            return self._local_result(screen)
+        system, user = self._evaluate_prompt(target_role, screen.kept, screen.dropped)
+        raw = call_llm(system, user, max_tokens=1000, agent=self.name, op="evaluate")
+        return extract_json(raw)
+
+    async def _aevaluate(self, target_role: str, qa_pairs: list[dict]) -> dict:
+        """Async variant of _evaluate()."""
+        screen = answer_screen.screen(qa_pairs, context=target_role)
+        if screen.short_circuit:
+            return self._local_result(screen)
+        system, user = self._evaluate_prompt(target_role, screen.kept, screen.dropped)
+        raw = await acall_llm(system, user, max_tokens=1000, agent=self.name, op="evaluate")
         return extract_json(raw)
 
     def run(self, input_data: dict) -> dict:
@@ -713,50 +1192,47 @@ class MarketIntelligenceAgent:
     OUTPUT: dict matching the market_analysis schema exactly.
     """
 
+    _SCHEMA = compile_schema({
+        "market_analysis": {
+            "role_title": "{{role_title}}",
+            "demand_score": "<int 0-100>",
+            "competition_level": "<low|medium|high>",
+            "entry_barrier": "<low|medium|high>",
+            "market_trend": "<growing|stable|declining>",
+            "avg_salary_range_usd": "<e.g. 80k-120k>",
+            "required_experience_years": "<e.g. 0-2>",
+            "key_hiring_companies": ["<Company1>", "<Company2>", "<Company3>"],
+            "in_demand_skills": ["<skill1>", "<skill2>", "<skill3>"],
+            "market_saturation": "<low|medium|high>",
+            "job_availability": "<abundant|moderate|scarce>",
+            "adjacent_safer_roles": [
+                {
+                    "role": "<Role Name>",
+                    "reason": "<Why safer>",
+                    "demand_score": "<int 0-100>",
+                    "entry_barrier": "<low|medium|high>"
+                }
+            ],
+            "market_notes": "<Key insights about this role's market>",
+            "last_updated": "{{last_updated}}"
+        }
+    })
+
     def __init__(self):
         self.name = "MarketIntelligenceAgent"
 
-    def run(self, input_data: dict) -> dict:
-        target_role = input_data["target_role"]
-        today       = date.today().isoformat()
-
-        print_section(f"MARKET INTELLIGENCE — {target_role}")
-        print("  Generating market analysis via GPT...")
-
+    def _prompt(self, target_role: str, today: str) -> tuple:
         system = (
             "You are a senior labor market analyst with real-time industry data. "
             "Return ONLY valid JSON. No prose, no markdown fences."
         )
-        schema = {
-            "market_analysis": {
-                "role_title": target_role,
-                "demand_score": "<int 0-100>",
-                "competition_level": "<low|medium|high>",
-                "entry_barrier": "<low|medium|high>",
-                "market_trend": "<growing|stable|declining>",
-                "avg_salary_range_usd": "<e.g. 80k-120k>",
-                "required_experience_years": "<e.g. 0-2>",
-                "key_hiring_companies": ["<Company1>", "<Company2>", "<Company3>"],
-                "in_demand_skills": ["<skill1>", "<skill2>", "<skill3>"],
-                "market_saturation": "<low|medium|high>",
-                "job_availability": "<abundant|moderate|scarce>",
-                "adjacent_safer_roles": [
-                    {
-                        "role": "<Role Name>",
-                        "reason": "<Why safer>",
-                        "demand_score": "<int 0-100>",
-                        "entry_barrier": "<low|medium|high>"
-                    }
-                ],
-                "market_notes": "<Key insights about this role's market>",
-                "last_updated": today
-            }
-        }
         user = (
             f"Generate a complete, realistic market intelligence report for: {target_role}\n\n"
-            f"Fill in this exact JSON schema:\n{json.dumps(schema, indent=2)}"
+            f"Fill in this exact JSON schema:\n{self._SCHEMA.render(role_title=target_role, last_updated=today)}"
         )
-        raw    = call_llm(system, user, max_tokens=1500)
+        return system, user
+
+    def _finalize(self, raw: str, today: str) -> dict:
         result = extract_json(raw)
 
         # Guarantee last_updated is today (model might hallucinate old date)
@@ -765,11 +1241,38 @@ class MarketIntelligenceAgent:
         print("  ✓ Market analysis complete.")
         return result
 
+    def run(self, input_data: dict) -> dict:
+        target_role = input_data["target_role"]
+        today       = date.today().isoformat()
+
+        print_section(f"MARKET INTELLIGENCE — {target_role}")
+        print("  Generating market analysis via GPT...")
+
+        system, user = self._prompt(target_role, today)
+        raw = call_llm(system, user, max_tokens=1500, agent=self.name, op="run")
+        return self._finalize(raw, today)
+
+    async def arun(self, input_data: dict) -> dict:
+        """Async variant of run() for the API path."""
+        target_role = input_data["target_role"]
+        today       = date.today().isoformat()
+
+        print_section(f"MARKET INTELLIGENCE — {target_role}")
+        print("  Generating market analysis via GPT...")
+
+        system, user = self._prompt(target_role, today)
+        raw = await acall_llm(system, user, max_tokens=1500, agent=self.name, op="run")
+        return self._finalize(raw, today)
+
 
 # ═══════════════════════════════════════════════════════════════════
 #  AGENT 3 — RoadmapAgent
 # ═══════════════════════════════════════════════════════════════════
 
+class RoadmapGenerationError(RuntimeError):
+    """The model's roadmap is still malformed after the repair attempts."""
+
+
 class RoadmapAgent:
     """
     Generates a 5-month structured roadmap.
@@ -784,9 +1287,165 @@ class RoadmapAgent:
             Exactly 5 months × 4 actions each.
     """
 
+    _SCHEMA = compile_schema({
+        "steps": [
+            {
+                "month": 1,
+                "step_title": "<Month 1 focus title>",
+                "actions": [
+                    {"action_id": "action_1",  "week": 1, "action_title": "<Action title>", "status": "pending", "score": None},
+                    {"action_id": "action_2",  "week": 2, "action_title": "<Action title>", "status": "pending", "score": None},
+                    {"action_id": "action_3",  "week": 3, "action_title": "<Action title>", "status": "pending", "score": None},
+                    {"action_id": "action_4",  "week": 4, "action_title": "<Action title>", "status": "pending", "score": None},
+                ]
+            },
+            "... repeat for months 2, 3, 4, 5 with action_ids action_5..action_20"
+        ]
+    })
+
+    # Streamed roadmaps are only aborted when they are not a JSON object or run away;
+    # wrong month / action counts are cheaper to fix with a targeted repair call
+    _STREAM_SHAPE = StreamShape(root="object", arrays={"steps": (None, 7), "steps[].actions": (None, 6)})
+
     def __init__(self):
         self.name = "RoadmapAgent"
 
+    def _prompt(self, target_role: str, strengths: list, weaknesses: list, skills: list) -> tuple:
+        system = (
+            "You are an expert career roadmap architect. "
+            "Return ONLY valid JSON. No prose, no markdown fences. "
+            "STRICT REQUIREMENT: Exactly 5 steps (months), each with exactly 4 actions."
+        )
+
+        user = (
+            f"Target Role    : {target_role}\n"
+            f"Strengths      : {prompt_builder.items(self.name, 'strengths', strengths)}\n"
+            f"Weaknesses     : {prompt_builder.items(self.name, 'weaknesses', weaknesses)}\n"
+            f"Current Skills : {prompt_builder.items(self.name, 'skills', skills)}\n\n"
+            "Generate a realistic, progressive 5-month career preparation roadmap.\n"
+            "Each month should build on the previous. Action IDs must be:\n"
+            "  Month 1: action_1  to action_4\n"
+            "  Month 2: action_5  to action_8\n"
+            "  Month 3: action_9  to action_12\n"
+            "  Month 4: action_13 to action_16\n"
+            "  Month 5: action_17 to action_20\n\n"
+            f"Return this exact JSON structure:\n{self._SCHEMA.render()}"
+        )
+        return system, user
+
+    # ─────────────────────────────────────────────────
+    # VALIDATION + PARTIAL REPAIR
+    # ─────────────────────────────────────────────────
+
+    @staticmethod
+    def _clean_month(step: dict, month: int) -> Optional[dict]:
+        """A month with ids / weeks patched, or None if it has fewer than 4 usable actions."""
+        actions = [a for a in step.get("actions") or []
+                   if isinstance(a, dict) and str(a.get("action_title") or "").strip()]
+        if len(actions) < 4:
+            return None
+        step["month"] = month
+        step["step_title"] = str(step.get("step_title") or "").strip() or f"Month {month}"
+        step["actions"] = actions[:4]
+        for week_idx, action in enumerate(step["actions"], 1):
+            action["action_id"] = f"action_{(month - 1) * 4 + week_idx}"
+            action["week"]      = week_idx
+            action.setdefault("status", "pending")
+            action.setdefault("score", None)
+        return step
+
+    def _parse_months(self, raw: str, months: list) -> tuple:
+        """
+        Valid months in `raw` → ({month: step}, [months still missing]).
+        A step's own "month" is used when it is one of `months`, else its position.
+        """
+        try:
+            steps = extract_json(raw).get("steps", [])
+        except (ValueError, AttributeError):
+            steps = []
+        good = {}
+        for pos, step in enumerate(steps if isinstance(steps, list) else []):
+            if not isinstance(step, dict):
+                continue
+            month = step.get("month")
+            if month not in months or month in good:
+                month = months[pos] if pos < len(months) else None
+            if month is None or month in good:
+                continue
+            cleaned = self._clean_month(step, month)
+            if cleaned is not None:
+                good[month] = cleaned
+        return good, [m for m in months if m not in good]
+
+    def _repair_prompt(self, input_data: dict, good: dict, bad: list) -> tuple:
+        system = (
+            "You are an expert career roadmap architect. "
+            "Return ONLY valid JSON. No prose, no markdown fences. "
+            f"STRICT REQUIREMENT: Exactly {len(bad)} steps (months {', '.join(map(str, bad))}), "
+            "each with exactly 4 actions."
+        )
+        outline = "\n".join(f"  Month {m}: {good[m]['step_title']}" for m in sorted(good))
+        schema = compile_schema({"steps": [{
+            "month": bad[0],
+            "step_title": f"<Month {bad[0]} focus title>",
+            "actions": [{"week": w, "action_title": "<Action title>"} for w in range(1, 5)],
+        }, "... one entry per requested month"]})
+        user = (
+            f"Target Role    : {input_data['target_role']}\n"
+            f"Weaknesses     : {prompt_builder.items(self.name, 'weaknesses', input_data.get('weaknesses', []))}\n\n"
+            f"Existing months of this 5-month roadmap:\n{outline or '  (none)'}\n\n"
+            f"Write ONLY month(s) {', '.join(map(str, bad))}, fitting between the existing months.\n\n"
+            f"Return this exact JSON structure:\n{schema.render()}"
+        )
+        return system, user
+
+    def _assemble(self, good: dict, bad: list, target_role: str) -> dict:
+        if bad:
+            raise RoadmapGenerationError(f"RoadmapAgent: month(s) {bad} still malformed after "
+                                         f"{ROADMAP_REPAIR_ATTEMPTS} repair attempt(s)")
+        steps = [good[m] for m in sorted(good)]
+        print(f"  ✓ Roadmap generated ({len(steps)} months × 4 actions).")
+        return {"generated_for_role": target_role, "steps": steps}
+
+    def _finalize(self, raw: str, input_data: dict, first_month: int = 1,
+                  request: Optional[tuple] = None) -> dict:
+        """
+        Validate months first_month..5, re-requesting only the broken ones.
+        `request` is the (system, user, max_tokens, op) that produced `raw`: when
+        it needs repair its cached answer is dropped, so a retry asks again.
+        Repair calls never use the cache — a rejected repair must not come back.
+        """
+        good, bad = self._parse_months(raw, list(range(first_month, 6)))
+        if bad and request:
+            forget_llm(*request[:3], agent=self.name, op=request[3])
+        for _ in range(ROADMAP_REPAIR_ATTEMPTS):
+            if not bad:
+                break
+            print(f"  ⚠ Month(s) {bad} missing or malformed — requesting only those")
+            system, user = self._repair_prompt(input_data, good, bad)
+            fixed, bad = self._parse_months(
+                call_llm(system, user, max_tokens=500 * len(bad) + 100, agent=self.name, op="repair",
+                         use_cache=False), bad)
+            good.update(fixed)
+        return self._assemble(good, bad, input_data["target_role"])
+
+    async def _afinalize(self, raw: str, input_data: dict, first_month: int = 1,
+                         request: Optional[tuple] = None) -> dict:
+        """Async variant of _finalize()."""
+        good, bad = self._parse_months(raw, list(range(first_month, 6)))
+        if bad and request:
+            await aforget_llm(*request[:3], agent=self.name, op=request[3])
+        for _ in range(ROADMAP_REPAIR_ATTEMPTS):
+            if not bad:
+                break
+            print(f"  ⚠ Month(s) {bad} missing or malformed — requesting only those")
+            system, user = self._repair_prompt(input_data, good, bad)
+            fixed, bad = self._parse_months(
+                await acall_llm(system, user, max_tokens=500 * len(bad) + 100, agent=self.name, op="repair",
+                                use_cache=False), bad)
+            good.update(fixed)
+        return self._assemble(good, bad, input_data["target_role"])
+
     def run(self, input_data: dict) -> dict:
         target_role = input_data["target_role"]
         strengths   = input_data.get("strengths", [])
@@ -796,65 +1455,140 @@ class RoadmapAgent:
         print_section(f"ROADMAP GENERATION — {target_role}")
         print("  Building 5-month roadmap via GPT...")
 
+        system, user = self._prompt(target_role, strengths, weaknesses, skills)
+        raw = call_llm(system, user, max_tokens=2500, agent=self.name, op="run",
+                       shape=self._STREAM_SHAPE)
+        return self._finalize(raw, input_data, request=(system, user, 2500, "run"))
+
+    async def arun(self, input_data: dict, use_cache: bool = True) -> dict:
+        """Async variant of run() for the API path (`use_cache=False` forces a new roadmap)."""
+        target_role = input_data["target_role"]
+        strengths   = input_data.get("strengths", [])
+        weaknesses  = input_data.get("weaknesses", [])
+        skills      = input_data.get("skills", [])
+
+        print_section(f"ROADMAP GENERATION — {target_role}")
+        print("  Building 5-month roadmap via GPT...")
+
+        system, user = self._prompt(target_role, strengths, weaknesses, skills)
+        raw = await acall_llm(system, user, max_tokens=2500, agent=self.name, op="run",
+                              shape=self._STREAM_SHAPE, use_cache=use_cache)
+        return await self._afinalize(raw, input_data, request=(system, user, 2500, "run"))
+
+    # ─────────────────────────────────────────────────
+    # INCREMENTAL REGENERATION
+    # ─────────────────────────────────────────────────
+
+    def _remaining_prompt(self, target_role: str, strengths: list, weaknesses: list,
+                          skills: list, kept_steps: list) -> tuple:
+        first = len(kept_steps) + 1
         system = (
             "You are an expert career roadmap architect. "
             "Return ONLY valid JSON. No prose, no markdown fences. "
-            "STRICT REQUIREMENT: Exactly 5 steps (months), each with exactly 4 actions."
+            f"STRICT REQUIREMENT: Exactly {5 - first + 1} steps (months {first}-5), each with exactly 4 actions."
+        )
+        history = "\n".join(
+            f"  Month {step.get('month')} — {step.get('step_title', '')}: " + "; ".join(
+                f"{a.get('action_title', '')} ({a.get('status', 'pending')}"
+                + (f", {a['score']}/100)" if a.get("score") is not None else ")")
+                for a in step.get("actions", [])
+            )
+            for step in kept_steps
+        )
+        schema = compile_schema({
+            "steps": [{
+                "month": first,
+                "step_title": f"<Month {first} focus title>",
+                "actions": [{"action_id": f"action_{(first - 1) * 4 + w}", "week": w,
+                             "action_title": "<Action title>", "status": "pending", "score": None}
+                            for w in range(1, 5)],
+            }, "... repeat up to month 5 (action ids continue to action_20)"]
+        })
+        user = (
+            f"Target Role    : {target_role}\n"
+            f"Strengths      : {prompt_builder.items(self.name, 'strengths', strengths)}\n"
+            f"Weaknesses     : {prompt_builder.items(self.name, 'weaknesses', weaknesses)}\n"
+            f"Current Skills : {prompt_builder.items(self.name, 'skills', skills)}\n\n"
+            f"Months already in progress (keep as is):\n{history}\n\n"
+            f"Generate ONLY months {first} to 5 of this 5-month roadmap. Build on the months "
+            "above, revisit failed or low-scoring topics, and do not repeat passed actions.\n\n"
+            f"Return this exact JSON structure:\n{schema.render()}"
         )
+        return system, user
 
-        schema = {
-            "steps": [
-                {
-                    "month": 1,
-                    "step_title": "<Month 1 focus title>",
-                    "actions": [
-                        {"action_id": "action_1",  "week": 1, "action_title": "<Action title>", "status": "pending", "score": None},
-                        {"action_id": "action_2",  "week": 2, "action_title": "<Action title>", "status": "pending", "score": None},
-                        {"action_id": "action_3",  "week": 3, "action_title": "<Action title>", "status": "pending", "score": None},
-                        {"action_id": "action_4",  "week": 4, "action_title": "<Action title>", "status": "pending", "score": None},
-                    ]
-                },
-                "... repeat for months 2, 3, 4, 5 with action_ids action_5..action_20"
-            ]
-        }
+    async def arun_remaining(self, input_data: dict, kept_steps: list, use_cache: bool = True) -> dict:
+        """Regenerate only the months after `kept_steps` (months 1..k stay untouched)."""
+        target_role = input_data["target_role"]
+        first = len(kept_steps) + 1
+        print_section(f"ROADMAP REGENERATION — {target_role} (months {first}-5)")
 
+        system, user = self._remaining_prompt(
+            target_role, input_data.get("strengths", []), input_data.get("weaknesses", []),
+            input_data.get("skills", []), kept_steps,
+        )
+        months = 5 - first + 1
+        max_tokens = 500 * months + 100
+        raw = await acall_llm(system, user, max_tokens=max_tokens, agent=self.name, op="remaining",
+                              shape=StreamShape(root="object", arrays={"steps": (None, months + 2),
+                                                                       "steps[].actions": (None, 6)}),
+                              use_cache=use_cache)
+        result = await self._afinalize(raw, input_data, first_month=first,
+                                       request=(system, user, max_tokens, "remaining"))
+        return {"generated_for_role": target_role, "steps": list(kept_steps) + result["steps"]}
+
+    # ─────────────────────────────────────────────────
+    # TEMPLATE PERSONALIZATION
+    # ─────────────────────────────────────────────────
+
+    _PERSONALIZE_SCHEMA = compile_schema({
+        "changes": [{"action_id": "action_3", "action_title": "<New action title>"}]
+    })
+
+    def _personalize_prompt(self, steps: list, target_role: str, strengths: list,
+                            weaknesses: list, skills: list) -> tuple:
+        system = (
+            "You are an expert career roadmap architect. "
+            "Return ONLY valid JSON. No prose, no markdown fences."
+        )
+        outline = "\n".join(
+            f"  Month {step.get('month')} — {step.get('step_title', '')}: " +
+            "; ".join(f"{a.get('action_id')}: {a.get('action_title', '')}" for a in step.get("actions", []))
+            for step in steps
+        )
         user = (
             f"Target Role    : {target_role}\n"
-            f"Strengths      : {', '.join(strengths)}\n"
-            f"Weaknesses     : {', '.join(weaknesses)}\n"
-            f"Current Skills : {', '.join(skills)}\n\n"
-            "Generate a realistic, progressive 5-month career preparation roadmap.\n"
-            "Each month should build on the previous. Action IDs must be:\n"
-            "  Month 1: action_1  to action_4\n"
-            "  Month 2: action_5  to action_8\n"
-            "  Month 3: action_9  to action_12\n"
-            "  Month 4: action_13 to action_16\n"
-            "  Month 5: action_17 to action_20\n\n"
-            f"Return this exact JSON structure:\n{json.dumps(schema, indent=2)}"
+            f"Strengths      : {prompt_builder.items(self.name, 'strengths', strengths)}\n"
+            f"Weaknesses     : {prompt_builder.items(self.name, 'weaknesses', weaknesses)}\n"
+            f"Current Skills : {prompt_builder.items(self.name, 'skills', skills)}\n\n"
+            f"Base roadmap:\n{outline}\n\n"
+            "Adapt this roadmap to the candidate: rename at most 6 actions so it skips "
+            "what they already know and spends that time on their weaknesses. Keep the "
+            "monthly themes and the action ids. List only the actions you change.\n\n"
+            f"Return this exact JSON structure:\n{self._PERSONALIZE_SCHEMA.render()}"
         )
+        return system, user
 
-        raw    = call_llm(system, user, max_tokens=2500)
-        result = extract_json(raw)
-
-        # Validate and patch structure
-        steps = result.get("steps", [])
-        if len(steps) != 5:
-            raise ValueError(f"RoadmapAgent expected 5 steps, got {len(steps)}")
-
-        for month_idx, step in enumerate(steps, 1):
-            step["month"] = month_idx
-            actions = step.get("actions", [])
-            if len(actions) != 4:
-                raise ValueError(f"Month {month_idx} must have exactly 4 actions, got {len(actions)}")
-            for week_idx, action in enumerate(actions, 1):
-                base = (month_idx - 1) * 4 + week_idx
-                action["action_id"] = f"action_{base}"
-                action["week"]      = week_idx
-                action.setdefault("status", "pending")
-                action.setdefault("score", None)
-
-        print("  ✓ Roadmap generated (5 months × 4 actions).")
-        return {"generated_for_role": target_role, "steps": steps}
+    async def apersonalize(self, steps: list, input_data: dict) -> list:
+        """Small pass adapting a stored template's action titles to one candidate."""
+        target_role = input_data["target_role"]
+        system, user = self._personalize_prompt(
+            steps, target_role, input_data.get("strengths", []),
+            input_data.get("weaknesses", []), input_data.get("skills", []),
+        )
+        raw = await acall_llm(system, user, max_tokens=600, agent=self.name, op="personalize")
+        changes = {
+            c.get("action_id"): " ".join(str(c.get("action_title", "")).split())
+            for c in extract_json(raw).get("changes", []) if isinstance(c, dict)
+        }
+        changed = 0
+        for step in steps:
+            for action in step.get("actions", []):
+                title = changes.get(action.get("action_id"))
+                if title and changed < 6:
+                    action["action_title"] = title
+                    changed += 1
+        print(f"  ✓ Roadmap template personalized ({changed} actions adapted).")
+        return steps
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -882,10 +1616,16 @@ class ActionAssessmentAgent:
     Note: Q&A ephemeral — not stored.
     """
 
+    _EVALUATE_SCHEMA = compile_schema({
+        "action_score": "<int 0-100>",
+        "evaluation_summary": "<string, 2-3 sentences>"
+    })
+
     def __init__(self):
         self.name = "ActionAssessmentAgent"
 
-    def _generate_questions(self, action_title: str, target_role: str) -> list[str]:
+    def _questions_prompt(self, action_title: str, target_role: str,
+                          avoid: Optional[list] = None) -> tuple:
         system = (
             "You are an expert technical interviewer. "
             "Generate exactly 10 specific questions to evaluate whether a candidate "
@@ -895,15 +1635,33 @@ class ActionAssessmentAgent:
         user = (
             f"Career Goal   : {target_role}\n"
             f"Learning Action: {action_title}\n\n"
+            f"{_avoid_block(avoid)}"
             "Return: [\"question1\", ..., \"question10\"]"
         )
-        raw   = call_llm(system, user, max_tokens=700)
+        return system, user
+
+    @staticmethod
+    def _parse_questions(raw: str) -> list[str]:
         match = re.search(r"\[.*\]", raw, re.DOTALL)
         if match:
             return json.loads(match.group())
         lines = [l.strip().lstrip("0123456789.)- ") for l in raw.splitlines() if l.strip()]
         return lines[:10]
 
+    def _generate_questions(self, action_title: str, target_role: str) -> list[str]:
+        system, user = self._questions_prompt(action_title, target_role)
+        raw = call_llm(system, user, max_tokens=700, agent=self.name, op="questions")
+        return self._parse_questions(raw)
+
+    async def _agenerate_questions(self, action_title: str, target_role: str,
+                                   avoid: Optional[list] = None,
+                                   priority: Optional[int] = None) -> list[str]:
+        """Async variant of _generate_questions(); `avoid` lists questions not to repeat."""
+        system, user = self._questions_prompt(action_title, target_role, avoid)
+        raw = await acall_llm(system, user, max_tokens=700, agent=self.name, op="questions",
+                              priority=priority)
+        return self._parse_questions(raw)
+
     def _collect_answers(self, questions: list[str]) -> list[dict]:
         qa = []
         print("  Answer each question. Press Enter to submit.\n")
@@ -914,24 +1672,44 @@ class ActionAssessmentAgent:
             print()
         return qa  # ephemeral
 
-    def _evaluate(self, action_title: str, target_role: str, qa_pairs: list[dict]) -> dict:
+    def _evaluate_prompt(self, action_title: str, target_role: str, qa_pairs: list[dict],
+                         dropped: int = 0) -> tuple:
         system = (
             "You are a strict but fair career skills evaluator. "
             "Evaluate the candidate's mastery of the given action based on their answers. "
             "Return ONLY valid JSON."
         )
-        qa_text = "\n".join(f"Q: {p['question']}\nA: {p['answer']}" for p in qa_pairs)
-        schema  = json.dumps({
-            "action_score": "<int 0-100>",
-            "evaluation_summary": "<string, 2-3 sentences>"
-        }, indent=2)
+        qa_text = prompt_builder.qa(self.name, "qa", qa_pairs)
         user = (
             f"Career Goal   : {target_role}\n"
             f"Assessed Action: {action_title}\n\n"
             f"Q&A:\n{qa_text}\n\n"
-            f"Return this JSON:\n{schema}"
+            f"{_dropped_block(dropped)}"
+            f"Return this JSON:\n{self._EVALUATE_SCHEMA.render()}"
         )
-        raw = call_llm(system, user, max_tokens=600)
+        return system, user
+
+    @staticmethod
+    def _local_result(screen) -> dict:
+        """Deterministic result for a submission with no real answers."""
+        print(f"  ✓ Scored locally (no answers given: {screen.reasons}).")
+        return {"action_score": screen.local_score, "evaluation_summary": screen.summary()}
+
+    def _evaluate(self, action_title: str, target_role: str, qa_pairs: list[dict]) -> dict:
+        screen = answer_screen.screen(qa_pairs, context=f"{action_title} {target_role}")
+        if screen.short_circuit:
+            return self._local_result(screen)
+        system, user = self._evaluate_prompt(action_title, target_role, screen.kept, screen.dropped)
+        raw = call_llm(system, user, max_tokens=600, agent=self.name, op="evaluate")
+        return extract_json(raw)
+
+    async def _aevaluate(self, action_title: str, target_role: str, qa_pairs: list[dict]) -> dict:
+        """Async variant of _evaluate()."""
+        screen = answer_screen.screen(qa_pairs, context=f"{action_title} {target_role}")
+        if screen.short_circuit:
+            return self._local_result(screen)
+        system, user = self._evaluate_prompt(action_title, target_role, screen.kept, screen.dropped)
+        raw = await acall_llm(system, user, max_tokens=600, agent=self.name, op="evaluate")
         return extract_json(raw)
 
     def run(self, input_data: dict) -> dict:
@@ -992,8 +1770,20 @@ class ReroutingAgent:
         self.name = "ReroutingAgent"
 
     def run(self, input_data: dict) -> dict:
+        suggested_roles = []
+        if input_data["confidence_score"] < 40:
+            suggested_roles = self._get_safer_roles(input_data["current_target_role"])
+        return self._decide(input_data, suggested_roles)
+
+    async def arun(self, input_data: dict) -> dict:
+        """Async variant of run() — only the safer-roles lookup touches the LLM."""
+        suggested_roles = []
+        if input_data["confidence_score"] < 40:
+            suggested_roles = await self._aget_safer_roles(input_data["current_target_role"])
+        return self._decide(input_data, suggested_roles)
+
+    def _decide(self, input_data: dict, safer_roles: list[str]) -> dict:
         confidence   = input_data["confidence_score"]
-        current_role = input_data["current_target_role"]
         prev_role    = input_data.get("previous_target_role")
         completion   = input_data.get("roadmap_completion_percentage", 0.0)
 
@@ -1009,7 +1799,7 @@ class ReroutingAgent:
                 f"Confidence score ({confidence}) is below the 40-point threshold. "
                 "Consider a safer adjacent role to rebuild momentum."
             )
-            suggested_roles = self._get_safer_roles(current_role)
+            suggested_roles = safer_roles
 
         # Logic Rule 2: High confidence or roadmap complete → allow return to previous role
         if confidence >= 80 or completion >= 100.0:
@@ -1032,15 +1822,57 @@ class ReroutingAgent:
             "reason":                        reason
         }
 
-    def _get_safer_roles(self, current_role: str) -> list[str]:
-        """Ask GPT for 3 safer adjacent roles when confidence is low."""
+    def _safer_roles_prompt(self, current_role: str) -> tuple:
         system = "You are a career advisor. Return ONLY a JSON array of 3 role name strings."
         user   = (
             f"The candidate is struggling with: {current_role}\n"
             "Suggest 3 safer, adjacent roles with lower entry barriers. "
             "Return: [\"role1\", \"role2\", \"role3\"]"
         )
-        raw   = call_llm(system, user, max_tokens=200)
+        return system, user
+
+    # The rerouting UI shows this many safer-role options
+    _SAFER_ROLE_COUNT = 3
+
+    def _get_safer_roles(self, current_role: str) -> list[str]:
+        """
+        3 safer adjacent roles when confidence is low: from the role adjacency
+        graph when it knows enough neighbours, else asked of GPT (and learned),
+        keeping whatever the graph already had first.
+        """
+        local = role_graph.safer_roles(current_role, k=self._SAFER_ROLE_COUNT)
+        if len(local) >= self._SAFER_ROLE_COUNT:
+            return local
+        system, user = self._safer_roles_prompt(current_role)
+        raw = call_llm(system, user, max_tokens=200, agent=self.name, op="safer_roles")
+        roles = self._parse_safer_roles(raw, current_role)
+        role_graph.observe_llm(current_role, roles)
+        return self._merge_safer_roles(local, roles)
+
+    async def _aget_safer_roles(self, current_role: str) -> list[str]:
+        """Async variant of _get_safer_roles()."""
+        local = role_graph.safer_roles(current_role, k=self._SAFER_ROLE_COUNT)
+        if len(local) >= self._SAFER_ROLE_COUNT:
+            return local
+        system, user = self._safer_roles_prompt(current_role)
+        raw = await acall_llm(system, user, max_tokens=200, agent=self.name, op="safer_roles")
+        roles = self._parse_safer_roles(raw, current_role)
+        role_graph.observe_llm(current_role, roles)
+        return self._merge_safer_roles(local, roles)
+
+    @classmethod
+    def _merge_safer_roles(cls, local: list, roles: list) -> list[str]:
+        """Graph roles first, topped up with GPT's, deduped by canonical role."""
+        merged, seen = [], set()
+        for role in list(local) + [r for r in roles if isinstance(r, str) and r.strip()]:
+            role_id = role_graph.canon.role_id(role)
+            if role_id not in seen:
+                seen.add(role_id)
+                merged.append(role)
+        return merged[:cls._SAFER_ROLE_COUNT]
+
+    @staticmethod
+    def _parse_safer_roles(raw: str, current_role: str) -> list[str]:
         match = re.search(r"\[.*\]", raw, re.DOTALL)
         if match:
             return json.loads(match.group())
@@ -1065,19 +1897,55 @@ class FeedbackAgent:
     OUTPUT: { feedback_analysis: { ... } } — exact schema as specified.
     """
 
+    _SCHEMA = compile_schema({
+        "feedback_analysis": {
+            "overall_progress_rating": "<Excellent|Good|Fair|Needs Improvement>",
+            "progress_percentage": "{{progress_percentage}}",
+            "velocity_assessment": "<string: pace of progress>",
+            "confidence_adjustment": "<float: suggested adjustment e.g. 0.05>",
+            "updated_confidence_score": "<float: new confidence e.g. 0.75>",
+            "risk_adjustment": "<string: risk assessment change>",
+            "updated_deviation_risk": "<low|medium|high>",
+            "strengths_observed": ["<strength1>", "<strength2>"],
+            "areas_of_concern": ["<concern1>", "<concern2>"],
+            "learning_insights": [
+                {
+                    "insight": "<key learning insight>",
+                    "evidence": "<what evidence supports this>",
+                    "recommendation": "<what to do about it>"
+                }
+            ],
+            "action_effectiveness": [
+                {
+                    "action_id": "action_1",
+                    "effectiveness": "<high|medium|low>",
+                    "time_efficiency": "<high|medium|low>",
+                    "impact_on_goal": "<high|medium|low>",
+                    "lessons_learned": ["<lesson1>"]
+                }
+            ],
+            "motivation_level": "<high|medium|low>",
+            "recommended_adjustments": [
+                {
+                    "adjustment_type": "<pacing|focus|skills|mindset>",
+                    "reason": "<why this adjustment>",
+                    "specific_change": "<what exactly to change>"
+                }
+            ],
+            "next_checkpoint_date": "{{next_checkpoint_date}}",
+            "encouragement_message": "<personalised motivational message>"
+        }
+    })
+
     def __init__(self):
         self.name = "FeedbackAgent"
 
-    def run(self, input_data: dict) -> dict:
+    def _prompt(self, input_data: dict, next_date: str) -> tuple:
         target_role  = input_data["target_role"]
         confidence   = input_data["confidence_score"]
         completed    = input_data["completed_actions_count"]
         failed       = input_data["failed_actions_count"]
         progress_pct = input_data["roadmap_progress_percentage"]
-        next_date    = (date.today() + timedelta(days=30)).isoformat()
-
-        print_section("FEEDBACK ANALYSIS")
-        print("  Generating feedback report via GPT...")
 
         system = (
             "You are an expert AI career coach. "
@@ -1085,46 +1953,6 @@ class FeedbackAgent:
             "Return ONLY valid JSON matching the exact schema provided."
         )
 
-        schema = {
-            "feedback_analysis": {
-                "overall_progress_rating": "<Excellent|Good|Fair|Needs Improvement>",
-                "progress_percentage": progress_pct,
-                "velocity_assessment": "<string: pace of progress>",
-                "confidence_adjustment": "<float: suggested adjustment e.g. 0.05>",
-                "updated_confidence_score": "<float: new confidence e.g. 0.75>",
-                "risk_adjustment": "<string: risk assessment change>",
-                "updated_deviation_risk": "<low|medium|high>",
-                "strengths_observed": ["<strength1>", "<strength2>"],
-                "areas_of_concern": ["<concern1>", "<concern2>"],
-                "learning_insights": [
-                    {
-                        "insight": "<key learning insight>",
-                        "evidence": "<what evidence supports this>",
-                        "recommendation": "<what to do about it>"
-                    }
-                ],
-                "action_effectiveness": [
-                    {
-                        "action_id": "action_1",
-                        "effectiveness": "<high|medium|low>",
-                        "time_efficiency": "<high|medium|low>",
-                        "impact_on_goal": "<high|medium|low>",
-                        "lessons_learned": ["<lesson1>"]
-                    }
-                ],
-                "motivation_level": "<high|medium|low>",
-                "recommended_adjustments": [
-                    {
-                        "adjustment_type": "<pacing|focus|skills|mindset>",
-                        "reason": "<why this adjustment>",
-                        "specific_change": "<what exactly to change>"
-                    }
-                ],
-                "next_checkpoint_date": next_date,
-                "encouragement_message": "<personalised motivational message>"
-            }
-        }
-
         user = (
             f"Career Navigator Progress Report\n"
             f"  Target Role           : {target_role}\n"
@@ -1132,10 +1960,12 @@ class FeedbackAgent:
             f"  Completed Actions     : {completed}\n"
             f"  Failed Actions        : {failed}\n"
             f"  Roadmap Completion    : {progress_pct:.1f}%\n\n"
-            f"Fill in this exact JSON schema:\n{json.dumps(schema, indent=2)}"
+            f"Fill in this exact JSON schema:\n"
+            f"{self._SCHEMA.render(progress_percentage=progress_pct, next_checkpoint_date=next_date)}"
         )
+        return system, user
 
-        raw    = call_llm(system, user, max_tokens=2000)
+    def _finalize(self, raw: str, next_date: str) -> dict:
         result = extract_json(raw)
 
         # Ensure next_checkpoint_date is always correct
@@ -1144,6 +1974,28 @@ class FeedbackAgent:
         print("  ✓ Feedback report generated.")
         return result
 
+    def run(self, input_data: dict) -> dict:
+        next_date = (date.today() + timedelta(days=30)).isoformat()
+
+        print_section("FEEDBACK ANALYSIS")
+        print("  Generating feedback report via GPT...")
+
+        system, user = self._prompt(input_data, next_date)
+        raw = call_llm(system, user, max_tokens=2000, agent=self.name, op="run")
+        return self._finalize(raw, next_date)
+
+    async def arun(self, input_data: dict, use_cache: bool = True) -> dict:
+        """Async variant of run() for the API path (`use_cache=False` forces a new report)."""
+        next_date = (date.today() + timedelta(days=30)).isoformat()
+
+        print_section("FEEDBACK ANALYSIS")
+        print("  Generating feedback report via GPT...")
+
+        system, user = self._prompt(input_data, next_date)
+        raw = await acall_llm(system, user, max_tokens=2000, agent=self.name, op="run",
+                              use_cache=use_cache)
+        return self._finalize(raw, next_date)
+
 
 # ═══════════════════════════════════════════════════════════════════
 #  ORCHESTRATOR
@@ -1236,18 +2088,29 @@ class Orchestrator:
         print(f"\n  ⟳ Switching role: {current} → {new_role}")
         print(f"  Previous role saved: {current}")
 
-        # Regenerate market analysis for new role
-        market_result = self.market_agent.run({"target_role": new_role})
-        self.user_state["market_analysis"] = market_result.get("market_analysis", {})
+        # Regenerate market analysis and roadmap for the new role concurrently
+        profile = self.user_state["profile"]
+        result = (
+            AgentGraph("role_switch")
+            .add("market",  lambda _: self.market_agent.run({"target_role": new_role}))
+            .add("roadmap", lambda _: self.roadmap_agent.run({
+                "target_role": new_role,
+                "strengths":   profile["strengths"],
+                "weaknesses":  profile["weaknesses"],
+                "skills":      profile["skills"]
+            }))
+            .run()
+        )
+
+        if not result.ok("roadmap"):
+            raise result.error("roadmap")
+        self.user_state["roadmap"] = result.value("roadmap")
 
-        # Regenerate roadmap for new role
-        roadmap_result = self.roadmap_agent.run({
-            "target_role": new_role,
-            "strengths":   self.user_state["profile"]["strengths"],
-            "weaknesses":  self.user_state["profile"]["weaknesses"],
-            "skills":      self.user_state["profile"]["skills"]
-        })
-        self.user_state["roadmap"] = roadmap_result
+        if result.ok("market"):
+            self.user_state["market_analysis"] = result.value("market").get("market_analysis", {})
+        else:
+            print(f"  ⚠ Market analysis failed for {new_role}: {result.error('market')}")
+            self.user_state["market_analysis"] = {}
 
         # Reset analytics
         self.user_state["analytics"]["completed_actions_count"] = 0
@@ -1,12 +1,17 @@
-from groq import Groq
+import sys
+from pathlib import Path
+
+# Allow running this file directly (python backend/agents/hands_on_agent.py)
+PROJECT_ROOT = str(Path(__file__).resolve().parents[2])
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+# Shared call path: pooled Groq clients, model routing, rate governor, telemetry
+from backend.agents.agentic_career_navigator import chat_llm
+from backend.core.http_clients import client_registry
 
 class HandsOnAgent:
     def __init__(self):
-        # Use the working pattern
-        self.client = Groq(
-            api_key="XXX"
-        )
-
         # This is our "memory"
         self.conversation_history = [
             {
@@ -28,14 +33,8 @@ class HandsOnAgent:
         ]
 
     def ask_gpt(self):
-        completion = self.client.chat.completions.create(
-            model="openai/gpt-oss-120b",
-            messages=self.conversation_history,
-            max_completion_tokens=1500,
-            stream=False
-        )
-
-        return completion.choices[0].message.content
+        return chat_llm(self.conversation_history, max_tokens=1500,
+                        agent="HandsOnAgent", op="chat")
 
     def start_session(self):
         target_role = input("Enter your target role: ")
@@ -88,4 +87,7 @@ class HandsOnAgent:
 
 if __name__ == "__main__":
     agent = HandsOnAgent()
-    agent.start_session()
+    try:
+        agent.start_session()
+    finally:
+        client_registry.close()
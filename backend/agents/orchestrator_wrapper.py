@@ -4,23 +4,30 @@ orchestrator_wrapper.py
 Wraps the existing CLI agents for use by FastAPI endpoints.
 
 STRICT RULES:
-  - No agent logic is duplicated here
-  - No business logic lives here
+  - No agent logic is duplicated here: prompts and evaluation stay in the agents
   - All LLM calls remain server-side inside the original agents
-  - This file is ONLY a translation layer between HTTP and agents
-  - Questions are stored in-memory per session (not in MongoDB)
+  - This file owns the request workflow around the agents: persistence,
+    the background roadmap stage, question banks / served-question copies,
+    feedback reuse and bulk grading
+  - Readiness questions live in the in-memory session cache; served action
+    questions also get a stored copy in MongoDB so grading survives a restart
+    or another worker (answers are never stored)
+  - Every public function is async: LLM calls are awaited and blocking
+    MongoDB calls run in a worker thread, so the event loop never stalls
 """
 
 import os
 import sys
 import json
-from datetime import datetime, timedelta
+import asyncio
+import hashlib
+from datetime import date, datetime, timedelta
 from typing import Any, Dict, List, Optional
 
 # ── Ensure project imports resolve ────────────────────────────────
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-# ── Import original agents (unmodified) ───────────────────────────
+# ── Import the agents ─────────────────────────────────────────────
 from backend.agents.agentic_career_navigator import (
     ReadinessAssessmentAgent,
     MarketIntelligenceAgent,
@@ -28,10 +35,23 @@ from backend.agents.agentic_career_navigator import (
     ActionAssessmentAgent,
     ReroutingAgent,
     FeedbackAgent,
-    call_llm,
+    acall_llm,
+    achat_llm,
     extract_json,
+    llm_governor,
+    llm_telemetry,
+    prompt_builder,
 )
 from backend.database.db import db
+from backend.core.llm_governor import BACKGROUND, LLMThrottledError
+from backend.core.singleflight import SingleFlight, normalize_key
+from backend.core.background_jobs import BackgroundJobs
+from backend.core.agent_graph import AgentGraph
+from backend.core.role_canon import role_canon
+from backend.core.question_bank import QuestionBank, normalize_title
+from backend.core.prefetch import Prefetcher
+from backend.core.roadmap_templates import RoadmapTemplates
+from backend.core.role_graph import role_graph
 
 # ── In-memory session cache ───────────────────────────────────────
 # Stores ephemeral Q&A data (questions + temp conversation state).
@@ -46,6 +66,30 @@ _action_agent     = ActionAssessmentAgent()
 _rerouting_agent  = ReroutingAgent()
 _feedback_agent   = FeedbackAgent()
 
+# ── Coalesces identical concurrent agent runs (e.g. cohort onboarding) ──
+_agent_flight = SingleFlight("agents")
+
+# ── Persistent question pools (readiness by role, actions by title) ──
+question_bank = QuestionBank.from_env(store=db)
+
+# ── Stored roadmaps per canonical role + profile signature (roles collection) ──
+roadmap_templates = RoadmapTemplates.from_env(store=db)
+
+# ── Warms the bank for a user's next pending actions (skipped when the governor is busy) ──
+question_prefetch = Prefetcher.from_env(can_run=llm_governor.has_capacity)
+
+# ── Background roadmap generation (one job per user) ──────────────
+_roadmap_jobs = BackgroundJobs("roadmap")
+
+# A "generating" roadmap with no live job older than this is reported as failed
+# (the worker that owned it restarted). Default estimate until telemetry has samples.
+ROADMAP_STAGE_TIMEOUT_S = float(os.getenv("ROADMAP_STAGE_TIMEOUT_S", "600"))
+ROADMAP_DEFAULT_ESTIMATE_S = 45.0
+
+# Market analysis is shared per role in the `roles` collection; user documents
+# only hold a reference. Entries older than this are regenerated on next use.
+ROLE_MARKET_TTL_S = float(os.getenv("ROLE_MARKET_TTL_S", str(24 * 3600)))
+
 
 # ═══════════════════════════════════════════════════════════════════
 #  HELPERS
@@ -55,14 +99,87 @@ def _now() -> str:
     return datetime.utcnow().isoformat()
 
 
-def _get_or_404(user_id: str) -> dict:
+def _elapsed_since(iso_ts: Optional[str]) -> float:
+    if not iso_ts:
+        return 0.0
+    try:
+        return max(0.0, (datetime.utcnow() - datetime.fromisoformat(iso_ts)).total_seconds())
+    except ValueError:
+        return 0.0
+
+
+async def _get_or_404(user_id: str) -> dict:
     """Fetch user document from MongoDB or raise ValueError."""
-    user = db.get_user(user_id)
+    user = await asyncio.to_thread(db.get_user, user_id)
     if not user:
         raise ValueError(f"User {user_id} not found")
     return user
 
 
+async def _patch(user_id: str, patch: dict) -> bool:
+    """Non-blocking db.patch_user (pymongo is synchronous)."""
+    return await asyncio.to_thread(db.patch_user, user_id, patch)
+
+
+async def _coalesced_run(agent, input_data: dict) -> dict:
+    """
+    Run agent.arun(input_data), sharing one in-flight run between concurrent
+    callers whose input is identical after normalization (case/whitespace).
+    """
+    key = normalize_key(agent.name, input_data)
+    return await _agent_flight.do(key, lambda: agent.arun(input_data))
+
+
+def _canonical_role(role: Optional[str]) -> Optional[str]:
+    """Free-text role → canonical display name (sentinels and empty values pass through)."""
+    if not role or not role.strip() or (role.startswith("__") and role.endswith("__")):
+        return role
+    canon = role_canon.canonicalize(role)
+    if canon.name != role.strip():
+        print(f"[roles] '{role}' → '{canon.name}' ({canon.matched_by})")
+    return canon.name
+
+
+def _role_key(role: str) -> str:
+    """Key of a role in the shared `roles` collection (canonical role_id)."""
+    return role_canon.role_id(role or "")
+
+
+def _market_ref(role: str) -> dict:
+    """What a user document stores instead of its own copy of the market analysis."""
+    return {"role_key": _role_key(role), "role": role, "linked_at": _now()}
+
+
+async def _role_market(role: str) -> dict:
+    """
+    Shared market analysis for `role`: one indexed read while the roles entry is
+    fresh, otherwise one (coalesced) MarketIntelligenceAgent run stored for
+    everyone. A stale entry is still served if regeneration fails.
+    """
+    key = _role_key(role)
+    doc = await asyncio.to_thread(db.get_role, key) or {}
+    cached = doc.get("market_analysis") or {}
+    if cached and doc.get("market_updated_at") and \
+            _elapsed_since(doc["market_updated_at"]) < ROLE_MARKET_TTL_S:
+        return cached
+
+    try:
+        result = await _coalesced_run(_market_agent, {"target_role": role})
+    except Exception as e:
+        if cached:
+            print(f"[market] regeneration for '{key}' failed ({e}) — serving stale entry")
+            return cached
+        raise
+    market = result.get("market_analysis", {})
+    role_graph.observe_market(role, market)
+    await asyncio.to_thread(db.upsert_role, key, {
+        "display_role": role,
+        "market_analysis": market,
+        "market_updated_at": _now(),
+    })
+    return market
+
+
 def _roadmap_completion(user: dict) -> float:
     steps = user.get("active_roadmap", {}).get("steps", [])
     total = sum(len(s.get("actions", [])) for s in steps)
@@ -74,6 +191,29 @@ def _roadmap_completion(user: dict) -> float:
     return (done / total * 100.0) if total else 0.0
 
 
+def _next_pending_actions(steps: List[dict], after: Optional[str] = None) -> List[dict]:
+    """Pending actions in roadmap order, starting after action `after` (if given)."""
+    ordered = [a for s in steps for a in s.get("actions", [])]
+    if after is not None:
+        ids = [a.get("action_id") for a in ordered]
+        ordered = ordered[ids.index(after) + 1:] if after in ids else ordered
+    return [a for a in ordered if a.get("status", "pending") == "pending"]
+
+
+def _prefetch_action_questions(user_id: str, steps: List[dict], role: str,
+                               after: Optional[str] = None) -> None:
+    """Warm the question bank for the user's next pending actions in the background."""
+    items = []
+    for action in _next_pending_actions(steps, after)[:question_prefetch.ahead]:
+        title = action.get("action_title", "")
+        warm = (lambda t=title: question_bank.awarm(
+            "action", normalize_title(t), 10,
+            lambda avoid: _action_agent._agenerate_questions(t, role, avoid=avoid, priority=BACKGROUND),
+        ))
+        items.append((action.get("action_id", title), warm))
+    question_prefetch.schedule(user_id, items)
+
+
 def _update_confidence(user: dict, delta: int) -> int:
     """Apply delta to confidence, clamp to [0, 100]. Returns new score."""
     current = user.get("confidence_score", 0)
@@ -196,8 +336,10 @@ def _build_user_document(user_id: str, email: str, target_role: str, data: dict)
             "system_events": [],
         },
         "confidence_score": 0,
-        "market_analysis": {},
+        "market_analysis": {},          # legacy per-user copy; see market_ref
+        "market_ref": {},               # → roles collection entry (role_key)
         "feedback_analysis": {},
+        "feedback_meta": {},            # fingerprint of the inputs feedback_analysis was built from
     }
 
 
@@ -205,7 +347,7 @@ def _build_user_document(user_id: str, email: str, target_role: str, data: dict)
 #  1. ONBOARDING
 # ═══════════════════════════════════════════════════════════════════
 
-def onboard_user(data: dict) -> dict:
+async def onboard_user(data: dict) -> dict:
     """
     Create a new user document in MongoDB with full schema.
     Then immediately trigger market intelligence generation.
@@ -214,13 +356,16 @@ def onboard_user(data: dict) -> dict:
     CRITICAL: Never allow sentinel values (__email_check__) to be saved to database!
     """
     import hashlib, time
-    
+
+    # Map free-text roles ("ML Eng.") to the canonical name every role-scoped cache uses
+    data = {**data, "target_role": _canonical_role(data.get("target_role"))}
+
     # Reject sentinel as real target_role
     if data.get("target_role") == "__email_check__":
         # This is an email check, not an onboarding
         normalized_email = data.get("email", "").lower().strip()
         print(f"[onboard] Email check for: {normalized_email}")
-        existing = db.find_by_email(normalized_email)
+        existing = await asyncio.to_thread(db.find_by_email, normalized_email)
         if existing:
             # Return existing user immediately - no DB modifications
             print(f"[onboard] Found existing user: {existing['user_id']}")
@@ -241,7 +386,7 @@ def onboard_user(data: dict) -> dict:
             print(f"[onboard] Built user doc for {user_id}")
             
             # Save to database
-            save_result = db.upsert_user(user_id, user_doc)
+            save_result = await asyncio.to_thread(db.upsert_user, user_id, user_doc)
             print(f"[onboard] db.upsert_user returned: {save_result}")
             
             if not save_result:
@@ -270,7 +415,7 @@ def onboard_user(data: dict) -> dict:
     user_doc = _build_user_document(user_id, normalized_email, target_role, data)
 
     # Check if email already exists (use normalized email for lookup)
-    existing = db.find_by_email(normalized_email)
+    existing = await asyncio.to_thread(db.find_by_email, normalized_email)
     if existing:
         print(f"[onboard] Found existing user for {normalized_email}")
         print(f"[onboard] Using existing user_id: {existing['user_id']}")
@@ -318,7 +463,7 @@ def onboard_user(data: dict) -> dict:
             "current_target_role": target_role,
             "role_history": existing.get("career_state", {}).get("role_history", []),
         }
-        db.patch_user(existing["user_id"], {
+        await _patch(existing["user_id"], {
             "profile": updated_profile,
             "career_state": updated_career_state,
             "last_updated": _now(),
@@ -328,11 +473,10 @@ def onboard_user(data: dict) -> dict:
         if target_role:
             print(f"[onboard] Regenerating market intelligence for {target_role}...")
             try:
-                market_result = _market_agent.run({"target_role": target_role})
-                market_analysis = market_result.get("market_analysis", {})
-                print(f"[onboard] Generated market analysis with role_title: {market_analysis.get('role_title')}")
-                # Fully replace market_analysis (not merge)
-                db.patch_user(existing["user_id"], {"market_analysis": market_analysis})
+                market_analysis = await _role_market(target_role)
+                print(f"[onboard] Market analysis ready with role_title: {market_analysis.get('role_title')}")
+                # Reference the shared role entry; drop any embedded copy
+                await _patch(existing["user_id"], {"market_ref": _market_ref(target_role), "market_analysis": {}})
                 print(f"[onboard] Market intelligence updated successfully")
             except Exception as e:
                 print(f"[onboard] market intel regeneration failed: {e}")
@@ -345,17 +489,16 @@ def onboard_user(data: dict) -> dict:
         existing["profile"] = updated_profile
         return {"user_id": existing["user_id"], "profile": updated_profile, "exists": True}
 
-    db.upsert_user(user_id, user_doc)
+    await asyncio.to_thread(db.upsert_user, user_id, user_doc)
     print(f"[onboard] Created new user: {user_id}")
 
     # Trigger market intelligence immediately (only if target_role was provided)
     if target_role:
         print(f"[onboard] Generating initial market intelligence for {target_role}...")
         try:
-            market_result = _market_agent.run({"target_role": target_role})
-            user_doc["market_analysis"] = market_result.get("market_analysis", {})
-            print(f"[onboard] Generated market analysis with role_title: {user_doc['market_analysis'].get('role_title')}")
-            db.patch_user(user_id, {"market_analysis": user_doc["market_analysis"]})
+            market_analysis = await _role_market(target_role)
+            print(f"[onboard] Market analysis ready with role_title: {market_analysis.get('role_title')}")
+            await _patch(user_id, {"market_ref": _market_ref(target_role)})
             print(f"[onboard] Market intelligence saved successfully")
         except Exception as e:
             print(f"[onboard] market intel failed: {e}")
@@ -371,20 +514,26 @@ def onboard_user(data: dict) -> dict:
 #  2. READINESS ASSESSMENT
 # ═══════════════════════════════════════════════════════════════════
 
-def readiness_start(user_id: str) -> List[str]:
+async def readiness_start(user_id: str) -> List[str]:
     """
-    Generate 10 readiness questions via the existing agent.
-    Questions are cached in memory only — NOT stored in MongoDB.
+    Serve 10 readiness questions from the role's question bank; the existing
+    agent generates only when the pool is thin or stale.
+    The served set is cached in memory only — NOT stored on the user.
     Returns the question list.
     """
-    user = _get_or_404(user_id)
+    user = await _get_or_404(user_id)
     profile = user["profile"]
-
-    # Use agent's internal question generator (re-exposed via wrapper)
-    questions = _readiness_agent._generate_questions(
-        target_role=profile["target_role"],
-        skills=profile.get("skills", []),
-        strengths=profile.get("strengths", []),
+    role = profile["target_role"]
+
+    # Use agent's internal question generator (re-exposed via wrapper) for top-ups
+    questions = await question_bank.aget(
+        "readiness", _role_key(role), 10,
+        lambda avoid: _readiness_agent._agenerate_questions(
+            target_role=role,
+            skills=profile.get("skills", []),
+            strengths=profile.get("strengths", []),
+            avoid=avoid,
+        ),
     )
 
     # Cache in memory only (ephemeral)
@@ -394,13 +543,13 @@ def readiness_start(user_id: str) -> List[str]:
     return questions
 
 
-def readiness_evaluate(user_id: str, answers: List[str]) -> dict:
+async def readiness_evaluate(user_id: str, answers: List[str]) -> dict:
     """
     Evaluate 10 answers using the existing agent.
     Stores only score + summary in MongoDB (NOT the Q&A).
     Returns readiness result + initialises confidence.
     """
-    user = _get_or_404(user_id)
+    user = await _get_or_404(user_id)
     profile = user["profile"]
 
     # Retrieve cached questions
@@ -414,8 +563,8 @@ def readiness_evaluate(user_id: str, answers: List[str]) -> dict:
         for q, a in zip(questions, answers)
     ]
 
-    # Delegate to agent's evaluator (unmodified logic)
-    result = _readiness_agent._evaluate(
+    # Delegate to the agent's evaluator
+    result = await _readiness_agent._aevaluate(
         target_role=profile["target_role"],
         qa_pairs=qa_pairs,
     )
@@ -425,6 +574,7 @@ def readiness_evaluate(user_id: str, answers: List[str]) -> dict:
 
     # Clear ephemeral Q&A from memory
     _session_cache.get(user_id, {}).pop("readiness_questions", None)
+    role_graph.observe_readiness(user_id, profile["target_role"], result.get("safer_adjacent_roles", []))
 
     # Update MongoDB — scores + summary ONLY
     patch = {
@@ -437,24 +587,19 @@ def readiness_evaluate(user_id: str, answers: List[str]) -> dict:
         },
         "confidence_score": score,   # initialise confidence to readiness_score
     }
-    db.patch_user(user_id, patch)
+    # Roadmap generation runs as a background stage; /api/roadmap reports its progress
+    started_at = _now()
+    patch.update({
+        "active_roadmap.status": "generating",
+        "active_roadmap.started_at": started_at,
+        "active_roadmap.completed_at": None,
+        "active_roadmap.error": None,
+    })
+    await _patch(user_id, patch)
 
-    # Auto-generate roadmap after readiness
-    try:
-        roadmap_result = _roadmap_agent.run({
-            "target_role": profile["target_role"],
-            "strengths":   profile.get("strengths", []),
-            "weaknesses":  profile.get("weaknesses", []),
-            "skills":      profile.get("skills", []),
-        })
-        roadmap_doc = {
-            "generated_for_role": profile["target_role"],
-            "steps": roadmap_result.get("steps", []),
-            "status": "generated",
-        }
-        db.patch_user(user_id, {"active_roadmap": roadmap_doc})
-    except Exception as e:
-        print(f"[readiness_evaluate] roadmap gen failed: {e}")
+    roadmap_input = _roadmap_input(profile["target_role"], profile)
+    question_prefetch.cancel(user_id)
+    _roadmap_jobs.start(user_id, lambda: _roadmap_stage(user_id, roadmap_input, started_at))
 
     return {
         "score": score,
@@ -463,16 +608,46 @@ def readiness_evaluate(user_id: str, answers: List[str]) -> dict:
         "safer_adjacent_roles":    result.get("safer_adjacent_roles", []),
         "advanced_adjacent_roles": result.get("advanced_adjacent_roles", []),
         "confidence_score": score,
+        "roadmap_status": "generating",
     }
 
 
+async def _roadmap_stage(user_id: str, roadmap_input: dict, started_at: str) -> None:
+    """Background stage: generate the roadmap and persist it, or persist the failure."""
+    role = roadmap_input["target_role"]
+    try:
+        roadmap_result = await _build_roadmap(roadmap_input)
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        print(f"[roadmap_stage] roadmap gen failed for {user_id}: {e}")
+        await _patch(user_id, {
+            "active_roadmap.status": "failed",
+            "active_roadmap.error": str(e)[:300],
+            "active_roadmap.completed_at": _now(),
+        })
+        return
+
+    roadmap_doc = {
+        "generated_for_role": role,
+        "steps": roadmap_result.get("steps", []),
+        "status": "generated",
+        "started_at": started_at,
+        "completed_at": _now(),
+        "error": None,
+    }
+    await _patch(user_id, {"active_roadmap": roadmap_doc})
+    print(f"[roadmap_stage] Roadmap for {role} ready ({user_id})")
+    _prefetch_action_questions(user_id, roadmap_doc["steps"], role)
+
+
 # ═══════════════════════════════════════════════════════════════════
 #  3. DASHBOARD
 # ═══════════════════════════════════════════════════════════════════
 
-def get_dashboard(user_id: str) -> dict:
+async def get_dashboard(user_id: str) -> dict:
     """Aggregate all state for the dashboard view."""
-    user = _get_or_404(user_id)
+    user = await _get_or_404(user_id)
     completion = _roadmap_completion(user)
 
     steps = user.get("active_roadmap", {}).get("steps", [])
@@ -505,24 +680,115 @@ def get_dashboard(user_id: str) -> dict:
 #  4. ROADMAP
 # ═══════════════════════════════════════════════════════════════════
 
-def get_roadmap(user_id: str) -> dict:
-    user = _get_or_404(user_id)
+def _roadmap_input(role: str, profile: dict) -> dict:
+    return {
+        "target_role": role,
+        "strengths":   profile.get("strengths", []),
+        "weaknesses":  profile.get("weaknesses", []),
+        "skills":      profile.get("skills", []),
+    }
+
+
+async def _build_roadmap(roadmap_input: dict, fresh: bool = False) -> dict:
+    """
+    Roadmap for `roadmap_input`: a stored template for the same role and a similar
+    profile (plus a small personalization pass), else a full RoadmapAgent run
+    that becomes the template. `fresh` (explicit regeneration) skips the template
+    lookup and the LLM response cache, so the user gets a new plan.
+    """
+    role = roadmap_input["target_role"]
+    key = _role_key(role)
+    if not fresh:
+        steps = await roadmap_templates.aget(key, roadmap_input)
+        if steps is not None:
+            if roadmap_templates.personalize:
+                try:
+                    steps = await _roadmap_agent.apersonalize(steps, roadmap_input)
+                except Exception as e:
+                    print(f"[roadmap] personalization failed for '{key}' ({e}) — serving template as is")
+            return {"generated_for_role": role, "steps": steps}
+
+    if fresh:
+        result = await _roadmap_agent.arun(roadmap_input, use_cache=False)
+    else:
+        result = await _coalesced_run(_roadmap_agent, roadmap_input)
+    await roadmap_templates.aput(key, roadmap_input, result.get("steps", []))
+    return result
+
+
+def _roadmap_progress(user_id: str, roadmap: dict) -> dict:
+    """Stage progress for the roadmap: percent is an estimate from recent RoadmapAgent latency."""
+    status = roadmap.get("status", "not_started")
+    if status == "generated":
+        return {"stage": status, "percent": 100}
+    if status != "generating":
+        return {"stage": status, "percent": 0, "error": roadmap.get("error")}
+
+    elapsed  = _elapsed_since(roadmap.get("started_at"))
+    estimate = llm_telemetry.percentile("RoadmapAgent", "run", 0.5, min_samples=5) or ROADMAP_DEFAULT_ESTIMATE_S
+    return {
+        "stage": status,
+        "percent": min(95, int(elapsed / estimate * 100)) if estimate else 0,
+        "elapsed_s": round(elapsed, 1),
+        "eta_s": round(max(0.0, estimate - elapsed), 1),
+        "running_here": _roadmap_jobs.running(user_id),
+    }
+
+
+def background_job_stats() -> dict:
+    return {"roadmap": _roadmap_jobs.stats()}
+
+
+async def get_roadmap(user_id: str) -> dict:
+    user = await _get_or_404(user_id)
+    roadmap = user.get("active_roadmap", {})
+
+    # A stage left "generating" by a restarted worker would otherwise never resolve
+    if (roadmap.get("status") == "generating" and not _roadmap_jobs.running(user_id)
+            and _elapsed_since(roadmap.get("started_at")) > ROADMAP_STAGE_TIMEOUT_S):
+        roadmap.update(status="failed", error="Roadmap generation was interrupted", completed_at=_now())
+        await _patch(user_id, {
+            "active_roadmap.status": "failed",
+            "active_roadmap.error": roadmap["error"],
+            "active_roadmap.completed_at": roadmap["completed_at"],
+        })
+
     return {
         "user_id": user_id,
-        "roadmap": user.get("active_roadmap", {}),
+        "roadmap": roadmap,
         "confidence_score": user.get("confidence_score", 0),
+        "progress": _roadmap_progress(user_id, roadmap),
     }
 
 
-def regenerate_roadmap(user_id: str, target_role: Optional[str] = None) -> dict:
+def _started_months(steps: List[dict]) -> List[dict]:
+    """Months up to and including the last one with an assessed action."""
+    last = 0
+    for idx, step in enumerate(steps, 1):
+        if any(a.get("status", "pending") != "pending" for a in step.get("actions", [])):
+            last = idx
+    return steps[:last]
+
+
+async def regenerate_roadmap(user_id: str, target_role: Optional[str] = None,
+                             keep_progress: bool = False) -> dict:
     """
     Regenerates roadmap (and optionally switches role).
     Delegates entirely to RoadmapAgent — no logic duplication.
+
+    For the same role with `keep_progress`, months the user has already started
+    are kept (statuses, scores, action ids) and only the remaining months are
+    regenerated; a role switch always rebuilds the whole roadmap. When every
+    month is already under way the roadmap is returned with `regenerated: False`.
     """
-    user = _get_or_404(user_id)
+    user = await _get_or_404(user_id)
     profile = user["profile"]
 
+    target_role = _canonical_role(target_role)
     role = target_role or profile["target_role"]
+    same_role = _role_key(role) == _role_key(profile["target_role"])
+    kept = _started_months(user.get("active_roadmap", {}).get("steps", [])) \
+        if same_role and keep_progress else []
 
     # If switching role, store history
     if target_role and target_role != profile.get("career_state", {}).get("current_target_role"):
@@ -530,46 +796,67 @@ def regenerate_roadmap(user_id: str, target_role: Optional[str] = None) -> dict:
         history = career_state.get("role_history", [])
         if profile["target_role"]:
             history.append(profile["target_role"])
-        db.patch_user(user_id, {
+        await _patch(user_id, {
             "profile.target_role": role,
             "career_state.current_target_role": role,
             "career_state.role_history": history,
         })
         profile["target_role"] = role
 
-    result = _roadmap_agent.run({
-        "target_role": role,
-        "strengths":   profile.get("strengths", []),
-        "weaknesses":  profile.get("weaknesses", []),
-        "skills":      profile.get("skills", []),
-    })
+    if len(kept) >= 5:
+        # Every month is under way — nothing left to regenerate
+        roadmap_doc = user["active_roadmap"]
+        return {
+            "user_id": user_id,
+            "roadmap": roadmap_doc,
+            "confidence_score": user.get("confidence_score", 0),
+            "progress": _roadmap_progress(user_id, roadmap_doc),
+            "regenerated": False,
+        }
+    if kept:
+        result = await _roadmap_agent.arun_remaining(_roadmap_input(role, profile), kept, use_cache=False)
+    else:
+        # Same role → the user asked for a different plan, so the template is bypassed
+        result = await _build_roadmap(_roadmap_input(role, profile), fresh=same_role)
+    # An explicit regeneration supersedes a pending background stage and its prefetch
+    _roadmap_jobs.cancel(user_id)
+    question_prefetch.cancel(user_id)
 
     roadmap_doc = {
         "generated_for_role": role,
         "steps": result.get("steps", []),
         "status": "generated",
+        "completed_at": _now(),
     }
 
-    # Reset progress on regeneration
-    db.patch_user(user_id, {
-        "active_roadmap": roadmap_doc,
-        "progress.actions_completed": 0,
-        "progress.actions_failed": 0,
-    })
+    update = {"active_roadmap": roadmap_doc}
+    if not kept:
+        # Reset progress on full regeneration
+        update["progress.actions_completed"] = 0
+        update["progress.actions_failed"] = 0
+    await _patch(user_id, update)
+    _prefetch_action_questions(user_id, roadmap_doc["steps"], role)
 
-    return {"user_id": user_id, "roadmap": roadmap_doc, "confidence_score": user.get("confidence_score", 0)}
+    return {
+        "user_id": user_id,
+        "roadmap": roadmap_doc,
+        "confidence_score": user.get("confidence_score", 0),
+        "progress": _roadmap_progress(user_id, roadmap_doc),
+        "regenerated": True,
+    }
 
 
 # ═══════════════════════════════════════════════════════════════════
 #  5. ACTION ASSESSMENT
 # ═══════════════════════════════════════════════════════════════════
 
-def get_action_questions(user_id: str, action_id: str) -> dict:
+async def get_action_questions(user_id: str, action_id: str) -> dict:
     """
-    Generate 10 questions for a specific action.
-    Cached in memory — not stored in MongoDB.
+    Serve 10 questions for a specific action from the action-title question bank.
+    The served set is cached in memory and recorded in the served-questions
+    collection (questions only, never answers) until the action is assessed.
     """
-    user = _get_or_404(user_id)
+    user = await _get_or_404(user_id)
     profile = user["profile"]
 
     # Find action in roadmap
@@ -583,86 +870,73 @@ def get_action_questions(user_id: str, action_id: str) -> dict:
     if not action_title:
         raise ValueError(f"Action {action_id} not found in roadmap")
 
-    questions = _action_agent._generate_questions(action_title, profile["target_role"])
+    questions = await question_bank.aget(
+        "action", normalize_title(action_title), 10,
+        lambda avoid: _action_agent._agenerate_questions(action_title, profile["target_role"], avoid=avoid),
+    )
 
-    # Cache per user+action (ephemeral)
-    cache_key = f"{user_id}:{action_id}"
+    # Cache per user+action; the stored copy lets assess_action grade against
+    # exactly these questions after a restart (the bank itself keeps changing)
+    served = {"questions": questions, "action_title": action_title}
     _session_cache.setdefault(user_id, {})
-    _session_cache[user_id][f"action_q_{action_id}"] = {
-        "questions": questions,
-        "action_title": action_title,
-    }
+    _session_cache[user_id][f"action_q_{action_id}"] = served
+    await asyncio.to_thread(db.save_served_questions, user_id, f"action:{action_id}", served)
 
     return {"action_id": action_id, "action_title": action_title, "questions": questions}
 
 
-def assess_action(user_id: str, action_id: str, answers: List[str]) -> dict:
+async def _served_action_questions(user_id: str, action_id: str) -> dict:
     """
-    Evaluate action answers via existing ActionAssessmentAgent.
-    Updates action status + score in MongoDB.
-    Updates confidence_score. Runs rerouting check.
-
-    If questions are no longer in session cache (e.g. server restarted between
-    /api/action/questions and /api/action/assess), they are regenerated from
-    the action title stored in MongoDB so evaluation still has full context.
+    {questions, action_title} the user was served for `action_id`: the session
+    cache, else the stored copy from get_action_questions().
     """
-    user    = _get_or_404(user_id)
-    profile = user["profile"]
-
     # Try session cache first (happy path — same process, short window)
     cached = _session_cache.get(user_id, {}).get(f"action_q_{action_id}")
+    if cached:
+        return cached
 
-    if not cached:
-        # Cache miss (cold server / long session) — recover from roadmap
-        action_title = None
-        for step in user.get("active_roadmap", {}).get("steps", []):
-            for action in step.get("actions", []):
-                if action["action_id"] == action_id:
-                    action_title = action["action_title"]
-                    break
-        if not action_title:
-            raise ValueError(f"Action {action_id} not found in active roadmap.")
-        # Regenerate questions for proper evaluation context
-        try:
-            questions = _action_agent._generate_questions(action_title, profile["target_role"])
-        except Exception as e:
-            # If question generation fails, use generic fallback questions
-            print(f"[assess_action] question generation failed: {e}")
-            questions = [
-                f"How would you approach {action_title}?",
-                f"What are the key concepts in {action_title}?",
-                f"Describe your experience with {action_title}.",
-                f"What challenges have you faced in {action_title}?",
-                f"How do you measure success in {action_title}?",
-                f"What tools would you use for {action_title}?",
-                f"How does {action_title} relate to {profile['target_role']}?",
-                f"What would you improve about {action_title}?",
-                f"How often do you practice {action_title}?",
-                f"What's your confidence level with {action_title}?"
-            ]
-        cached = {"questions": questions, "action_title": action_title}
-
-    questions    = cached["questions"]
-    action_title = cached["action_title"]
+    # Cache miss (cold server / long session) — use the stored copy
+    stored = await asyncio.to_thread(db.get_served_questions, user_id, f"action:{action_id}")
+    if stored and stored.get("questions"):
+        return stored
+    raise ValueError(f"No questions found for action {action_id}. Call /api/action/questions first.")
 
+
+async def _forget_served_questions(user_id: str, action_ids: List[str]) -> None:
+    """Drop graded question sets from the session cache and the store."""
+    session = _session_cache.get(user_id, {})
+    for action_id in action_ids:
+        session.pop(f"action_q_{action_id}", None)
+    await asyncio.to_thread(db.delete_served_questions, user_id, [f"action:{a}" for a in action_ids])
+
+
+async def _evaluate_action(action_title: str, target_role: str,
+                           questions: List[str], answers: List[str]) -> dict:
+    """ActionAssessmentAgent evaluation with a neutral fallback (throttling is re-raised)."""
     # Build ephemeral Q&A pairs (zip handles length mismatch gracefully)
     qa_pairs = [{"question": q, "answer": a} for q, a in zip(questions, answers)]
 
-    # Evaluate using unmodified agent logic
+    # Evaluate with the agent's own logic
     try:
-        result = _action_agent._evaluate(action_title, profile["target_role"], qa_pairs)
+        return await _action_agent._aevaluate(action_title, target_role, qa_pairs)
+    except LLMThrottledError:
+        # Saturated — let the client retry instead of recording a neutral score
+        raise
     except Exception as e:
         # If LLM evaluation fails, return defensive defaults
         print(f"[assess_action] LLM evaluation failed: {e}")
-        result = {
+        return {
             "action_score": 50,  # Neutral score
             "evaluation_summary": "Evaluation temporarily unavailable. Your answers have been recorded for manual review."
         }
 
-    # Clear ephemeral data
-    _session_cache.get(user_id, {}).pop(f"action_q_{action_id}", None)
 
-    score  = int(result.get("action_score", 50))
+def _apply_action_score(user: dict, action_id: str, score: int) -> tuple:
+    """
+    Record one scored action on the in-memory user document: action status,
+    confidence, progress counters and (on a completed step) the new skill.
+    Returns (passed, profile_changed).
+    """
     passed = score >= 50
 
     # Update action in roadmap
@@ -685,10 +959,10 @@ def assess_action(user_id: str, action_id: str, answers: List[str]) -> dict:
 
     # Update confidence
     delta = +1 if passed else -1
-    new_confidence = _update_confidence(user, delta)
+    _update_confidence(user, delta)
 
     # Update analytics
-    progress = user.get("progress", {})
+    progress = user.setdefault("progress", {})
     if passed:
         progress["actions_completed"] = progress.get("actions_completed", 0) + 1
     else:
@@ -701,62 +975,160 @@ def assess_action(user_id: str, action_id: str, answers: List[str]) -> dict:
     if completed_step_title and completed_step_title not in skills:
         skills.append(completed_step_title)
         profile["skills"] = skills
+        return passed, True
+    return passed, False
 
-    # Persist to MongoDB
+
+async def _persist_assessment(user_id: str, user: dict, profile_changed: bool) -> None:
+    """One write for everything _apply_action_score() changed."""
     update_payload = {
         "active_roadmap": user["active_roadmap"],
-        "confidence_score": new_confidence,
-        "progress": progress,
+        "confidence_score": user.get("confidence_score", 0),
+        "progress": user.get("progress", {}),
     }
-    if completed_step_title:
-        update_payload["profile"] = profile
-    
-    db.patch_user(user_id, update_payload)
+    if profile_changed:
+        update_payload["profile"] = user["profile"]
+    await _patch(user_id, update_payload)
 
-    # Run rerouting check (pure logic — no LLM needed)
-    # Run rerouting check (pure logic — no LLM needed)
+
+async def _reroute_check(user: dict) -> dict:
+    """Rerouting check after assessments, with safe defaults if it fails."""
     completion = _roadmap_completion(user)
     try:
-        reroute_result = _rerouting_agent.run({
-            "confidence_score":              new_confidence,
-            "current_target_role":           profile["target_role"],
-            "previous_target_role":          user.get("career_state", {}).get("role_history", [None])[-1],
+        return await _rerouting_agent.arun({
+            "confidence_score":              user.get("confidence_score", 0),
+            "current_target_role":           user["profile"]["target_role"],
+            "previous_target_role":          (user.get("career_state", {}).get("role_history") or [None])[-1],
             "roadmap_completion_percentage": completion,
         })
     except Exception as e:
         # If rerouting check fails (rare LLM issues), return safe defaults
         print(f"[assess_action] rerouting check failed: {e}")
-        reroute_result = {
+        return {
             "reroute_suggestion": False,
             "suggested_roles": [],
             "return_previous_role_available": False,
             "reason": "Rerouting check unavailable. Focus on current roadmap."
         }
 
+
+async def assess_action(user_id: str, action_id: str, answers: List[str]) -> dict:
+    """
+    Evaluate action answers via existing ActionAssessmentAgent.
+    Updates action status + score in MongoDB.
+    Updates confidence_score. Runs rerouting check.
+
+    If questions are no longer in session cache (e.g. server restarted between
+    /api/action/questions and /api/action/assess), the stored copy of the
+    served questions is used so evaluation still has full context.
+    """
+    user    = await _get_or_404(user_id)
+    profile = user["profile"]
+
+    cached = await _served_action_questions(user_id, action_id)
+    result = await _evaluate_action(cached["action_title"], profile["target_role"],
+                                    cached["questions"], answers)
+
+    # Clear ephemeral data
+    await _forget_served_questions(user_id, [action_id])
+
+    score  = int(result.get("action_score", 50))
+    passed, profile_changed = _apply_action_score(user, action_id, score)
+
+    # Persist to MongoDB
+    await _persist_assessment(user_id, user, profile_changed)
+    if passed:
+        # The user moves on — warm the questions for the actions that follow
+        _prefetch_action_questions(user_id, user["active_roadmap"].get("steps", []),
+                                   profile["target_role"], after=action_id)
+
+    # Run rerouting check (pure logic — no LLM needed)
+    reroute_result = await _reroute_check(user)
+
     return {
         "action_id": action_id,
         "score": score,
         "passed": passed,
         "evaluation_summary": result.get("evaluation_summary", ""),
-        "updated_confidence_score": new_confidence,
+        "updated_confidence_score": user.get("confidence_score", 0),
         "reroute_check": reroute_result,
     }
 
 
+async def assess_actions(user_id: str, submissions: List[dict]) -> dict:
+    """
+    Bulk variant of assess_action() for users catching up on several actions:
+    evaluations run concurrently, every score / confidence / progress update is
+    applied in roadmap order and persisted in one write, and the rerouting
+    check runs once at the end.
+
+    submissions: [{"action_id": str, "answers": [str, ...]}, ...]
+    """
+    if not submissions:
+        raise ValueError("No actions to assess.")
+    ids = [s["action_id"] for s in submissions]
+    if len(set(ids)) != len(ids):
+        raise ValueError("Each action can only be assessed once per request.")
+
+    user    = await _get_or_404(user_id)
+    profile = user["profile"]
+
+    served = await asyncio.gather(*(_served_action_questions(user_id, i) for i in ids))
+    outcomes = await asyncio.gather(
+        *(_evaluate_action(q["action_title"], profile["target_role"], q["questions"], s["answers"])
+          for q, s in zip(served, submissions)),
+        return_exceptions=True,
+    )
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            # Throttled — nothing has been written; evaluations that did finish are LLM-cached
+            raise outcome
+
+    order = {a.get("action_id"): n for n, a in enumerate(
+        a for s in user.get("active_roadmap", {}).get("steps", []) for a in s.get("actions", []))}
+    results = []
+    profile_changed = False
+    for action_id, result in sorted(zip(ids, outcomes), key=lambda p: order.get(p[0], 0)):
+        score = int(result.get("action_score", 50))
+        passed, step_completed = _apply_action_score(user, action_id, score)
+        profile_changed = profile_changed or step_completed
+        results.append({
+            "action_id": action_id,
+            "score": score,
+            "passed": passed,
+            "evaluation_summary": result.get("evaluation_summary", ""),
+        })
+
+    await _persist_assessment(user_id, user, profile_changed)
+    await _forget_served_questions(user_id, ids)
+    passed = [r["action_id"] for r in results if r["passed"]]
+    if passed:
+        _prefetch_action_questions(user_id, user["active_roadmap"].get("steps", []),
+                                   profile["target_role"], after=passed[-1])
+
+    return {
+        "results": results,
+        "updated_confidence_score": user.get("confidence_score", 0),
+        "reroute_check": await _reroute_check(user),
+    }
+
+
 # ═══════════════════════════════════════════════════════════════════
 #  6. MARKET INTELLIGENCE
 # ═══════════════════════════════════════════════════════════════════
 
-def get_market(user_id: str) -> dict:
-    """Return cached market analysis; refresh if missing."""
-    user = _get_or_404(user_id)
-    market = user.get("market_analysis", {})
+async def get_market(user_id: str) -> dict:
+    """Return the shared market analysis for the user's role (refreshed when stale)."""
+    user = await _get_or_404(user_id)
+    role = user["profile"].get("target_role")
+    if not role:
+        return {"user_id": user_id, "market_analysis": user.get("market_analysis", {})}
+
+    market = await _role_market(role)
 
-    if not market:
-        profile = user["profile"]
-        result  = _market_agent.run({"target_role": profile["target_role"]})
-        market  = result.get("market_analysis", {})
-        db.patch_user(user_id, {"market_analysis": market})
+    # Link (and shrink) documents still carrying their own copy or an old reference
+    if user.get("market_analysis") or user.get("market_ref", {}).get("role_key") != _role_key(role):
+        await _patch(user_id, {"market_ref": _market_ref(role), "market_analysis": {}})
 
     return {"user_id": user_id, "market_analysis": market}
 
@@ -765,12 +1137,12 @@ def get_market(user_id: str) -> dict:
 #  7. REROUTING
 # ═══════════════════════════════════════════════════════════════════
 
-def handle_reroute(user_id: str, new_role: Optional[str] = None) -> dict:
+async def handle_reroute(user_id: str, new_role: Optional[str] = None) -> dict:
     """
     Analyse rerouting eligibility and optionally switch role.
     Uses existing ReroutingAgent — no duplicated logic.
     """
-    user = _get_or_404(user_id)
+    user = await _get_or_404(user_id)
     profile = user["profile"]
     history = user.get("career_state", {}).get("role_history", [])
 
@@ -778,7 +1150,7 @@ def handle_reroute(user_id: str, new_role: Optional[str] = None) -> dict:
     prev_role  = history[-1] if history else None
 
     # Run rerouting analysis
-    reroute_result = _rerouting_agent.run({
+    reroute_result = await _rerouting_agent.arun({
         "confidence_score":              user.get("confidence_score", 0),
         "current_target_role":           profile["target_role"],
         "previous_target_role":          prev_role,
@@ -788,29 +1160,37 @@ def handle_reroute(user_id: str, new_role: Optional[str] = None) -> dict:
     role_switched = False
     switched_to   = None
 
-    if new_role and new_role != profile["target_role"]:
+    new_role = _canonical_role(new_role)
+    if new_role and _role_key(new_role) != _role_key(profile["target_role"]):
         # Execute role switch
         history.append(profile["target_role"])
 
-        # Regenerate market + roadmap for new role
-        try:
-            market_result  = _market_agent.run({"target_role": new_role})
-            roadmap_result = _roadmap_agent.run({
-                "target_role": new_role,
-                "strengths":   profile.get("strengths", []),
-                "weaknesses":  profile.get("weaknesses", []),
-                "skills":      profile.get("skills", []),
-            })
+        # Regenerate market + roadmap for new role — independent, so run concurrently
+        switch = (
+            AgentGraph("role_switch")
+            .add("market",  lambda _: _role_market(new_role))
+            .add("roadmap", lambda _: _build_roadmap(_roadmap_input(new_role, profile)))
+        )
+        result = await switch.arun()
+        print(f"[reroute] role switch branches: {result.summary()}")
+
+        # The roadmap is required for a switch; a failed market branch leaves the
+        # role entry unset so GET /api/market regenerates it on demand.
+        if result.ok("roadmap"):
+            _roadmap_jobs.cancel(user_id)
+            question_prefetch.cancel(user_id)
             roadmap_doc = {
                 "generated_for_role": new_role,
-                "steps": roadmap_result.get("steps", []),
+                "steps": result.value("roadmap").get("steps", []),
                 "status": "generated",
+                "completed_at": _now(),
             }
-            db.patch_user(user_id, {
+            await _patch(user_id, {
                 "profile.target_role": new_role,
                 "career_state.current_target_role": new_role,
                 "career_state.role_history": history,
-                "market_analysis": market_result.get("market_analysis", {}),
+                "market_ref": _market_ref(new_role),
+                "market_analysis": {},
                 "active_roadmap": roadmap_doc,
                 "progress.actions_completed": 0,
                 "progress.actions_failed": 0,
@@ -821,8 +1201,9 @@ def handle_reroute(user_id: str, new_role: Optional[str] = None) -> dict:
             })
             role_switched = True
             switched_to   = new_role
-        except Exception as e:
-            print(f"[reroute] failed to switch role: {e}")
+            _prefetch_action_questions(user_id, roadmap_doc["steps"], new_role)
+        else:
+            print(f"[reroute] failed to switch role: {result.error('roadmap')}")
 
     return {
         "user_id": user_id,
@@ -839,39 +1220,71 @@ def handle_reroute(user_id: str, new_role: Optional[str] = None) -> dict:
 #  8. FEEDBACK
 # ═══════════════════════════════════════════════════════════════════
 
-def generate_feedback(user_id: str) -> dict:
+def _feedback_fingerprint(feedback_input: dict) -> str:
+    """Stable hash of the FeedbackAgent inputs (completion rounded to 0.1%)."""
+    canonical = {**feedback_input, "target_role": _role_key(feedback_input["target_role"]),
+                 "roadmap_progress_percentage": round(feedback_input["roadmap_progress_percentage"], 1)}
+    return hashlib.sha256(json.dumps(canonical, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+def _checkpoint_passed(feedback: dict) -> bool:
+    """True once the report's next_checkpoint_date is today or earlier (no date → never)."""
+    try:
+        return date.fromisoformat(str(feedback.get("next_checkpoint_date", ""))[:10]) <= date.today()
+    except ValueError:
+        return False
+
+
+async def generate_feedback(user_id: str, refresh: bool = False) -> dict:
     """
     Generate feedback report using existing FeedbackAgent.
     Stores result in MongoDB.
+
+    The report is stored with a fingerprint of its inputs; while the inputs are
+    unchanged and next_checkpoint_date has not arrived, the stored report is
+    returned without an LLM call. `refresh` regenerates the report, bypassing
+    the LLM response cache as well.
     """
-    user = _get_or_404(user_id)
+    user = await _get_or_404(user_id)
     progress   = user.get("progress", {})
     completion = _roadmap_completion(user)
 
-    result = _feedback_agent.run({
+    feedback_input = {
         "target_role":                 user["profile"]["target_role"],
         "confidence_score":            user.get("confidence_score", 0),
         "completed_actions_count":     progress.get("actions_completed", 0),
         "failed_actions_count":        progress.get("actions_failed", 0),
         "roadmap_progress_percentage": completion,
-    })
+    }
+    fingerprint = _feedback_fingerprint(feedback_input)
+
+    stored = user.get("feedback_analysis") or {}
+    if stored and not refresh \
+            and (user.get("feedback_meta") or {}).get("fingerprint") == fingerprint \
+            and not _checkpoint_passed(stored):
+        return {"user_id": user_id, "feedback_analysis": stored, "reused": True}
+
+    result = await _feedback_agent.arun(feedback_input, use_cache=not refresh)
 
     feedback = result.get("feedback_analysis", {})
-    db.patch_user(user_id, {"feedback_analysis": feedback})
+    await _patch(user_id, {
+        "feedback_analysis": feedback,
+        "feedback_meta": {"fingerprint": fingerprint, "generated_at": _now()},
+    })
 
-    return {"user_id": user_id, "feedback_analysis": feedback}
+    return {"user_id": user_id, "feedback_analysis": feedback, "reused": False}
 
 
 # ═══════════════════════════════════════════════════════════════════
 #  9. HANDS-ON CHAT
 # ═══════════════════════════════════════════════════════════════════
 
-def hands_on_chat(user_id: str, message: str, conversation_history: List[dict]) -> dict:
+async def hands_on_chat(user_id: str, message: str, conversation_history: List[dict]) -> dict:
     """
     Stateless chat endpoint — full conversation history sent each request.
-    Uses HandsOnAgent's Groq call pattern (same model, same API key).
+    Uses HandsOnAgent's prompt pattern through the shared LLM backend.
     """
-    user = _get_or_404(user_id)
+    user = await _get_or_404(user_id)
     target_role = user["profile"].get("target_role", "your target role")
 
     # System prompt matching HandsOnAgent behaviour
@@ -897,18 +1310,8 @@ def hands_on_chat(user_id: str, message: str, conversation_history: List[dict])
     # Add current message
     messages.append({"role": "user", "content": message})
 
-    # Call LLM via existing call_llm helper
-    import os
-    from groq import Groq
-    api_key = os.getenv("GROQ_API_KEY", "")
-    client = Groq(api_key=api_key)
-    response = client.chat.completions.create(
-        model="openai/gpt-oss-120b",
-        messages=messages,
-        max_completion_tokens=1500,
-        stream=False,
-    )
-    reply = response.choices[0].message.content
+    # Call LLM through the shared backend (governor, telemetry, stub in load tests)
+    reply = await achat_llm(messages, max_tokens=1500, agent="HandsOnAgent", op="chat")
 
     # Return updated conversation history (no server-side storage)
     updated_history = list(conversation_history) + [
@@ -923,7 +1326,7 @@ def hands_on_chat(user_id: str, message: str, conversation_history: List[dict])
 #  BONUS: RESUME SKILLS EXTRACTION
 # ═══════════════════════════════════════════════════════════════════
 
-def extract_skills_from_resume(resume_text: str) -> dict:
+async def extract_skills_from_resume(resume_text: str) -> dict:
     """
     Extract skills from resume text using LLM.
     Used during onboarding when user uploads resume instead of manual entry.
@@ -933,6 +1336,7 @@ def extract_skills_from_resume(resume_text: str) -> dict:
         return {"skills": [], "message": "Resume text is empty"}
     
     try:
+        resume_text = prompt_builder.text("ResumeAnalyzerAgent", "skills_resume_text", resume_text)
         system_prompt = "You are an expert resume parser. Extract technical and professional skills from resumes and return them as a JSON object with a 'skills' array."
         
         user_prompt = f"""
@@ -947,7 +1351,7 @@ Return format (ONLY JSON):
 {{"skills": ["skill1", "skill2", "skill3", ...]}}
 """
         
-        response = call_llm(system_prompt, user_prompt, max_tokens=1024)
+        response = await acall_llm(system_prompt, user_prompt, max_tokens=1024, agent="ResumeAnalyzerAgent", op="extract_skills")
         
         # Try to extract JSON from response
         try:
@@ -985,6 +1389,8 @@ Return format (ONLY JSON):
             "message": "Could not parse skills from resume. Please enter manually."
         }
         
+    except LLMThrottledError:
+        raise
     except Exception as e:
         print(f"[extract_skills] Error: {e}")
         return {
@@ -997,7 +1403,7 @@ Return format (ONLY JSON):
 #  RESUME FILE ANALYSIS (using ResumeAnalyzerAgent)
 # ═══════════════════════════════════════════════════════════════════
 
-def analyze_resume_file(user_id: str, file_path: str, file_name: str) -> dict:
+async def analyze_resume_file(user_id: str, file_path: str, file_name: str) -> dict:
     """
     Analyze resume file (PDF or image) using ResumeAnalyzerAgent.
     Extracts text, parses structure, and stores in database.
@@ -1018,7 +1424,7 @@ def analyze_resume_file(user_id: str, file_path: str, file_name: str) -> dict:
         print(f"[Resume Analysis] Processing {file_name} for user {user_id}...")
         
         agent = ResumeAnalyzerAgent()
-        result = agent.run({
+        result = await agent.arun({
             "user_id": user_id,
             "file_path": file_path,
             "file_name": file_name
@@ -1031,6 +1437,8 @@ def analyze_resume_file(user_id: str, file_path: str, file_name: str) -> dict:
             "status": "error",
             "message": "ResumeAnalyzerAgent not available"
         }
+    except LLMThrottledError:
+        raise
     except Exception as e:
         print(f"[Resume Analysis] Error: {str(e)[:100]}")
         return {
@@ -2,5 +2,58 @@
 Core utilities and context management
 """
 from .user_context import UserContextManager
+from .llm_cache import LLMCache
+from .singleflight import SingleFlight
+from .llm_governor import LLMGovernor, LLMThrottledError
+from .telemetry import LLMTelemetry
+from .llm_backends import LLMBackend, GroqBackend, StubBackend
+from .prompt_builder import PromptBuilder, compile_schema
+from .json_stream import IncrementalJSONValidator, StreamDiverged, StreamShape
+from .hedging import HedgePolicy
+from .json_repair import repair_json
+from .model_router import ModelRouter
+from .http_clients import ClientRegistry, client_registry
+from .background_jobs import BackgroundJobs
+from .agent_graph import AgentGraph, GraphResult
+from .role_canon import RoleCanonicalizer, normalize_role, role_canon
+from .question_bank import QuestionBank
+from .prefetch import Prefetcher
+from .roadmap_templates import RoadmapTemplates, profile_signature
+from .answer_screen import AnswerScreen, answer_screen
+from .role_graph import RoleGraph, role_graph
 
-__all__ = ["UserContextManager"]
+__all__ = [
+    "UserContextManager",
+    "LLMCache",
+    "SingleFlight",
+    "LLMGovernor",
+    "LLMThrottledError",
+    "LLMTelemetry",
+    "LLMBackend",
+    "GroqBackend",
+    "StubBackend",
+    "PromptBuilder",
+    "compile_schema",
+    "IncrementalJSONValidator",
+    "StreamDiverged",
+    "StreamShape",
+    "HedgePolicy",
+    "repair_json",
+    "ModelRouter",
+    "ClientRegistry",
+    "client_registry",
+    "BackgroundJobs",
+    "AgentGraph",
+    "GraphResult",
+    "RoleCanonicalizer",
+    "normalize_role",
+    "role_canon",
+    "QuestionBank",
+    "Prefetcher",
+    "RoadmapTemplates",
+    "profile_signature",
+    "AnswerScreen",
+    "answer_screen",
+    "RoleGraph",
+    "role_graph",
+]
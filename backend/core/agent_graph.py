@@ -0,0 +1,182 @@
+"""
+Agent Call Graph
+
+Dependency-aware executor for agent calls: independent branches run
+concurrently, a failed branch skips only the branches that depend on it.
+"""
+
+import asyncio
+import concurrent.futures
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+class GraphCycleError(ValueError):
+    """The declared dependencies cannot be satisfied (unknown name or cycle)."""
+
+
+class BranchResult:
+    """Outcome of one branch."""
+    __slots__ = ("name", "value", "error", "elapsed", "skipped")
+
+    def __init__(self, name: str, value: Any = None, error: Optional[BaseException] = None,
+                 elapsed: float = 0.0, skipped: bool = False):
+        self.name = name
+        self.value = value
+        self.error = error
+        self.elapsed = elapsed
+        self.skipped = skipped      # not run because a dependency failed
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.skipped
+
+
+class GraphResult:
+    """Joined results of every branch in an AgentGraph run."""
+
+    def __init__(self, branches: Dict[str, BranchResult], elapsed: float):
+        self.branches = branches
+        self.elapsed = elapsed
+
+    def ok(self, name: str) -> bool:
+        return self.branches[name].ok
+
+    def value(self, name: str, default: Any = None) -> Any:
+        branch = self.branches[name]
+        return branch.value if branch.ok else default
+
+    def error(self, name: str) -> Optional[BaseException]:
+        return self.branches[name].error
+
+    @property
+    def failed(self) -> List[str]:
+        return [n for n, b in self.branches.items() if not b.ok]
+
+    def summary(self) -> str:
+        parts = []
+        for name, b in self.branches.items():
+            state = "ok" if b.ok else ("skipped" if b.skipped else f"failed: {b.error}")
+            parts.append(f"{name}={state} ({b.elapsed:.1f}s)")
+        return f"{self.elapsed:.1f}s total — " + ", ".join(parts)
+
+
+class AgentGraph:
+    """Declare branches with add(), then run() (sync) or arun() (async)."""
+
+    def __init__(self, name: str = "graph"):
+        self.name = name
+        self._fns: Dict[str, Callable[[Dict[str, Any]], Any]] = {}
+        self._deps: Dict[str, tuple] = {}
+
+    def add(self, name: str, fn: Callable[[Dict[str, Any]], Any],
+            deps: Iterable[str] = ()) -> "AgentGraph":
+        self._fns[name] = fn
+        self._deps[name] = tuple(deps)
+        return self
+
+    def _check(self) -> None:
+        seen: Dict[str, int] = {}
+
+        def visit(node: str) -> None:
+            if node not in self._fns:
+                raise GraphCycleError(f"[{self.name}] unknown dependency '{node}'")
+            if seen.get(node) == 1:
+                raise GraphCycleError(f"[{self.name}] dependency cycle through '{node}'")
+            if seen.get(node) == 2:
+                return
+            seen[node] = 1
+            for dep in self._deps[node]:
+                visit(dep)
+            seen[node] = 2
+
+        for node in self._fns:
+            visit(node)
+
+    def _ready(self, done: Dict[str, BranchResult], started: set) -> List[str]:
+        return [n for n in self._fns
+                if n not in started and all(d in done for d in self._deps[n])]
+
+    def _blocked(self, name: str, done: Dict[str, BranchResult]) -> Optional[BranchResult]:
+        failed = [d for d in self._deps[name] if not done[d].ok]
+        if failed:
+            return BranchResult(name, skipped=True,
+                                error=RuntimeError(f"dependency '{failed[0]}' failed"))
+        return None
+
+    # ─────────────────────────────────────────────────
+    # ASYNC (API path)
+    # ─────────────────────────────────────────────────
+
+    async def arun(self) -> GraphResult:
+        """Run every branch; fn(deps) must return an awaitable."""
+        self._check()
+        start = time.time()
+        done: Dict[str, BranchResult] = {}
+        started: set = set()
+        running: Dict[asyncio.Task, str] = {}
+
+        async def _branch(name: str, deps: Dict[str, Any]) -> BranchResult:
+            t0 = time.time()
+            try:
+                value = await self._fns[name](deps)
+                return BranchResult(name, value, elapsed=time.time() - t0)
+            except Exception as e:
+                return BranchResult(name, error=e, elapsed=time.time() - t0)
+
+        try:
+            while len(done) < len(self._fns):
+                for name in self._ready(done, started):
+                    started.add(name)
+                    blocked = self._blocked(name, done)
+                    if blocked:
+                        done[name] = blocked
+                        continue
+                    deps = {d: done[d].value for d in self._deps[name]}
+                    running[asyncio.ensure_future(_branch(name, deps))] = name
+                if not running:
+                    continue
+                finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in finished:
+                    done[running.pop(task)] = task.result()
+        finally:
+            for task in running:
+                task.cancel()
+        return GraphResult({n: done[n] for n in self._fns}, time.time() - start)
+
+    # ─────────────────────────────────────────────────
+    # SYNC (CLI path)
+    # ─────────────────────────────────────────────────
+
+    def run(self, max_workers: int = 4) -> GraphResult:
+        """Blocking variant: branches run on a thread pool, fn(deps) returns the value."""
+        self._check()
+        start = time.time()
+        done: Dict[str, BranchResult] = {}
+        started: set = set()
+
+        def _branch(name: str, deps: Dict[str, Any]) -> BranchResult:
+            t0 = time.time()
+            try:
+                return BranchResult(name, self._fns[name](deps), elapsed=time.time() - t0)
+            except Exception as e:
+                return BranchResult(name, error=e, elapsed=time.time() - t0)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers,
+                                                   thread_name_prefix=f"graph-{self.name}") as pool:
+            running: Dict[concurrent.futures.Future, str] = {}
+            while len(done) < len(self._fns):
+                for name in self._ready(done, started):
+                    started.add(name)
+                    blocked = self._blocked(name, done)
+                    if blocked:
+                        done[name] = blocked
+                        continue
+                    deps = {d: done[d].value for d in self._deps[name]}
+                    running[pool.submit(_branch, name, deps)] = name
+                if not running:
+                    continue
+                finished, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in finished:
+                    done[running.pop(future)] = future.result()
+        return GraphResult({n: done[n] for n in self._fns}, time.time() - start)
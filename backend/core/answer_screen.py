@@ -0,0 +1,159 @@
+"""
+Answer Screening
+
+Drops true non-answers (blank, "idk"-style replies, the question pasted back)
+from assessment submissions before the evaluation prompt is built. Length and
+relevance only ever count against long answers: a short answer is judged by
+the model, however terse.
+"""
+
+import os
+import re
+import threading
+from typing import Dict, Iterable, List, Optional
+
+_WORD = re.compile(r"[a-z0-9+#]+")
+
+# Replies that never answer anything, compared after normalization. Short words
+# that can be correct answers on their own ("yes", "none", "null", "pass") are
+# deliberately absent.
+NON_ANSWERS = {
+    "idk", "i dont know", "i don t know", "dont know", "don t know", "do not know",
+    "i do not know", "no idea", "not sure", "no clue", "n a", "skip", "asdf",
+    "no answer", "tbd", "todo",
+}
+
+# Ignored when comparing an answer with its question
+STOPWORDS = {
+    "a", "an", "the", "and", "or", "but", "if", "of", "to", "in", "on", "for", "with",
+    "at", "by", "from", "as", "is", "are", "was", "were", "be", "been", "it", "its",
+    "this", "that", "these", "those", "i", "you", "we", "they", "he", "she", "my",
+    "your", "our", "their", "me", "do", "does", "did", "how", "what", "why", "when",
+    "which", "who", "would", "could", "should", "can", "will", "have", "has", "had",
+    "about", "describe", "explain", "so", "then", "than", "there", "use",
+}
+
+
+def _tokens(text: str) -> List[str]:
+    return _WORD.findall(str(text or "").lower())
+
+
+def _content(tokens: Iterable[str]) -> set:
+    return {t for t in tokens if t not in STOPWORDS and len(t) > 1}
+
+
+class ScreenResult:
+    """Outcome of screening one submission."""
+    __slots__ = ("kept", "dropped", "total", "reasons", "short_circuit", "local_score")
+
+    def __init__(self, kept: List[dict], dropped: int, total: int, reasons: Dict[str, int],
+                 short_circuit: bool, local_score: int):
+        self.kept = kept                    # answered Q&A pairs (sent to the model)
+        self.dropped = dropped              # non-answers (count as incorrect)
+        self.total = total
+        self.reasons = reasons              # reason → count, for logs / summaries
+        self.short_circuit = short_circuit  # True → nothing was answered, skip the LLM
+        self.local_score = local_score
+
+    def summary(self) -> str:
+        """Deterministic evaluation summary for a short-circuited submission."""
+        return (
+            f"None of the {self.total} questions were answered — every answer was blank, "
+            "a non-answer such as \"I don't know\", a copy of the question, the same text "
+            "pasted into several questions, or unrelated to the question. Answer the "
+            "questions in your own words to get an evaluation."
+        )
+
+
+class AnswerScreen:
+    """Non-answer filter; a submission with no real answers is scored locally."""
+
+    def __init__(self, copy_overlap: float = 0.8, repeat_min_words: int = 4,
+                 relevance_min_words: int = 12, enabled: bool = True):
+        self.copy_overlap = copy_overlap
+        self.repeat_min_words = repeat_min_words          # shorter repeats ("Yes", "O(n)") are kept
+        self.relevance_min_words = relevance_min_words    # shorter answers are never judged off-topic
+        self.enabled = enabled
+        self._stats = {"screened": 0, "short_circuited": 0, "answers_dropped": 0}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "AnswerScreen":
+        """Build the process-wide screen from ANSWER_SCREEN* environment variables."""
+        return cls(
+            repeat_min_words=int(os.getenv("ANSWER_SCREEN_REPEAT_MIN_WORDS", "4")),
+            relevance_min_words=int(os.getenv("ANSWER_SCREEN_RELEVANCE_MIN_WORDS", "12")),
+            enabled=os.getenv("ANSWER_SCREEN", "true").strip().lower() not in ("0", "false", "no", "off"),
+        )
+
+    def classify(self, question: str, answer: str, context: str = "",
+                 seen: Optional[set] = None) -> Optional[str]:
+        """
+        Reason an answer is a non-answer ("blank", "non_answer", "copied_question",
+        "repeated", "off_topic") or None. `context` is topic text — screen() passes
+        the topic plus every question of the submission — and `seen` the earlier
+        answers of the same submission.
+        """
+        tokens = _tokens(answer)
+        norm = " ".join(tokens)
+        if not norm:
+            return "blank"
+        if norm in NON_ANSWERS:
+            return "non_answer"
+
+        # The question pasted back: the two word sets (nearly) coincide. One-sided
+        # overlap is not enough — "Hash table" is a correct answer to
+        # "Hash table or B-tree for O(1) lookups?".
+        answer_words = _content(tokens)
+        question_words = _content(_tokens(question))
+        if answer_words and question_words:
+            common = len(answer_words & question_words)
+            if (common / len(answer_words) >= self.copy_overlap
+                    and common / len(question_words) >= self.copy_overlap):
+                return "copied_question"
+
+        # One substantial text pasted into several questions answers at most one
+        if seen is not None and len(tokens) >= self.repeat_min_words:
+            if norm in seen:
+                return "repeated"
+            seen.add(norm)
+
+        # Lexical relevance, for long answers only: many content words and not
+        # one of them shared with the question or the topic (any question's words)
+        topic = question_words | _content(_tokens(context))
+        if len(answer_words) >= self.relevance_min_words and topic and not (answer_words & topic):
+            return "off_topic"
+        return None
+
+    def screen(self, qa_pairs: List[dict], context: str = "") -> ScreenResult:
+        """Split a submission into answered pairs and non-answers (`context`: topic words)."""
+        total = len(qa_pairs or [])
+        if not self.enabled or not total:
+            return ScreenResult(list(qa_pairs or []), 0, total, {}, False, 0)
+
+        kept: List[dict] = []
+        reasons: Dict[str, int] = {}
+        seen: set = set()
+        context = " ".join([context] + [str(p.get("question", "")) for p in qa_pairs])
+        for pair in qa_pairs:
+            reason = self.classify(pair.get("question", ""), pair.get("answer", ""), context, seen)
+            if reason is None:
+                kept.append(pair)
+            else:
+                reasons[reason] = reasons.get(reason, 0) + 1
+
+        dropped = total - len(kept)
+        short_circuit = not kept
+        with self._lock:
+            self._stats["screened"] += 1
+            self._stats["answers_dropped"] += dropped
+            if short_circuit:
+                self._stats["short_circuited"] += 1
+        return ScreenResult(kept, dropped, total, reasons, short_circuit, 0)
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {"enabled": self.enabled, **self._stats}
+
+
+answer_screen = AnswerScreen.from_env()
@@ -0,0 +1,56 @@
+"""
+Background Jobs
+
+Keyed fire-and-forget asyncio tasks (e.g. roadmap generation after
+readiness); starting a job for a key cancels the one already running.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class BackgroundJobs:
+    """One in-process task per key, with cancel / lookup and outcome counters."""
+
+    def __init__(self, name: str = "jobs"):
+        self.name = name
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+        self._stats = {"started": 0, "completed": 0, "failed": 0, "cancelled": 0}
+
+    def start(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        """Schedule fn() under `key`, cancelling any job already running for it."""
+        self.cancel(key)
+        task = asyncio.ensure_future(fn())
+        self._tasks[key] = task
+        self._stats["started"] += 1
+        task.add_done_callback(lambda t, k=key: self._finished(k, t))
+        return task
+
+    def cancel(self, key: Hashable) -> bool:
+        """Cancel the running job for `key`. Returns True if one was running."""
+        task = self._tasks.get(key)
+        if task is None or task.done():
+            return False
+        task.cancel()
+        return True
+
+    def running(self, key: Hashable) -> bool:
+        task = self._tasks.get(key)
+        return task is not None and not task.done()
+
+    def get(self, key: Hashable) -> Optional[asyncio.Task]:
+        return self._tasks.get(key)
+
+    def _finished(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if task.cancelled():
+            self._stats["cancelled"] += 1
+        elif task.exception() is not None:
+            self._stats["failed"] += 1
+            print(f"[BackgroundJobs:{self.name}] job {key!r} failed: {task.exception()}")
+        else:
+            self._stats["completed"] += 1
+
+    def stats(self) -> Dict[str, int]:
+        return {**self._stats, "running": sum(1 for t in self._tasks.values() if not t.done())}
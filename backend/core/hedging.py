@@ -0,0 +1,143 @@
+"""
+Hedged LLM Requests
+
+For opted-in short calls, a duplicate request is sent once the first has not
+answered by a telemetry-learned latency percentile; the first answer wins.
+"""
+
+import asyncio
+import concurrent.futures
+import os
+import threading
+import time
+from typing import Any, Awaitable, Callable, Optional, Set
+
+DEFAULT_HEDGE_OPS = (
+    "ReadinessAssessmentAgent.questions",
+    "ActionAssessmentAgent.questions",
+    "ReroutingAgent.safer_roles",
+)
+
+
+class HedgePolicy:
+    """Which ops are hedged and how long to wait before sending the duplicate."""
+
+    def __init__(self, ops=DEFAULT_HEDGE_OPS, percentile: float = 0.95,
+                 default_delay: float = 8.0, min_delay: float = 1.0,
+                 min_samples: int = 20):
+        self.ops: Set[str] = {o.strip() for o in ops if o.strip()}
+        self.percentile = percentile
+        self.default_delay = default_delay
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+
+    @classmethod
+    def from_env(cls) -> "HedgePolicy":
+        """Build the process-wide policy from LLM_HEDGE_* environment variables."""
+        ops = os.getenv("LLM_HEDGE_OPS")
+        return cls(
+            ops=ops.split(",") if ops is not None else DEFAULT_HEDGE_OPS,
+            percentile=float(os.getenv("LLM_HEDGE_PERCENTILE", "0.95")),
+            default_delay=float(os.getenv("LLM_HEDGE_DEFAULT_DELAY_S", "8")),
+            min_delay=float(os.getenv("LLM_HEDGE_MIN_DELAY_S", "1")),
+        )
+
+    def enabled(self, agent: str, op: str) -> bool:
+        return f"{agent}.{op}" in self.ops
+
+    def delay(self, agent: str, op: str, telemetry) -> float:
+        """Hedge deadline in seconds for this op (telemetry percentile or the default)."""
+        learned = telemetry.percentile(agent, op, self.percentile, min_samples=self.min_samples)
+        if learned is None:
+            return self.default_delay
+        return max(self.min_delay, learned)
+
+
+class HedgeResult:
+    """Outcome of one hedged call."""
+    __slots__ = ("value", "hedged", "hedge_won", "loser_elapsed")
+
+    def __init__(self, value: Any, hedged: bool = False, hedge_won: bool = False,
+                 loser_elapsed: Optional[float] = None):
+        self.value = value
+        self.hedged = hedged
+        self.hedge_won = hedge_won
+        self.loser_elapsed = loser_elapsed   # how long the cancelled attempt had run
+
+
+# ═══════════════════════════════════════════════════════════════════
+#  ASYNC (API path)
+# ═══════════════════════════════════════════════════════════════════
+
+async def ahedge(fn: Callable[[], Awaitable[Any]], delay: float,
+                 can_hedge: Callable[[], bool] = lambda: True) -> HedgeResult:
+    """Run fn(); if it is still pending after `delay`, race a second fn() against it."""
+    primary = asyncio.ensure_future(fn())
+    tasks = [primary]
+    started = {primary: time.time()}
+    try:
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done or not can_hedge():
+            return HedgeResult(await primary)
+
+        hedge = asyncio.ensure_future(fn())
+        tasks.append(hedge)
+        started[hedge] = time.time()
+        pending = {primary, hedge}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    loser = next(iter(pending), None)
+                    return HedgeResult(
+                        task.result(), hedged=True, hedge_won=task is hedge,
+                        loser_elapsed=time.time() - started[loser] if loser else None,
+                    )
+                error = error or task.exception()
+        raise error
+    finally:
+        # Cancels the loser, or both attempts if the caller itself went away
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
+# ═══════════════════════════════════════════════════════════════════
+#  SYNC (CLI path)
+# ═══════════════════════════════════════════════════════════════════
+
+_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> concurrent.futures.ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="llm-hedge")
+        return _executor
+
+
+def hedge_sync(fn: Callable[[], Any], delay: float,
+               can_hedge: Callable[[], bool] = lambda: True) -> HedgeResult:
+    """
+    Blocking variant. A running thread cannot be cancelled, so the losing
+    attempt finishes in the background and its result is discarded.
+    """
+    executor = _get_executor()
+    primary = executor.submit(fn)
+    done, _ = concurrent.futures.wait([primary], timeout=delay)
+    if done or not can_hedge():
+        return HedgeResult(primary.result())
+
+    hedge = executor.submit(fn)
+    pending = {primary, hedge}
+    error: Optional[BaseException] = None
+    while pending:
+        done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                return HedgeResult(future.result(), hedged=True, hedge_won=future is hedge)
+            error = error or future.exception()
+    raise error
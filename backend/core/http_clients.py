@@ -0,0 +1,125 @@
+"""
+Groq Client Registry
+
+One pooled keep-alive httpx transport (sync + async) per process, shared by
+every Groq client; clients are cached per API key and created lazily.
+"""
+
+import importlib.util
+import os
+import threading
+from typing import Dict, Optional
+
+import httpx
+from groq import AsyncGroq, Groq
+
+
+def _h2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+class ClientRegistry:
+    """Thread-safe cache of Groq clients over one shared connection pool."""
+
+    # SDK-internal retries would resend 429s behind llm_governor's back;
+    # every retry goes through the governor and its AIMD controller instead.
+    SDK_MAX_RETRIES = 0
+
+    def __init__(self, max_connections: int = 100, max_keepalive: int = 20,
+                 keepalive_expiry: float = 30.0, timeout: float = 60.0,
+                 connect_timeout: float = 5.0, http2: Optional[bool] = None):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        # None = auto: on when h2 is importable
+        self.http2 = _h2_available() if http2 is None else (http2 and _h2_available())
+        if http2 and not self.http2:
+            print("[ClientRegistry] HTTP/2 requested but 'h2' is not installed — using HTTP/1.1")
+        self._http: Optional[httpx.Client] = None
+        self._ahttp: Optional[httpx.AsyncClient] = None
+        self._sync: Dict[str, Groq] = {}
+        self._async: Dict[str, AsyncGroq] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "ClientRegistry":
+        """Build the process-wide registry from LLM_HTTP_* environment variables."""
+        http2 = os.getenv("LLM_HTTP2", "auto").strip().lower()
+        return cls(
+            max_connections=int(os.getenv("LLM_HTTP_MAX_CONNECTIONS", "100")),
+            max_keepalive=int(os.getenv("LLM_HTTP_MAX_KEEPALIVE", "20")),
+            keepalive_expiry=float(os.getenv("LLM_HTTP_KEEPALIVE_S", "30")),
+            timeout=float(os.getenv("LLM_HTTP_TIMEOUT_S", "60")),
+            connect_timeout=float(os.getenv("LLM_HTTP_CONNECT_TIMEOUT_S", "5")),
+            http2=None if http2 in ("", "auto") else http2 not in ("0", "false", "no", "off"),
+        )
+
+    # ─────────────────────────────────────────────────
+    # CLIENTS
+    # ─────────────────────────────────────────────────
+
+    def groq(self, api_key: str) -> Groq:
+        """Sync Groq client for `api_key` on the shared pool."""
+        with self._lock:
+            client = self._sync.get(api_key)
+            if client is None:
+                if self._http is None:
+                    self._http = httpx.Client(limits=self.limits, timeout=self.timeout,
+                                              http2=self.http2, follow_redirects=True)
+                client = Groq(api_key=api_key, http_client=self._http,
+                              timeout=self.timeout, max_retries=self.SDK_MAX_RETRIES)
+                self._sync[api_key] = client
+            return client
+
+    def async_groq(self, api_key: str) -> AsyncGroq:
+        """Async Groq client for `api_key` on the shared pool."""
+        with self._lock:
+            client = self._async.get(api_key)
+            if client is None:
+                if self._ahttp is None:
+                    self._ahttp = httpx.AsyncClient(limits=self.limits, timeout=self.timeout,
+                                                    http2=self.http2, follow_redirects=True)
+                client = AsyncGroq(api_key=api_key, http_client=self._ahttp,
+                                   timeout=self.timeout, max_retries=self.SDK_MAX_RETRIES)
+                self._async[api_key] = client
+            return client
+
+    # ─────────────────────────────────────────────────
+    # LIFECYCLE
+    # ─────────────────────────────────────────────────
+
+    def close(self) -> None:
+        """Close the sync pool (CLI exit)."""
+        with self._lock:
+            http, self._http = self._http, None
+            self._sync.clear()
+        if http is not None:
+            http.close()
+
+    async def aclose(self) -> None:
+        """Close both pools (API shutdown)."""
+        with self._lock:
+            ahttp, self._ahttp = self._ahttp, None
+            self._async.clear()
+        if ahttp is not None:
+            await ahttp.aclose()
+        self.close()
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "http2": self.http2,
+                "max_connections": self.limits.max_connections,
+                "max_keepalive": self.limits.max_keepalive_connections,
+                "keepalive_expiry_s": self.limits.keepalive_expiry,
+                "sync_clients": len(self._sync),
+                "async_clients": len(self._async),
+                "sync_pool_open": self._http is not None,
+                "async_pool_open": self._ahttp is not None,
+            }
+
+
+client_registry = ClientRegistry.from_env()
@@ -0,0 +1,184 @@
+"""
+Local JSON Repair
+
+Deterministic fixes for broken model JSON (comments, single quotes, Python
+literals, unquoted keys, raw control characters, trailing commas, mismatched
+or missing closers, trailing prose), applied by extract_json() before it
+gives up.
+"""
+
+import re
+import threading
+from typing import Dict, List, Tuple
+
+_LITERALS = {"True": "true", "False": "false", "None": "null", "NaN": "null",
+             "Infinity": "null", "true": "true", "false": "false", "null": "null"}
+_PARTIAL_LITERAL = re.compile(r"(?<![\w\"])(t|tr|tru|f|fa|fal|fals|n|nu|nul)$")
+_DANGLING_KEY = re.compile(r'([{,])\s*"(?:[^"\\]|\\.)*"$')
+
+
+def _read_string(text: str, i: int, repairs: set) -> Tuple[str, int]:
+    """Read a '...' or "..." string starting at text[i]; returns (double-quoted JSON, next index)."""
+    quote = text[i]
+    if quote == "'":
+        repairs.add("single_quotes")
+    buf = []
+    j = i + 1
+    n = len(text)
+    while j < n:
+        c = text[j]
+        if c == "\\":
+            if j + 1 >= n:
+                j += 1
+                break
+            nxt = text[j + 1]
+            if quote == "'" and nxt == "'":
+                buf.append("'")
+            else:
+                buf.append(c + nxt)
+            j += 2
+            continue
+        if c == quote:
+            return '"' + "".join(buf) + '"', j + 1
+        if c == '"':
+            buf.append('\\"')             # only reachable inside a '...' string
+        elif c in "\n\r\t":
+            repairs.add("control_chars")
+            buf.append({"\n": "\\n", "\r": "\\r", "\t": "\\t"}[c])
+        else:
+            buf.append(c)
+        j += 1
+    repairs.add("truncated")
+    return '"' + "".join(buf) + '"', n
+
+
+def _skip_comment(text: str, i: int) -> int:
+    if text.startswith("/*", i):
+        end = text.find("*/", i + 2)
+        return len(text) if end == -1 else end + 2
+    end = text.find("\n", i)
+    return len(text) if end == -1 else end
+
+
+def _close_truncated(body: str, stack: List[str]) -> str:
+    """Drop the half-written tail of a cut-off document and close every open container."""
+    while True:
+        body = body.rstrip()
+        if body.endswith(","):
+            body = body[:-1]
+        elif body.endswith(":"):
+            body += " null"
+        elif body and body[-1] in "-+.eE" and not body.endswith(("true", "false")):
+            body = body[:-1]
+        elif _PARTIAL_LITERAL.search(body):
+            partial = _PARTIAL_LITERAL.search(body).group(1)
+            body = body[: -len(partial)] + next(w for w in ("true", "false", "null") if w.startswith(partial))
+        elif stack and stack[-1] == "}" and _DANGLING_KEY.search(body):
+            body = body[: _DANGLING_KEY.search(body).start(1) + 1]
+        else:
+            break
+    return body + "".join(reversed(stack))
+
+
+def repair_json(text: str) -> Tuple[str, List[str]]:
+    """
+    Rewrite `text` (from the first "{" or "[") into parseable JSON where possible.
+    Returns (repaired text, sorted repair names). Never raises.
+    """
+    starts = [p for p in (text.find("{"), text.find("[")) if p != -1]
+    if not starts:
+        return text, []
+    i = min(starts)
+    n = len(text)
+    repairs: set = set()
+    out: List[str] = []
+    stack: List[str] = []
+
+    while i < n:
+        ch = text[i]
+        if ch in "\"'":
+            piece, i = _read_string(text, i, repairs)
+            out.append(piece)
+            continue
+        if ch == "#" or (ch == "/" and text.startswith(("//", "/*"), i)):
+            repairs.add("comments")
+            i = _skip_comment(text, i)
+            continue
+        if ch in "{[":
+            stack.append("}" if ch == "{" else "]")
+            out.append(ch)
+        elif ch in "}]":
+            while out and out[-1].isspace():
+                out.pop()
+            if out and out[-1] == ",":
+                out.pop()
+                repairs.add("trailing_commas")
+            if stack:
+                expected = stack.pop()
+                if ch != expected:
+                    repairs.add("mismatched_close")
+                out.append(expected)
+            if not stack:
+                i += 1
+                if text[i:].strip(" \t\r\n`"):
+                    repairs.add("trailing_text")
+                break
+        elif ch.isalpha() or ch == "_":
+            j = i
+            while j < n and (text[j].isalnum() or text[j] == "_"):
+                j += 1
+            word = text[i:j]
+            rest = text[j:].lstrip()
+            if word in _LITERALS and not rest.startswith(":"):
+                if _LITERALS[word] != word:
+                    repairs.add("python_literals")
+                out.append(_LITERALS[word])
+            elif rest.startswith(":"):
+                repairs.add("unquoted_keys")
+                out.append(f'"{word}"')
+            else:
+                out.append(word)
+            i = j
+            continue
+        else:
+            out.append(ch)
+        i += 1
+
+    body = "".join(out)
+    if stack:
+        repairs.add("truncated")
+        body = _close_truncated(body, stack)
+    return body, sorted(repairs)
+
+
+class RepairStats:
+    """Thread-safe counters: repair attempts, successes and how often each fix was needed."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.attempts = 0
+        self.repaired = 0
+        self.failed = 0
+        self.by_repair: Dict[str, int] = {}
+
+    def record(self, repairs: List[str], ok: bool) -> None:
+        with self._lock:
+            self.attempts += 1
+            if ok:
+                self.repaired += 1
+                for name in repairs:
+                    self.by_repair[name] = self.by_repair.get(name, 0) + 1
+            else:
+                self.failed += 1
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "attempts": self.attempts,
+                "repaired": self.repaired,
+                "failed": self.failed,
+                "by_repair": dict(self.by_repair),
+            }
+
+
+json_repair_stats = RepairStats()
@@ -0,0 +1,146 @@
+"""
+Incremental JSON Validation
+
+Checks the shape of a JSON document (root type, array item counts) while the
+model is still streaming it, so a diverging completion can be aborted early.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+
+class StreamDiverged(ValueError):
+    """Streamed output no longer matches the expected shape."""
+
+    def __init__(self, reason: str, chars: int = 0):
+        super().__init__(reason)
+        self.reason = reason
+        self.chars = chars
+
+
+@dataclass(frozen=True)
+class StreamShape:
+    """
+    Expected structure of a streamed JSON document.
+
+    root   : "object" | "array" | None (any)
+    arrays : path → (min_items, max_items); None for an unbounded side.
+             Paths use object keys joined by "." and "[]" for array items,
+             e.g. {"steps": (5, 5), "steps[].actions": (4, 4)}.
+    """
+    root: Optional[str] = "object"
+    arrays: Dict[str, Tuple[Optional[int], Optional[int]]] = field(default_factory=dict)
+
+
+class _Frame:
+    __slots__ = ("kind", "path", "key", "count", "expect")
+
+    def __init__(self, kind: str, path: str):
+        self.kind = kind          # "obj" | "arr"
+        self.path = path          # dotted path of this container
+        self.key = None           # current key (objects)
+        self.count = 0            # keys (objects) / items (arrays) started so far
+        self.expect = "key" if kind == "obj" else "value"
+
+
+class IncrementalJSONValidator:
+    """Feed streamed text chunks; raises StreamDiverged as soon as the shape is violated."""
+
+    def __init__(self, shape: StreamShape):
+        self.shape = shape
+        self.chars = 0
+        self.complete = False
+        self._stack: List[_Frame] = []
+        self._started = False
+        self._in_string = False
+        self._escape = False
+        self._key_buf: Optional[List[str]] = None
+
+    def feed(self, chunk: str) -> bool:
+        """Consume a chunk. Returns True once the top-level value has closed."""
+        for ch in chunk:
+            if self.complete:
+                break
+            self.chars += 1
+            self._step(ch)
+        return self.complete
+
+    # ─────────────────────────────────────────────────
+    # STATE MACHINE
+    # ─────────────────────────────────────────────────
+
+    def _step(self, ch: str) -> None:
+        if self._in_string:
+            if self._escape:
+                self._escape = False
+            elif ch == "\\":
+                self._escape = True
+            elif ch == '"':
+                self._in_string = False
+                if self._key_buf is not None:
+                    top = self._stack[-1]
+                    top.key = "".join(self._key_buf)
+                    top.expect = "colon"
+                    self._key_buf = None
+            elif self._key_buf is not None:
+                self._key_buf.append(ch)
+            return
+
+        if not self._started:
+            if ch in "{[":
+                kind = "object" if ch == "{" else "array"
+                if self.shape.root and self.shape.root != kind:
+                    self._diverge(f"expected a JSON {self.shape.root} at the top level, got an {kind}")
+                self._started = True
+                self._stack.append(_Frame("obj" if ch == "{" else "arr", ""))
+            return
+
+        if ch in " \t\r\n":
+            return
+        top = self._stack[-1]
+
+        if ch == '"':
+            if top.kind == "obj" and top.expect == "key":
+                top.count += 1
+                self._key_buf = []
+            else:
+                self._value_start(top)
+            self._in_string = True
+        elif ch == ":":
+            top.expect = "value"
+        elif ch == ",":
+            top.expect = "key" if top.kind == "obj" else "value"
+        elif ch in "{[":
+            path = self._child_path(top)
+            self._value_start(top)
+            self._stack.append(_Frame("obj" if ch == "{" else "arr", path))
+        elif ch in "}]":
+            frame = self._stack.pop()
+            if frame.kind == "arr":
+                self._check_closed(frame)
+            if not self._stack:
+                self.complete = True
+        elif top.expect == "value":
+            self._value_start(top)        # number / true / false / null
+
+    def _child_path(self, frame: _Frame) -> str:
+        if frame.kind == "arr":
+            return f"{frame.path}[]"
+        return f"{frame.path}.{frame.key}" if frame.path else str(frame.key)
+
+    def _value_start(self, frame: _Frame) -> None:
+        frame.expect = "comma"
+        if frame.kind != "arr":
+            return
+        frame.count += 1
+        bounds = self.shape.arrays.get(frame.path)
+        if bounds and bounds[1] is not None and frame.count > bounds[1]:
+            self._diverge(f"'{frame.path}' has more than {bounds[1]} items")
+
+    def _check_closed(self, frame: _Frame) -> None:
+        bounds = self.shape.arrays.get(frame.path)
+        if bounds and bounds[0] is not None and frame.count < bounds[0]:
+            self._diverge(f"'{frame.path}' closed with {frame.count} items, expected at least {bounds[0]}")
+
+    def _diverge(self, reason: str) -> None:
+        raise StreamDiverged(reason, self.chars)
@@ -0,0 +1,274 @@
+"""
+LLM Response Cache
+
+Content-addressed LRU + per-agent TTL cache for call_llm() responses, with an
+optional SQLite store so entries survive restarts. The async API reaches the
+SQLite store from a worker thread, never from the event loop.
+"""
+
+import asyncio
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+# Default TTLs (seconds) per agent name. Market prompts embed today's date,
+# so a market entry naturally expires with the day even before its TTL.
+DEFAULT_TTLS: Dict[str, int] = {
+    "MarketIntelligenceAgent":  24 * 3600,
+    "ReroutingAgent":           24 * 3600,
+    "ResumeAnalyzerAgent":      24 * 3600,
+    "RoadmapAgent":             3600,
+    "ReadinessAssessmentAgent": 3600,
+    "ActionAssessmentAgent":    3600,
+    "FeedbackAgent":            3600,
+    "default":                  600,
+}
+
+
+def _parse_ttls(raw: str) -> Dict[str, int]:
+    """Parse "Agent=seconds,Agent2=seconds" overrides from the environment."""
+    ttls = {}
+    for part in raw.split(","):
+        if "=" not in part:
+            continue
+        name, _, value = part.partition("=")
+        try:
+            ttls[name.strip()] = int(value.strip())
+        except ValueError:
+            print(f"[LLMCache] Ignoring invalid TTL override: {part.strip()}")
+    return ttls
+
+
+class LLMCache:
+    """
+    Thread-safe LRU + TTL cache for raw LLM completions.
+    Shared by the sync (CLI) and async (API) call paths.
+    """
+
+    def __init__(self, max_entries: int = 512, ttls: Optional[Dict[str, int]] = None,
+                 db_path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.ttls = dict(DEFAULT_TTLS)
+        self.ttls.update(ttls or {})
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()   # key → (value, expires_at, latency)
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()      # serialises the shared SQLite connection
+        self._db = None
+        self._stats = {
+            "hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "saved_latency_seconds": 0.0,
+        }
+        self._agent_stats: Dict[str, Dict[str, int]] = {}
+        if db_path:
+            self._open_db(db_path)
+
+    @classmethod
+    def from_env(cls) -> "LLMCache":
+        """Build the process-wide cache from LLM_CACHE_* environment variables."""
+        return cls(
+            max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "512")),
+            ttls=_parse_ttls(os.getenv("LLM_CACHE_TTLS", "")),
+            db_path=os.getenv("LLM_CACHE_DB", "").strip() or None,
+        )
+
+    # ─────────────────────────────────────────────────
+    # DISK STORE
+    # ─────────────────────────────────────────────────
+
+    def _open_db(self, db_path: str) -> None:
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                " key TEXT PRIMARY KEY, value TEXT NOT NULL,"
+                " expires_at REAL NOT NULL, latency REAL NOT NULL DEFAULT 0)"
+            )
+            self._db.execute("DELETE FROM llm_cache WHERE expires_at < ?", (time.time(),))
+            self._db.commit()
+            print(f"[LLMCache] ✓ Disk store → {db_path}")
+        except Exception as e:
+            print(f"[LLMCache] ⚠ Disk store unavailable ({str(e)[:50]}) — memory only")
+            self._db = None
+
+    def _db_get(self, key: str) -> Optional[tuple]:
+        if self._db is None:
+            return None
+        try:
+            with self._db_lock:
+                return self._db.execute(
+                    "SELECT value, expires_at, latency FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+        except Exception as e:
+            print(f"[LLMCache] disk read error: {str(e)[:50]}")
+            return None
+
+    def _db_set(self, key: str, value: str, expires_at: float, latency: float) -> None:
+        if self._db is None:
+            return
+        try:
+            with self._db_lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, value, expires_at, latency) VALUES (?, ?, ?, ?)",
+                    (key, value, expires_at, latency),
+                )
+                self._db.commit()
+        except Exception as e:
+            print(f"[LLMCache] disk write error: {str(e)[:50]}")
+
+    def _db_delete(self, key: str) -> None:
+        if self._db is None:
+            return
+        try:
+            with self._db_lock:
+                self._db.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._db.commit()
+        except Exception as e:
+            print(f"[LLMCache] disk delete error: {str(e)[:50]}")
+
+    # ─────────────────────────────────────────────────
+    # CORE OPERATIONS
+    # ─────────────────────────────────────────────────
+
+    @staticmethod
+    def make_key(model: str, system_prompt: str, user_prompt: str, max_tokens: int) -> str:
+        """Content address of one LLM request."""
+        h = hashlib.sha256()
+        for part in (model, system_prompt, user_prompt, str(max_tokens)):
+            h.update(part.encode("utf-8"))
+            h.update(b"\x00")
+        return h.hexdigest()
+
+    def ttl_for(self, agent: str) -> int:
+        return self.ttls.get(agent, self.ttls.get("default", 0))
+
+    def _count(self, agent: str, field: str) -> None:
+        self._stats[field] += 1
+        per_agent = self._agent_stats.setdefault(agent, {"hits": 0, "misses": 0})
+        if field in per_agent:
+            per_agent[field] += 1
+
+    def get(self, key: str, agent: str = "default") -> Optional[str]:
+        """Return a cached completion or None. Counts a hit or a miss."""
+        if self.ttl_for(agent) <= 0:
+            return None
+        entry = self._memory_get(key)
+        if entry is None:
+            entry = self._disk_get(key)
+        return self._record(key, agent, entry)
+
+    async def aget(self, key: str, agent: str = "default") -> Optional[str]:
+        """Async get(): a memory miss is looked up on disk in a worker thread."""
+        if self.ttl_for(agent) <= 0:
+            return None
+        entry = self._memory_get(key)
+        if entry is None and self._db is not None:
+            entry = await asyncio.to_thread(self._disk_get, key)
+        return self._record(key, agent, entry)
+
+    def set(self, key: str, value: str, agent: str = "default", latency: float = 0.0) -> None:
+        """Store a completion under the agent's TTL (no-op when TTL is 0)."""
+        entry = self._memory_set(key, value, agent, latency)
+        if entry is not None:
+            self._db_set(key, *entry)
+
+    async def aset(self, key: str, value: str, agent: str = "default", latency: float = 0.0) -> None:
+        """Async set(): the memory tier is updated at once, the disk write in a worker thread."""
+        entry = self._memory_set(key, value, agent, latency)
+        if entry is not None and self._db is not None:
+            await asyncio.to_thread(self._db_set, key, *entry)
+
+    def _memory_get(self, key: str) -> Optional[tuple]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] < time.time():
+                del self._entries[key]
+                entry = None
+            return entry
+
+    def _disk_get(self, key: str) -> Optional[tuple]:
+        row = self._db_get(key)
+        if row is None or row[1] < time.time():
+            return None
+        entry = (row[0], row[1], row[2])
+        with self._lock:
+            self._insert(key, entry)
+            self._stats["disk_hits"] += 1
+        return entry
+
+    def _record(self, key: str, agent: str, entry: Optional[tuple]) -> Optional[str]:
+        with self._lock:
+            if entry is None:
+                self._count(agent, "misses")
+                return None
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            self._count(agent, "hits")
+            self._stats["saved_latency_seconds"] += entry[2]
+            return entry[0]
+
+    def _memory_set(self, key: str, value: str, agent: str, latency: float) -> Optional[tuple]:
+        ttl = self.ttl_for(agent)
+        if ttl <= 0 or not value:
+            return None
+        entry = (value, time.time() + ttl, latency)
+        with self._lock:
+            self._insert(key, entry)
+            self._stats["stores"] += 1
+        return entry
+
+    def discard(self, key: str) -> None:
+        """Drop one entry (a response the caller rejected) from memory and disk."""
+        with self._lock:
+            self._entries.pop(key, None)
+        self._db_delete(key)
+
+    async def adiscard(self, key: str) -> None:
+        """Async discard(): the disk delete runs in a worker thread."""
+        with self._lock:
+            self._entries.pop(key, None)
+        if self._db is not None:
+            await asyncio.to_thread(self._db_delete, key)
+
+    def _insert(self, key: str, entry: tuple) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        if self._db is not None:
+            try:
+                with self._db_lock:
+                    self._db.execute("DELETE FROM llm_cache")
+                    self._db.commit()
+            except Exception:
+                pass
+
+    # ─────────────────────────────────────────────────
+    # STATS
+    # ─────────────────────────────────────────────────
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "saved_latency_seconds": round(self._stats["saved_latency_seconds"], 2),
+                "hit_ratio": round(self._stats["hits"] / lookups, 3) if lookups else 0.0,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "disk_store": self._db is not None,
+                "by_agent": {k: dict(v) for k, v in self._agent_stats.items()},
+            }
@@ -0,0 +1,335 @@
+"""
+LLM Admission Governor
+
+Process-wide gate in front of every Groq call: RPM / TPM token buckets,
+AIMD-adjusted concurrency and priority classes for queued callers.
+"""
+
+import asyncio
+import heapq
+import itertools
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+# ── Priority classes (lower = admitted first) ─────────────────────
+INTERACTIVE = 0
+NORMAL      = 1
+BACKGROUND  = 2
+
+PRIORITY_NAMES = {INTERACTIVE: "interactive", NORMAL: "normal", BACKGROUND: "background"}
+
+# Default priority per agent — a user is waiting on a screen for the
+# interactive ones; market refreshes can wait behind them.
+AGENT_PRIORITY: Dict[str, int] = {
+    "ReadinessAssessmentAgent": INTERACTIVE,
+    "ActionAssessmentAgent":    INTERACTIVE,
+    "ReroutingAgent":           INTERACTIVE,
+    "HandsOnAgent":             INTERACTIVE,
+    "ResumeAnalyzerAgent":      NORMAL,
+    "RoadmapAgent":             NORMAL,
+    "FeedbackAgent":            NORMAL,
+    "MarketIntelligenceAgent":  BACKGROUND,
+}
+
+
+class LLMThrottledError(RuntimeError):
+    """Raised when Groq keeps throttling or the admission queue is saturated."""
+
+    def __init__(self, message: str, retry_after: float = 5.0):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def estimate_tokens(*texts: str) -> int:
+    """Cheap token estimate (~4 characters per token)."""
+    return sum(len(t) for t in texts) // 4 + 1
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at `per_minute / 60` per second."""
+
+    def __init__(self, per_minute: float):
+        self.per_minute = per_minute
+        self.capacity = per_minute
+        self._level = per_minute
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def unlimited(self) -> bool:
+        return self.per_minute <= 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._level = min(self.capacity, self._level + (now - self._stamp) * self.per_minute / 60.0)
+        self._stamp = now
+
+    def delay(self, amount: float) -> float:
+        """Seconds until `amount` could be taken (0 = available now)."""
+        if self.unlimited:
+            return 0.0
+        with self._lock:
+            self._refill()
+            amount = min(amount, self.capacity)
+            if self._level >= amount:
+                return 0.0
+            return (amount - self._level) * 60.0 / self.per_minute
+
+    def take(self, amount: float) -> float:
+        """
+        Take `amount` now, going into debt if needed.
+        Returns the seconds the caller should wait to honour the budget.
+        """
+        if self.unlimited:
+            return 0.0
+        with self._lock:
+            self._refill()
+            amount = min(amount, self.capacity)
+            self._level -= amount
+            if self._level >= 0:
+                return 0.0
+            return -self._level * 60.0 / self.per_minute
+
+    @property
+    def level(self) -> float:
+        if self.unlimited:
+            return float("inf")
+        with self._lock:
+            self._refill()
+            return self._level
+
+
+class LLMGovernor:
+    """
+    Admission control for LLM calls.
+
+    Async path:  permit = await governor.acquire(priority, tokens) ... governor.release(...)
+    Sync path :  governor.acquire_sync(tokens) ... governor.release_sync(...)
+                 — worker threads (CLI, hedged duplicates) share the AIMD limit
+                 but hold their own slot count, since they never touch the loop
+    """
+
+    def __init__(self, rpm: float = 0, tpm: float = 0, max_concurrency: int = 16,
+                 min_concurrency: int = 1, latency_target: float = 30.0,
+                 queue_timeout: float = 90.0, max_retries: int = 3):
+        self.requests = TokenBucket(rpm)
+        self.tokens = TokenBucket(tpm)
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_concurrency = max(1, min(min_concurrency, self.max_concurrency))
+        self.latency_target = latency_target
+        self.queue_timeout = queue_timeout
+        self.max_retries = max_retries
+
+        self._limit = float(self.max_concurrency)
+        self._in_flight = 0
+        self._sync_in_flight = 0
+        self._sync_slots = threading.Condition()
+        self._healthy_streak = 0
+        self._waiters: list = []          # heap of (priority, seq, future, tokens)
+        self._seq = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._stats = {
+            "admitted": 0,
+            "queued": 0,
+            "queue_timeouts": 0,
+            "throttled_429": 0,
+            "limit_decreases": 0,
+            "limit_increases": 0,
+        }
+        self._admitted_by_priority = {name: 0 for name in PRIORITY_NAMES.values()}
+
+    @classmethod
+    def from_env(cls) -> "LLMGovernor":
+        """Build the process-wide governor from LLM_* environment variables."""
+        return cls(
+            rpm=float(os.getenv("LLM_RPM", "0")),
+            tpm=float(os.getenv("LLM_TPM", "0")),
+            max_concurrency=int(os.getenv("LLM_MAX_CONCURRENCY", "16")),
+            min_concurrency=int(os.getenv("LLM_MIN_CONCURRENCY", "1")),
+            latency_target=float(os.getenv("LLM_LATENCY_TARGET_S", "30")),
+            queue_timeout=float(os.getenv("LLM_QUEUE_TIMEOUT_S", "90")),
+            max_retries=int(os.getenv("LLM_MAX_RETRIES", "3")),
+        )
+
+    @staticmethod
+    def priority_for(agent: str, priority: Optional[int] = None) -> int:
+        if priority is not None:
+            return priority
+        return AGENT_PRIORITY.get(agent, NORMAL)
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def has_capacity(self) -> bool:
+        """True when a new call would be admitted without queueing (used before hedging)."""
+        if self._in_flight >= self.limit:
+            return False
+        return not any(not w[2].done() for w in self._waiters)
+
+    # ─────────────────────────────────────────────────
+    # ASYNC ADMISSION
+    # ─────────────────────────────────────────────────
+
+    async def acquire(self, priority: int = NORMAL, tokens: int = 1) -> None:
+        """Wait for an admission slot. Raises LLMThrottledError after queue_timeout."""
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), fut, tokens))
+        self._dispatch()
+        if not fut.done():
+            self._stats["queued"] += 1
+        try:
+            await asyncio.wait_for(asyncio.shield(fut), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            if fut.done() and not fut.cancelled():
+                return      # admitted at the very last moment
+            fut.cancel()
+            self._stats["queue_timeouts"] += 1
+            raise LLMThrottledError(
+                "LLM capacity saturated — request waited too long in the queue. Please retry.",
+                retry_after=max(1.0, self.requests.delay(1)),
+            )
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                self.release(ok=True)     # admitted but caller went away
+            else:
+                fut.cancel()
+            raise
+        self._admitted_by_priority[PRIORITY_NAMES.get(priority, "normal")] += 1
+
+    def release(self, ok: bool = True, latency: Optional[float] = None,
+                throttled: bool = False) -> None:
+        """Return a slot and feed the outcome to the AIMD controller."""
+        self._in_flight = max(0, self._in_flight - 1)
+        if throttled:
+            self.on_throttled()
+        elif ok and latency is not None:
+            self._observe_latency(latency)
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Admit queued waiters, highest priority first, while slots and budget allow."""
+        while self._waiters:
+            priority, _, fut, tokens = self._waiters[0]
+            if fut.done():
+                heapq.heappop(self._waiters)
+                continue
+            if self._in_flight >= self.limit:
+                return
+            wait = max(self.requests.delay(1), self.tokens.delay(tokens))
+            if wait > 0:
+                self._schedule(wait)
+                return
+            heapq.heappop(self._waiters)
+            self.requests.take(1)
+            self.tokens.take(tokens)
+            self._in_flight += 1
+            self._stats["admitted"] += 1
+            fut.set_result(None)
+
+    def _schedule(self, wait: float) -> None:
+        if self._timer is not None and not self._timer.cancelled():
+            self._timer.cancel()
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._timer = loop.call_later(wait, self._dispatch)
+
+    # ─────────────────────────────────────────────────
+    # SYNC PATH (CLI)
+    # ─────────────────────────────────────────────────
+
+    def acquire_sync(self, tokens: int = 1) -> None:
+        """
+        Block until a sync slot is free and the rate budget allows one more
+        request. Raises LLMThrottledError after queue_timeout.
+        """
+        deadline = time.monotonic() + self.queue_timeout
+        with self._sync_slots:
+            if self._sync_in_flight >= self.limit:
+                self._stats["queued"] += 1
+            while self._sync_in_flight >= self.limit:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._stats["queue_timeouts"] += 1
+                    raise LLMThrottledError(
+                        "LLM capacity saturated — request waited too long in the queue. Please retry.",
+                        retry_after=max(1.0, self.requests.delay(1)),
+                    )
+                self._sync_slots.wait(min(remaining, 1.0))   # the async path may raise the limit
+            self._sync_in_flight += 1
+            self._stats["admitted"] += 1
+        delay = max(self.requests.take(1), self.tokens.take(tokens))
+        if delay > 0:
+            time.sleep(delay)
+
+    def release_sync(self, ok: bool = True, latency: Optional[float] = None,
+                     throttled: bool = False) -> None:
+        """Sync twin of release()."""
+        with self._sync_slots:
+            self._sync_in_flight = max(0, self._sync_in_flight - 1)
+            if throttled:
+                self.on_throttled()
+            elif ok and latency is not None:
+                self._observe_latency(latency)
+            self._sync_slots.notify_all()
+
+    # ─────────────────────────────────────────────────
+    # AIMD CONTROLLER
+    # ─────────────────────────────────────────────────
+
+    def on_throttled(self) -> None:
+        """Multiplicative decrease on a 429 from Groq."""
+        self._stats["throttled_429"] += 1
+        self._decrease()
+
+    def _observe_latency(self, latency: float) -> None:
+        if self.latency_target and latency > self.latency_target:
+            self._decrease()
+            return
+        # Additive increase: +1 slot after `limit` consecutive healthy calls
+        self._healthy_streak += 1
+        if self._healthy_streak >= self.limit and self._limit < self.max_concurrency:
+            self._limit = min(self.max_concurrency, self._limit + 1)
+            self._healthy_streak = 0
+            self._stats["limit_increases"] += 1
+
+    def _decrease(self) -> None:
+        self._healthy_streak = 0
+        new_limit = max(self.min_concurrency, self._limit / 2)
+        if new_limit < self._limit:
+            self._limit = new_limit
+            self._stats["limit_decreases"] += 1
+
+    # ─────────────────────────────────────────────────
+    # STATS
+    # ─────────────────────────────────────────────────
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            **self._stats,
+            "concurrency_limit": self.limit,
+            "in_flight": self._in_flight,
+            "sync_in_flight": self._sync_in_flight,
+            "queue_depth": sum(1 for w in self._waiters if not w[2].done()),
+            "admitted_by_priority": dict(self._admitted_by_priority),
+            "rpm_budget": self.requests.per_minute,
+            "tpm_budget": self.tokens.per_minute,
+        }
+
+
+def retry_after_seconds(exc: Exception, attempt: int) -> float:
+    """Backoff for a 429: honour Retry-After when Groq sends it, else exponential."""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        value = float(headers.get("retry-after", ""))
+        if value > 0:
+            return min(value, 60.0)
+    except (TypeError, ValueError):
+        pass
+    return min(2.0 ** attempt, 30.0)
@@ -0,0 +1,187 @@
+"""
+Model Router
+
+Maps each agent operation to a "fast" or "heavy" model tier and orders the
+tier's models per call from live latency / error stats.
+"""
+
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+FAST  = "fast"
+HEAVY = "heavy"
+
+DEFAULT_TIER_MODELS: Dict[str, List[str]] = {
+    HEAVY: ["openai/gpt-oss-120b", "llama-3.3-70b-versatile"],
+    FAST:  ["openai/gpt-oss-20b", "llama-3.1-8b-instant", "openai/gpt-oss-120b"],
+}
+
+# Seconds a call in the tier may take (EWMA) before a fallback is preferred
+TIER_LATENCY_BUDGET: Dict[str, float] = {FAST: 8.0, HEAVY: 45.0}
+
+# Agent.op → tier. Anything not listed uses the heavy tier.
+DEFAULT_ROUTES: Dict[str, str] = {
+    "ReadinessAssessmentAgent.questions":   FAST,
+    "ActionAssessmentAgent.questions":      FAST,
+    "ReroutingAgent.safer_roles":           FAST,
+    "ResumeAnalyzerAgent.extract_skills":   FAST,
+    "MarketIntelligenceAgent.run":          FAST,
+    "ResumeAnalyzerAgent.parse_resume":     HEAVY,
+    "ReadinessAssessmentAgent.evaluate":    HEAVY,
+    "ActionAssessmentAgent.evaluate":       HEAVY,
+    "RoadmapAgent.run":                     HEAVY,
+    "FeedbackAgent.run":                    HEAVY,
+    "HandsOnAgent.chat":                    HEAVY,
+}
+
+
+def _parse_pairs(raw: str) -> Dict[str, str]:
+    """Parse "Agent.op=tier,..." overrides from the environment."""
+    pairs = {}
+    for part in raw.split(","):
+        if "=" in part:
+            name, _, value = part.partition("=")
+            pairs[name.strip()] = value.strip()
+    return pairs
+
+
+def _parse_models(raw: Optional[str], default: List[str]) -> List[str]:
+    if not raw:
+        return list(default)
+    return [m.strip() for m in raw.split(",") if m.strip()]
+
+
+class _ModelHealth:
+    __slots__ = ("calls", "errors", "consecutive_errors", "cooldown_until")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.consecutive_errors = 0
+        self.cooldown_until = 0.0
+
+
+class ModelRouter:
+    """Thread-safe tier routing with latency-aware fallback ordering."""
+
+    def __init__(self, default_model: str, routes: Optional[Dict[str, str]] = None,
+                 tier_models: Optional[Dict[str, List[str]]] = None, enabled: bool = True,
+                 error_threshold: int = 3, cooldown: float = 30.0,
+                 slow_factor: float = 1.5, alpha: float = 0.2, probe_every: int = 20):
+        self.default_model = default_model
+        self.routes = dict(DEFAULT_ROUTES)
+        self.routes.update(routes or {})
+        self.tier_models = {tier: list(models) for tier, models in (tier_models or DEFAULT_TIER_MODELS).items()}
+        self.enabled = enabled
+        self.error_threshold = error_threshold
+        self.cooldown = cooldown
+        self.slow_factor = slow_factor
+        self.alpha = alpha
+        self.probe_every = probe_every
+        self._demotions = 0
+        self._health: Dict[str, _ModelHealth] = {}
+        self._ewma: Dict[Tuple[str, str], float] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, default_model: str) -> "ModelRouter":
+        """Build the process-wide router from LLM_ROUTING / LLM_ROUTES / LLM_MODELS_* variables."""
+        return cls(
+            default_model=default_model,
+            routes=_parse_pairs(os.getenv("LLM_ROUTES", "")),
+            tier_models={
+                HEAVY: _parse_models(os.getenv("LLM_MODELS_HEAVY"), DEFAULT_TIER_MODELS[HEAVY]),
+                FAST:  _parse_models(os.getenv("LLM_MODELS_FAST"), DEFAULT_TIER_MODELS[FAST]),
+            },
+            enabled=os.getenv("LLM_ROUTING", "true").strip().lower() not in ("0", "false", "no", "off"),
+            error_threshold=int(os.getenv("LLM_ROUTER_ERROR_THRESHOLD", "3")),
+            cooldown=float(os.getenv("LLM_ROUTER_COOLDOWN_S", "30")),
+        )
+
+    # ─────────────────────────────────────────────────
+    # ROUTING
+    # ─────────────────────────────────────────────────
+
+    def tier_for(self, agent: str, op: str) -> str:
+        return self.routes.get(f"{agent}.{op}", HEAVY)
+
+    def primary(self, agent: str, op: str) -> str:
+        """Configured first-choice model (stable — used in cache keys)."""
+        if not self.enabled:
+            return self.default_model
+        models = self.tier_models.get(self.tier_for(agent, op)) or [self.default_model]
+        return models[0]
+
+    def candidates(self, agent: str, op: str) -> List[str]:
+        """Models to try for this call, best first."""
+        if not self.enabled:
+            return [self.default_model]
+        tier = self.tier_for(agent, op)
+        models = list(dict.fromkeys(self.tier_models.get(tier) or [self.default_model]))
+        key = f"{agent}.{op}"
+        now = time.time()
+        with self._lock:
+            healthy = [m for m in models if self._health.get(m, _ModelHealth()).cooldown_until <= now]
+            cooling = [m for m in models if m not in healthy]
+            if len(healthy) >= 2 and self._too_slow(healthy[0], healthy[1], key, tier):
+                self._demotions += 1
+                if self._demotions % self.probe_every:
+                    healthy[0], healthy[1] = healthy[1], healthy[0]
+        return healthy + cooling
+
+    def _too_slow(self, primary: str, alternative: str, key: str, tier: str) -> bool:
+        ours = self._ewma.get((primary, key))
+        if ours is None:
+            return False
+        theirs = self._ewma.get((alternative, key))
+        if theirs is not None and ours > theirs * self.slow_factor:
+            return True
+        return ours > TIER_LATENCY_BUDGET.get(tier, float("inf")) and (theirs is None or theirs < ours)
+
+    # ─────────────────────────────────────────────────
+    # FEEDBACK
+    # ─────────────────────────────────────────────────
+
+    def record(self, model: str, agent: str, op: str, ok: bool,
+               latency: Optional[float] = None, throttled: bool = False) -> None:
+        """
+        Feed one call outcome back into the model's latency / health stats.
+        A 429 (`throttled`) is counted but never starts a cooldown: it is a
+        rate limit on the account, which llm_governor already backs off from.
+        """
+        key = (model, f"{agent}.{op}")
+        with self._lock:
+            health = self._health.setdefault(model, _ModelHealth())
+            health.calls += 1
+            if ok:
+                health.consecutive_errors = 0
+                if latency is not None:
+                    prev = self._ewma.get(key)
+                    self._ewma[key] = latency if prev is None else prev + self.alpha * (latency - prev)
+                return
+            health.errors += 1
+            if throttled:
+                return
+            health.consecutive_errors += 1
+            if health.consecutive_errors >= self.error_threshold:
+                health.cooldown_until = time.time() + self.cooldown
+                health.consecutive_errors = 0
+                print(f"[ModelRouter] ⚠ {model} cooling down for {self.cooldown:.0f}s after repeated errors")
+
+    def stats(self) -> Dict[str, object]:
+        now = time.time()
+        with self._lock:
+            models = {
+                model: {
+                    "calls": h.calls,
+                    "errors": h.errors,
+                    "cooldown_remaining_s": round(max(0.0, h.cooldown_until - now), 1),
+                    "ewma_latency_s": {
+                        op: round(v, 3) for (m, op), v in self._ewma.items() if m == model
+                    },
+                }
+                for model, h in self._health.items()
+            }
+        return {"enabled": self.enabled, "tiers": self.tier_models, "models": models}
@@ -0,0 +1,78 @@
+"""
+Prefetch Scheduler
+
+Rate-limited background work done before the user asks for it, e.g.
+pre-generating questions for the next pending roadmap actions.
+"""
+
+import asyncio
+import os
+from typing import Awaitable, Callable, Dict, Hashable, List, Tuple
+
+from backend.core.background_jobs import BackgroundJobs
+from backend.core.llm_governor import TokenBucket
+
+PrefetchItem = Tuple[str, Callable[[], Awaitable[bool]]]   # (label, fn → True if work was done)
+
+
+class Prefetcher:
+    """Rate-limited, cancellable per-owner background prefetch."""
+
+    def __init__(self, name: str = "prefetch", ahead: int = 2, concurrency: int = 2,
+                 per_minute: float = 30.0, can_run: Callable[[], bool] = lambda: True,
+                 enabled: bool = True):
+        self.name = name
+        self.ahead = ahead
+        self.enabled = enabled
+        self._can_run = can_run
+        self._bucket = TokenBucket(per_minute)
+        self._concurrency = concurrency
+        self._sem = None
+        self._jobs = BackgroundJobs(name)
+        self._stats = {"items": 0, "fetched": 0, "already_warm": 0, "skipped": 0, "failed": 0}
+
+    @classmethod
+    def from_env(cls, can_run: Callable[[], bool] = lambda: True) -> "Prefetcher":
+        """Build the process-wide prefetcher from PREFETCH_* environment variables."""
+        return cls(
+            ahead=int(os.getenv("PREFETCH_AHEAD", "2")),
+            concurrency=int(os.getenv("PREFETCH_CONCURRENCY", "2")),
+            per_minute=float(os.getenv("PREFETCH_PER_MINUTE", "30")),
+            can_run=can_run,
+            enabled=os.getenv("PREFETCH", "true").strip().lower() not in ("0", "false", "no", "off"),
+        )
+
+    def schedule(self, owner: Hashable, items: List[PrefetchItem]) -> None:
+        """Replace `owner`'s prefetch job with one working through `items` in order."""
+        if not self.enabled or not items:
+            return
+        self._jobs.start(owner, lambda: self._run(owner, items))
+
+    def cancel(self, owner: Hashable) -> bool:
+        return self._jobs.cancel(owner)
+
+    async def _run(self, owner: Hashable, items: List[PrefetchItem]) -> None:
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(self._concurrency)
+        for label, fn in items:
+            self._stats["items"] += 1
+            if not self._can_run() or self._bucket.delay(1) > 0:
+                self._stats["skipped"] += 1
+                continue
+            async with self._sem:
+                try:
+                    did_work = await fn()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    self._stats["failed"] += 1
+                    print(f"[Prefetch:{self.name}] {owner!r} {label} failed: {e}")
+                    continue
+            if did_work:
+                self._bucket.take(1)
+                self._stats["fetched"] += 1
+            else:
+                self._stats["already_warm"] += 1
+
+    def stats(self) -> Dict[str, object]:
+        return {"enabled": self.enabled, **self._stats, "jobs": self._jobs.stats()}
@@ -0,0 +1,184 @@
+"""
+Prompt Builder
+
+Shared prompt construction for every agent: schemas compiled once with
+named slots, and variable inputs trimmed to per-agent token budgets.
+"""
+
+import json
+import os
+import re
+import threading
+from typing import Any, Dict, List, Optional
+
+from .llm_governor import estimate_tokens
+
+CHARS_PER_TOKEN = 4
+
+# Default token budgets per "Agent.field". 0 = unlimited.
+DEFAULT_BUDGETS: Dict[str, int] = {
+    "ResumeAnalyzerAgent.resume_text":         1000,
+    "ResumeAnalyzerAgent.skills_resume_text":  1500,
+    "ReadinessAssessmentAgent.skills":         150,
+    "ReadinessAssessmentAgent.strengths":      100,
+    "ReadinessAssessmentAgent.qa":             1500,
+    "RoadmapAgent.strengths":                  100,
+    "RoadmapAgent.weaknesses":                 100,
+    "RoadmapAgent.skills":                     150,
+    "ActionAssessmentAgent.qa":                1200,
+}
+
+
+def _parse_budgets(raw: str) -> Dict[str, int]:
+    """Parse "Agent.field=tokens,..." overrides from the environment."""
+    budgets = {}
+    for part in raw.split(","):
+        if "=" not in part:
+            continue
+        name, _, value = part.partition("=")
+        try:
+            budgets[name.strip()] = int(value.strip())
+        except ValueError:
+            print(f"[PromptBuilder] Ignoring invalid budget override: {part.strip()}")
+    return budgets
+
+
+# ═══════════════════════════════════════════════════════════════════
+#  COMPILED SCHEMAS
+# ═══════════════════════════════════════════════════════════════════
+
+class CompiledSchema:
+    """
+    A schema serialized once to compact JSON.
+
+    String values written as "{{name}}" are slots: render(name=value)
+    replaces the quoted slot with json.dumps(value), so dynamic fields
+    (role title, dates, progress) stay valid JSON.
+    """
+
+    _SLOT = re.compile(r'"\{\{(\w+)\}\}"')
+
+    def __init__(self, schema: Any):
+        self.text = json.dumps(schema, separators=(",", ":"), ensure_ascii=False)
+        self.slots = set(self._SLOT.findall(self.text))
+
+    def render(self, **values: Any) -> str:
+        if not self.slots:
+            return self.text
+        missing = self.slots - values.keys()
+        if missing:
+            raise KeyError(f"CompiledSchema missing values for: {', '.join(sorted(missing))}")
+        return self._SLOT.sub(lambda m: json.dumps(values[m.group(1)], ensure_ascii=False), self.text)
+
+
+def compile_schema(schema: Any) -> CompiledSchema:
+    return CompiledSchema(schema)
+
+
+# ═══════════════════════════════════════════════════════════════════
+#  TRIMMING
+# ═══════════════════════════════════════════════════════════════════
+
+def compact_text(text: str) -> str:
+    """Collapse runs of spaces/tabs and blank lines (PDF extraction is full of them)."""
+    text = re.sub(r"[ \t\f\v]+", " ", text or "")
+    text = re.sub(r" ?\n[ \n]*", "\n", text)
+    return text.strip()
+
+
+def trim_text(text: str, max_tokens: int) -> str:
+    """Compact `text` and cut it at a word boundary to fit `max_tokens`."""
+    text = compact_text(text)
+    if max_tokens <= 0 or estimate_tokens(text) <= max_tokens:
+        return text
+    limit = max_tokens * CHARS_PER_TOKEN
+    cut = text[:limit]
+    space = max(cut.rfind(" "), cut.rfind("\n"))
+    if space > limit * 0.8:
+        cut = cut[:space]
+    return cut.rstrip() + " …"
+
+
+def trim_items(items: List[Any], max_tokens: int) -> List[str]:
+    """De-duplicate (case-insensitive, order kept) and keep items until the budget is spent."""
+    seen, kept, used = set(), [], 0
+    for item in items or []:
+        value = " ".join(str(item).split())
+        if not value or value.lower() in seen:
+            continue
+        cost = estimate_tokens(value + ", ")
+        if max_tokens > 0 and kept and used + cost > max_tokens:
+            break
+        seen.add(value.lower())
+        kept.append(value)
+        used += cost
+    return kept
+
+
+def trim_qa(qa_pairs: List[dict], max_tokens: int) -> List[dict]:
+    """
+    Fit Q&A pairs into `max_tokens`. Questions are kept whole; the remaining
+    budget is shared equally between answers, long answers are cut.
+    """
+    pairs = [{"question": str(p.get("question", "")), "answer": compact_text(str(p.get("answer", "")))}
+             for p in qa_pairs or []]
+    if max_tokens <= 0 or not pairs:
+        return pairs
+    question_tokens = sum(estimate_tokens(p["question"]) for p in pairs)
+    per_answer = max(16, (max_tokens - question_tokens) // len(pairs))
+    for p in pairs:
+        p["answer"] = trim_text(p["answer"], per_answer)
+    return pairs
+
+
+# ═══════════════════════════════════════════════════════════════════
+#  BUILDER
+# ═══════════════════════════════════════════════════════════════════
+
+class PromptBuilder:
+    """Applies per-agent token budgets to prompt inputs and counts what was trimmed."""
+
+    def __init__(self, budgets: Optional[Dict[str, int]] = None):
+        self.budgets = dict(DEFAULT_BUDGETS)
+        self.budgets.update(budgets or {})
+        self._trimmed: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "PromptBuilder":
+        """Build the process-wide builder from LLM_PROMPT_BUDGETS."""
+        return cls(budgets=_parse_budgets(os.getenv("LLM_PROMPT_BUDGETS", "")))
+
+    def budget(self, agent: str, field: str) -> int:
+        return self.budgets.get(f"{agent}.{field}", 0)
+
+    def _record(self, agent: str, before: int, after: int) -> None:
+        if before > after:
+            with self._lock:
+                self._trimmed[agent] = self._trimmed.get(agent, 0) + before - after
+
+    def text(self, agent: str, field: str, text: str) -> str:
+        trimmed = trim_text(text, self.budget(agent, field))
+        self._record(agent, estimate_tokens(text or ""), estimate_tokens(trimmed))
+        return trimmed
+
+    def items(self, agent: str, field: str, items: List[Any]) -> str:
+        """Trimmed items joined with ", " — ready to drop into a prompt line."""
+        kept = trim_items(items, self.budget(agent, field))
+        joined = ", ".join(kept)
+        self._record(agent, estimate_tokens(", ".join(str(i) for i in items or [])), estimate_tokens(joined))
+        return joined
+
+    def qa(self, agent: str, field: str, qa_pairs: List[dict]) -> str:
+        """Q&A pairs trimmed to budget and rendered as "Q: ...\\nA: ..." lines."""
+        original = "\n".join(f"Q: {p.get('question', '')}\nA: {p.get('answer', '')}" for p in qa_pairs or [])
+        rendered = "\n".join(
+            f"Q: {p['question']}\nA: {p['answer']}"
+            for p in trim_qa(qa_pairs, self.budget(agent, field))
+        )
+        self._record(agent, estimate_tokens(original), estimate_tokens(rendered))
+        return rendered
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"tokens_trimmed": dict(self._trimmed), "budgets": dict(self.budgets)}
@@ -0,0 +1,176 @@
+"""
+Question Bank
+
+Persistent pools of assessment questions, one per (kind, key), served by
+sampling and topped up by the LLM only when a pool is thin or stale.
+"""
+
+import asyncio
+import os
+import random
+import re
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List
+
+from backend.core.background_jobs import BackgroundJobs
+
+_NON_WORD = re.compile(r"[^a-z0-9+#]+")
+
+
+def normalize_title(text: str) -> str:
+    """Key for an action title: lower-case, punctuation → spaces, collapsed."""
+    return " ".join(_NON_WORD.sub(" ", (text or "").lower()).split())
+
+
+def _clean(questions: List[Any]) -> List[str]:
+    return [" ".join(str(q).split()) for q in questions or [] if isinstance(q, str) and q.strip()]
+
+
+class _Pool:
+    __slots__ = ("questions", "updated_at", "loaded_at", "next_topup")
+
+    def __init__(self, questions: List[str], updated_at: float, loaded_at: float):
+        self.questions = questions
+        self.updated_at = updated_at      # last top-up (epoch seconds)
+        self.loaded_at = loaded_at        # last read from the store
+        self.next_topup = 0.0             # earliest next background top-up
+
+
+class QuestionBank:
+    """Sample-first question pools with thin / stale LLM top-up."""
+
+    def __init__(self, store=None, min_pool: int = 20, max_pool: int = 80,
+                 ttl: float = 7 * 24 * 3600, sync_s: float = 300.0,
+                 topup_interval: float = 120.0, enabled: bool = True):
+        self.store = store
+        self.min_pool = min_pool
+        self.max_pool = max_pool
+        self.ttl = ttl
+        self.sync_s = sync_s
+        self.topup_interval = topup_interval
+        self.enabled = enabled
+        self._pools: Dict[tuple, _Pool] = {}
+        self._topups = BackgroundJobs("question_bank")
+        self._stats = {"served_from_bank": 0, "blocking_fills": 0, "background_topups": 0,
+                       "topup_failures": 0}
+
+    @classmethod
+    def from_env(cls, store=None) -> "QuestionBank":
+        """Build the process-wide bank from QUESTION_BANK_* environment variables."""
+        return cls(
+            store=store,
+            min_pool=int(os.getenv("QUESTION_BANK_MIN_POOL", "20")),
+            max_pool=int(os.getenv("QUESTION_BANK_MAX_POOL", "80")),
+            ttl=float(os.getenv("QUESTION_BANK_TTL_S", str(7 * 24 * 3600))),
+            topup_interval=float(os.getenv("QUESTION_BANK_TOPUP_INTERVAL_S", "120")),
+            enabled=os.getenv("QUESTION_BANK", "true").strip().lower() not in ("0", "false", "no", "off"),
+        )
+
+    # ─────────────────────────────────────────────────
+    # POOLS
+    # ─────────────────────────────────────────────────
+
+    async def _load(self, kind: str, key: str) -> _Pool:
+        now = time.time()
+        pool = self._pools.get((kind, key))
+        if pool is not None and now - pool.loaded_at < self.sync_s:
+            return pool
+        doc = None
+        if self.store is not None:
+            doc = await asyncio.to_thread(self.store.get_question_pool, kind, key)
+        if doc:
+            try:
+                updated = datetime.fromisoformat(doc.get("updated_at", "")).timestamp()
+            except (TypeError, ValueError):
+                updated = 0.0
+            next_topup = pool.next_topup if pool is not None else 0.0
+            pool = _Pool(_clean(doc.get("questions")), updated, now)
+            pool.next_topup = next_topup
+        elif pool is None:
+            pool = _Pool([], 0.0, now)
+        else:
+            pool.loaded_at = now
+        self._pools[(kind, key)] = pool
+        return pool
+
+    async def _add(self, kind: str, key: str, questions: List[str]) -> _Pool:
+        """Merge new questions into the pool (deduped, newest kept) and persist it."""
+        pool = await self._load(kind, key)
+        seen = {normalize_title(q) for q in pool.questions}
+        merged = list(pool.questions)
+        for q in _clean(questions):
+            norm = normalize_title(q)
+            if norm and norm not in seen:
+                seen.add(norm)
+                merged.append(q)
+        pool.questions = merged[-self.max_pool:]
+        pool.updated_at = time.time()
+        if self.store is not None:
+            await asyncio.to_thread(self.store.save_question_pool, kind, key, pool.questions,
+                                    datetime.utcfromtimestamp(pool.updated_at).isoformat())
+        return pool
+
+    def _needs_topup(self, pool: _Pool) -> bool:
+        now = time.time()
+        if now < pool.next_topup:
+            return False      # a model that keeps repeating itself is not asked every request
+        return len(pool.questions) < self.min_pool or now - pool.updated_at > self.ttl
+
+    # ─────────────────────────────────────────────────
+    # SERVING
+    # ─────────────────────────────────────────────────
+
+    async def aget(self, kind: str, key: str, n: int,
+                   generate: Callable[[List[str]], Awaitable[List[str]]]) -> List[str]:
+        """
+        n questions for (kind, key). `generate(avoid)` produces fresh questions;
+        it is awaited only when the pool cannot serve n yet. The pool keeps
+        changing, so callers that grade answers later must keep what they served.
+        """
+        if not self.enabled:
+            return _clean(await generate([]))[:n]
+
+        pool = await self._load(kind, key)
+        if len(pool.questions) < n:
+            self._stats["blocking_fills"] += 1
+            pool = await self._add(kind, key, await generate(pool.questions[-15:]))
+        else:
+            self._stats["served_from_bank"] += 1
+
+        if self._needs_topup(pool) and not self._topups.running((kind, key)):
+            self._stats["background_topups"] += 1
+            self._topups.start((kind, key), lambda: self._topup(kind, key, generate))
+
+        return random.sample(pool.questions, min(n, len(pool.questions)))
+
+    async def _topup(self, kind: str, key: str, generate: Callable[[List[str]], Awaitable[List[str]]]) -> None:
+        pool = await self._load(kind, key)
+        pool.next_topup = time.time() + self.topup_interval
+        try:
+            await self._add(kind, key, await generate(pool.questions[-15:]))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._stats["topup_failures"] += 1
+            print(f"[QuestionBank] top-up for {kind}:{key} failed: {e}")
+
+    async def awarm(self, kind: str, key: str, n: int,
+                    generate: Callable[[List[str]], Awaitable[List[str]]]) -> bool:
+        """Prefetch: make sure the pool can serve n questions. True if the LLM was called."""
+        if not self.enabled:
+            return False
+        pool = await self._load(kind, key)
+        if len(pool.questions) >= n:
+            return False
+        await self._add(kind, key, await generate(pool.questions[-15:]))
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "pools": len(self._pools),
+            "questions": sum(len(p.questions) for p in self._pools.values()),
+            **self._stats,
+            "topups": self._topups.stats(),
+        }
@@ -0,0 +1,202 @@
+"""
+Roadmap Templates
+
+Stored roadmaps reused across users with the same canonical role and a
+similar skill profile, keyed by a coarse signature ("data+programming:some").
+"""
+
+import asyncio
+import copy
+import os
+import re
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# Keyword → cluster. Multi-word keywords match as phrases on normalized text.
+SKILL_CLUSTERS: Dict[str, Tuple[str, ...]] = {
+    "programming": ("python", "java", "javascript", "typescript", "c++", "c#", "golang", "go",
+                    "rust", "ruby", "php", "kotlin", "swift", "scala", "programming", "coding",
+                    "dsa", "data structures", "algorithms", "oop"),
+    "web":         ("html", "css", "react", "angular", "vue", "node", "nodejs", "django", "flask",
+                    "fastapi", "spring", "frontend", "backend", "rest", "api", "apis", "web"),
+    "data":        ("sql", "excel", "pandas", "numpy", "statistics", "tableau", "power bi",
+                    "analytics", "spark", "hadoop", "etl", "database", "databases", "mongodb",
+                    "postgres", "postgresql", "mysql", "data analysis", "visualization"),
+    "ml":          ("machine learning", "deep learning", "tensorflow", "pytorch", "scikit",
+                    "sklearn", "nlp", "computer vision", "llm", "llms", "ai", "genai"),
+    "cloud":       ("aws", "azure", "gcp", "cloud", "docker", "kubernetes", "terraform", "devops",
+                    "ci cd", "cicd", "linux", "jenkins", "ansible"),
+    "security":    ("security", "cybersecurity", "networking", "network", "cryptography",
+                    "penetration testing", "siem", "firewall", "ethical hacking"),
+    "design":      ("figma", "ux", "ui", "design", "photoshop", "prototyping", "wireframing"),
+    "mobile":      ("android", "ios", "flutter", "react native", "mobile"),
+    "business":    ("communication", "management", "leadership", "product", "agile", "scrum",
+                    "marketing", "seo", "stakeholder", "presentation", "business"),
+}
+
+_NON_WORD = re.compile(r"[^a-z0-9+#]+")
+
+
+def _norm(text: str) -> str:
+    return " ".join(_NON_WORD.sub(" ", str(text or "").lower()).split())
+
+
+def skill_clusters(items: Iterable[str]) -> Set[str]:
+    """Clusters mentioned anywhere in `items` (free-text skills or strengths)."""
+    found: Set[str] = set()
+    for item in items or []:
+        text = f" {_norm(item)} "
+        for cluster, keywords in SKILL_CLUSTERS.items():
+            if cluster not in found and any(f" {k} " in text for k in keywords):
+                found.add(cluster)
+    return found
+
+
+def experience_bucket(skills: Iterable[str]) -> str:
+    count = len([s for s in skills or [] if str(s).strip()])
+    return "novice" if count <= 2 else ("some" if count <= 6 else "broad")
+
+
+def profile_signature(roadmap_input: Dict[str, Any]) -> str:
+    """Coarse signature of a roadmap input, e.g. "data+programming:some"."""
+    skills = roadmap_input.get("skills", [])
+    clusters = skill_clusters(list(skills) + list(roadmap_input.get("strengths", [])))
+    return f"{'+'.join(sorted(clusters)) or 'none'}:{experience_bucket(skills)}"
+
+
+def _parse_signature(signature: str) -> Tuple[Set[str], str]:
+    clusters, _, bucket = signature.partition(":")
+    return ({c for c in clusters.split("+") if c and c != "none"}, bucket)
+
+
+def _jaccard(a: Set[str], b: Set[str]) -> float:
+    # Two cluster-less profiles share nothing to match on (exact hits still apply)
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def _fresh_copy(steps: List[dict]) -> List[dict]:
+    steps = copy.deepcopy(steps)
+    for step in steps:
+        for action in step.get("actions", []):
+            action["status"] = "pending"
+            action["score"] = None
+    return steps
+
+
+class RoadmapTemplates:
+    """Per-role roadmap templates matched by profile signature."""
+
+    def __init__(self, store=None, similarity: float = 0.6, max_per_role: int = 12,
+                 ttl: float = 30 * 24 * 3600, sync_s: float = 300.0,
+                 personalize: bool = True, enabled: bool = True):
+        self.store = store
+        self.similarity = similarity
+        self.max_per_role = max_per_role
+        self.ttl = ttl
+        self.sync_s = sync_s
+        self.personalize = personalize
+        self.enabled = enabled
+        self._roles: Dict[str, Tuple[float, Dict[str, dict]]] = {}   # role_key → (loaded_at, templates)
+        self._stats = {"exact_hits": 0, "near_hits": 0, "misses": 0, "stored": 0}
+
+    @classmethod
+    def from_env(cls, store=None) -> "RoadmapTemplates":
+        """Build the process-wide template store from ROADMAP_TEMPLATE* environment variables."""
+        flag = lambda name: os.getenv(name, "true").strip().lower() not in ("0", "false", "no", "off")
+        return cls(
+            store=store,
+            similarity=float(os.getenv("ROADMAP_TEMPLATE_SIMILARITY", "0.6")),
+            max_per_role=int(os.getenv("ROADMAP_TEMPLATE_MAX_PER_ROLE", "12")),
+            ttl=float(os.getenv("ROADMAP_TEMPLATE_TTL_S", str(30 * 24 * 3600))),
+            personalize=flag("ROADMAP_TEMPLATE_PERSONALIZE"),
+            enabled=flag("ROADMAP_TEMPLATES"),
+        )
+
+    async def _load(self, role_key: str) -> Dict[str, dict]:
+        now = time.time()
+        cached = self._roles.get(role_key)
+        if cached is not None and now - cached[0] < self.sync_s:
+            return cached[1]
+        templates: Dict[str, dict] = {}
+        if self.store is not None:
+            doc = await asyncio.to_thread(self.store.get_role, role_key) or {}
+            templates = dict(doc.get("roadmap_templates") or {})
+        self._roles[role_key] = (now, templates)
+        return templates
+
+    def _expired(self, template: dict) -> bool:
+        try:
+            created = datetime.fromisoformat(template.get("created_at", "")).timestamp()
+        except (TypeError, ValueError):
+            return True
+        return time.time() - created > self.ttl
+
+    # ─────────────────────────────────────────────────
+    # LOOKUP / STORE
+    # ─────────────────────────────────────────────────
+
+    async def aget(self, role_key: str, roadmap_input: Dict[str, Any]) -> Optional[List[dict]]:
+        """Steps of the closest stored template (a fresh copy), or None on a miss."""
+        if not self.enabled or not role_key:
+            return None
+        templates = await self._load(role_key)
+        signature = profile_signature(roadmap_input)
+
+        template = templates.get(signature)
+        if template is not None and not self._expired(template):
+            self._stats["exact_hits"] += 1
+            return _fresh_copy(template["steps"])
+
+        clusters, bucket = _parse_signature(signature)
+        best, best_score = None, 0.0
+        for sig, candidate in templates.items():
+            other_clusters, other_bucket = _parse_signature(sig)
+            if other_bucket != bucket or self._expired(candidate):
+                continue
+            score = _jaccard(clusters, other_clusters)
+            if score > best_score:
+                best, best_score = candidate, score
+        if best is not None and best_score >= self.similarity:
+            self._stats["near_hits"] += 1
+            return _fresh_copy(best["steps"])
+
+        self._stats["misses"] += 1
+        return None
+
+    async def aput(self, role_key: str, roadmap_input: Dict[str, Any], steps: List[dict]) -> None:
+        """
+        Store a freshly generated roadmap as the template for this input's signature.
+        Only that signature's field is written, so workers storing templates for
+        other signatures of the same role never overwrite each other.
+        """
+        if not self.enabled or not role_key or not steps:
+            return
+        signature = profile_signature(roadmap_input)
+        template = {"steps": _fresh_copy(steps), "created_at": datetime.utcnow().isoformat()}
+        templates = dict(await self._load(role_key))
+        templates[signature] = template
+        evicted = []
+        if len(templates) > self.max_per_role:
+            oldest = sorted(templates, key=lambda s: templates[s].get("created_at", ""))
+            evicted = [s for s in oldest[:len(templates) - self.max_per_role] if s != signature]
+            for sig in evicted:
+                del templates[sig]
+        self._roles[role_key] = (time.time(), templates)
+        self._stats["stored"] += 1
+        if self.store is not None:
+            await asyncio.to_thread(
+                self.store.upsert_role, role_key, {f"roadmap_templates.{signature}": template},
+                [f"roadmap_templates.{sig}" for sig in evicted],
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "personalize": self.personalize,
+            "roles": len(self._roles),
+            "templates": sum(len(t) for _, t in self._roles.values()),
+            **self._stats,
+        }
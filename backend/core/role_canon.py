@@ -0,0 +1,218 @@
+"""
+Role Canonicalization
+
+Maps free-text target roles ("ML Engineer", "Machine-Learning Eng.") to one
+canonical role, so role-scoped caches and artifacts share a key. Only the
+static catalogue (plus configured aliases) is matched, so every process
+derives the same key for the same title.
+"""
+
+import os
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set
+
+# Abbreviations expanded token-by-token during normalization
+TOKEN_EXPANSIONS: Dict[str, str] = {
+    "eng": "engineer", "engg": "engineer", "engr": "engineer", "engineers": "engineer",
+    "dev": "developer", "devs": "developer", "developers": "developer",
+    "mgr": "manager", "mngr": "manager",
+    "sr": "senior", "jr": "junior",
+    "ml": "machine learning", "dl": "deep learning", "cv": "computer vision",
+    "swe": "software engineer", "sde": "software engineer",
+    "sre": "site reliability engineer",
+    "ds": "data scientist", "de": "data engineer", "da": "data analyst",
+    "pm": "product manager", "ba": "business analyst",
+    "fe": "frontend", "be": "backend",
+    "fullstack": "full stack",
+    "admin": "administrator", "sys": "systems", "ops": "operations",
+    "sec": "security", "infosec": "information security",
+}
+
+# Multi-word spellings joined before token expansion
+PHRASE_JOINS = {"front end": "frontend", "back end": "backend", "dev ops": "devops",
+                "full-stack": "full stack", "machine-learning": "machine learning"}
+
+# Canonical display name → aliases (normalized or not; they are normalized on load)
+DEFAULT_ROLES: Dict[str, List[str]] = {
+    "Software Engineer":              ["software developer", "programmer", "software development engineer"],
+    "Frontend Developer":             ["frontend engineer", "ui developer", "react developer"],
+    "Backend Developer":              ["backend engineer", "server side developer"],
+    "Full Stack Developer":           ["full stack engineer", "mern developer", "mean developer"],
+    "Mobile Developer":               ["android developer", "ios developer", "mobile app developer"],
+    "Data Scientist":                 ["data science"],
+    "Data Analyst":                   ["data analytics", "analytics analyst"],
+    "Data Engineer":                  ["big data engineer", "etl developer"],
+    "Machine Learning Engineer":      ["mle", "machine learning developer"],
+    "AI Engineer":                    ["artificial intelligence engineer", "genai engineer", "llm engineer"],
+    "MLOps Engineer":                 ["mlops", "machine learning operations engineer"],
+    "DevOps Engineer":                ["devops", "build and release engineer"],
+    "Site Reliability Engineer":      ["reliability engineer"],
+    "Cloud Engineer":                 ["cloud architect", "aws engineer", "azure engineer"],
+    "Cybersecurity Analyst":          ["security analyst", "information security analyst", "soc analyst"],
+    "Security Engineer":              ["application security engineer", "information security engineer"],
+    "QA Engineer":                    ["quality assurance engineer", "test engineer", "sdet", "qa tester"],
+    "Product Manager":                ["product owner"],
+    "Project Manager":                ["program manager"],
+    "Business Analyst":               ["business intelligence analyst", "bi analyst"],
+    "UX Designer":                    ["ui ux designer", "ux ui designer", "product designer", "ui designer"],
+    "Database Administrator":         ["dba", "database engineer"],
+    "Systems Administrator":          ["system administrator", "sysadmin"],
+    "Network Engineer":               ["network administrator"],
+    "Embedded Systems Engineer":      ["embedded engineer", "firmware engineer"],
+    "Game Developer":                 ["game programmer"],
+    "Blockchain Developer":           ["web3 developer", "smart contract developer"],
+    "Technical Writer":               ["documentation engineer"],
+    "Solutions Architect":            ["solution architect"],
+    "Digital Marketing Specialist":   ["digital marketer", "seo specialist"],
+}
+
+_PUNCT = re.compile(r"[^a-z0-9+#]+")
+
+
+def normalize_role(text: str) -> str:
+    """Lower-case, strip punctuation, join split spellings and expand abbreviations."""
+    s = (text or "").lower().replace("&", " and ")
+    for phrase, joined in PHRASE_JOINS.items():
+        s = s.replace(phrase, joined)
+    s = " ".join(_PUNCT.sub(" ", s).split())
+    for phrase, joined in PHRASE_JOINS.items():
+        s = s.replace(phrase, joined)
+    return " ".join(TOKEN_EXPANSIONS.get(tok, tok) for tok in s.split())
+
+
+def _trigrams(text: str) -> Set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+@dataclass(frozen=True)
+class CanonicalRole:
+    """Result of canonicalize(): stable id, display name and how it was matched."""
+    role_id: str          # normalized canonical name — the key for role-scoped data
+    name: str             # display name stored on profiles
+    matched_by: str       # exact | alias | fuzzy | new (unknown title, passed through normalized)
+    score: float = 1.0
+
+
+class RoleCanonicalizer:
+    """
+    Thread-safe alias table + trigram index over the catalogue roles.
+    Unknown titles are never added to the index: a role learned in one worker
+    would fuzzy-match differently from another worker or after a restart, and
+    the ids are persisted as MongoDB keys.
+    """
+
+    def __init__(self, roles: Optional[Dict[str, Iterable[str]]] = None,
+                 threshold: float = 0.85, memo_size: int = 4096):
+        self.threshold = threshold
+        self._names: Dict[str, str] = {}              # role_id → display name
+        self._aliases: Dict[str, str] = {}            # normalized alias → role_id
+        self._grams: Dict[str, Set[str]] = {}         # role_id → trigrams
+        self._index: Dict[str, Set[str]] = {}         # trigram → role_ids
+        self._memo: "OrderedDict[str, CanonicalRole]" = OrderedDict()
+        self._memo_size = memo_size
+        self._stats = {"exact": 0, "alias": 0, "fuzzy": 0, "new": 0, "memo_hits": 0}
+        self._lock = threading.Lock()
+        for name, aliases in (roles if roles is not None else DEFAULT_ROLES).items():
+            self.register(name, aliases)
+
+    @classmethod
+    def from_env(cls) -> "RoleCanonicalizer":
+        """Defaults plus ROLE_ALIASES ("alias=Canonical Role;...") and ROLE_MATCH_THRESHOLD."""
+        canon = cls(threshold=float(os.getenv("ROLE_MATCH_THRESHOLD", "0.85")))
+        for pair in os.getenv("ROLE_ALIASES", "").split(";"):
+            if "=" in pair:
+                alias, _, name = pair.partition("=")
+                canon.register(name.strip(), [alias.strip()])
+        return canon
+
+    # ─────────────────────────────────────────────────
+    # INDEX
+    # ─────────────────────────────────────────────────
+
+    def register(self, name: str, aliases: Iterable[str] = ()) -> str:
+        """Add (or extend) a canonical role; returns its role_id."""
+        role_id = normalize_role(name)
+        if not role_id:
+            return ""
+        with self._lock:
+            self._add(role_id, name.strip())
+            for alias in aliases:
+                norm = normalize_role(alias)
+                if norm and norm != role_id:
+                    self._aliases[norm] = role_id
+            self._memo.clear()
+        return role_id
+
+    def _add(self, role_id: str, name: str) -> None:
+        if role_id in self._names:
+            return
+        self._names[role_id] = name
+        grams = _trigrams(role_id)
+        self._grams[role_id] = grams
+        for g in grams:
+            self._index.setdefault(g, set()).add(role_id)
+
+    def _best_match(self, norm: str) -> tuple:
+        grams = _trigrams(norm)
+        overlap: Dict[str, int] = {}
+        for g in grams:
+            for role_id in self._index.get(g, ()):
+                overlap[role_id] = overlap.get(role_id, 0) + 1
+        best, score = None, 0.0
+        for role_id, shared in overlap.items():
+            dice = 2.0 * shared / (len(grams) + len(self._grams[role_id]))
+            if dice > score:
+                best, score = role_id, dice
+        return best, score
+
+    # ─────────────────────────────────────────────────
+    # LOOKUP
+    # ─────────────────────────────────────────────────
+
+    def canonicalize(self, text: str) -> Optional[CanonicalRole]:
+        """Canonical role for free text (None for empty input)."""
+        norm = normalize_role(text)
+        if not norm:
+            return None
+        with self._lock:
+            hit = self._memo.get(norm)
+            if hit is not None:
+                self._memo.move_to_end(norm)
+                self._stats["memo_hits"] += 1
+                return hit
+
+            if norm in self._names:
+                result = CanonicalRole(norm, self._names[norm], "exact")
+            elif norm in self._aliases:
+                role_id = self._aliases[norm]
+                result = CanonicalRole(role_id, self._names[role_id], "alias")
+            else:
+                best, score = self._best_match(norm)
+                if best is not None and score >= self.threshold:
+                    result = CanonicalRole(best, self._names[best], "fuzzy", round(score, 3))
+                else:
+                    display = " ".join(w if w.isupper() else w[:1].upper() + w[1:]
+                                       for w in " ".join(text.split()).split())
+                    result = CanonicalRole(norm, display, "new", round(score, 3))
+
+            self._stats[result.matched_by] += 1
+            self._memo[norm] = result
+            if len(self._memo) > self._memo_size:
+                self._memo.popitem(last=False)
+            return result
+
+    def role_id(self, text: str) -> str:
+        """Just the canonical key ("" for empty input)."""
+        result = self.canonicalize(text)
+        return result.role_id if result else ""
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {"known_roles": len(self._names), "aliases": len(self._aliases), **self._stats}
+
+
+role_canon = RoleCanonicalizer.from_env()
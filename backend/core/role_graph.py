@@ -0,0 +1,176 @@
+"""
+Role Adjacency Graph
+
+In-memory "safer adjacent role" edges between canonical roles, learned from
+market analyses, readiness results and past LLM answers, so ReroutingAgent
+can suggest safer roles without an LLM call.
+"""
+
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from backend.core.role_canon import RoleCanonicalizer, role_canon
+
+BARRIER_EASE = {"low": 1.0, "medium": 0.6, "high": 0.2}
+
+# (dst role id, demand 0-100 or None, barrier ease 0-1 or None)
+_Observation = Tuple[str, Optional[float], Optional[float]]
+
+
+class RoleGraph:
+    """Weighted safer-role adjacency over canonical roles."""
+
+    def __init__(self, canon: RoleCanonicalizer = role_canon, enabled: bool = True):
+        self.canon = canon
+        self.enabled = enabled
+        # src id → dst id → [count, demand_sum, demand_n, ease_sum, ease_n]
+        self._edges: Dict[str, Dict[str, List[float]]] = {}
+        self._names: Dict[str, str] = {}
+        self._sources: Dict[str, Tuple[str, List[_Observation]]] = {}
+        self._lock = threading.Lock()
+        self._stats = {"lookups": 0, "hits": 0, "misses": 0, "observations": 0}
+
+    @classmethod
+    def from_env(cls) -> "RoleGraph":
+        return cls(enabled=os.getenv("ROLE_GRAPH", "true").strip().lower() not in ("0", "false", "no", "off"))
+
+    # ─────────────────────────────────────────────────
+    # OBSERVATIONS
+    # ─────────────────────────────────────────────────
+
+    def _node(self, role: str) -> str:
+        result = self.canon.canonicalize(role)
+        if result is None:
+            return ""
+        self._names.setdefault(result.role_id, result.name)
+        return result.role_id
+
+    def observe(self, source: str, role: str, items: Iterable[Any]) -> int:
+        """
+        Replace `source`'s edges out of `role`. Items are role names or dicts
+        with "role" and optional "demand_score" / "entry_barrier". Returns edge count.
+        """
+        if not self.enabled:
+            return 0
+        with self._lock:
+            src = self._node(role)
+            if not src:
+                return 0
+            observations: List[_Observation] = []
+            for item in items or []:
+                if isinstance(item, dict):
+                    name, demand, barrier = item.get("role"), item.get("demand_score"), item.get("entry_barrier")
+                else:
+                    name, demand, barrier = item, None, None
+                if not isinstance(name, str) or not name.strip():
+                    continue
+                dst = self._node(name)
+                if not dst or dst == src:
+                    continue
+                try:
+                    demand = float(demand) if demand is not None else None
+                except (TypeError, ValueError):
+                    demand = None
+                ease = BARRIER_EASE.get(str(barrier).strip().lower()) if barrier else None
+                observations.append((dst, demand, ease))
+
+            self._retract(source)
+            for obs in observations:
+                self._apply(src, obs, +1)
+            self._sources[source] = (src, observations)
+            self._stats["observations"] += 1
+            return len(observations)
+
+    def _retract(self, source: str) -> None:
+        previous = self._sources.pop(source, None)
+        if previous is None:
+            return
+        src, observations = previous
+        for obs in observations:
+            self._apply(src, obs, -1)
+
+    def _apply(self, src: str, obs: _Observation, sign: int) -> None:
+        dst, demand, ease = obs
+        edges = self._edges.setdefault(src, {})
+        edge = edges.setdefault(dst, [0, 0.0, 0, 0.0, 0])
+        edge[0] += sign
+        if demand is not None:
+            edge[1] += sign * demand
+            edge[2] += sign
+        if ease is not None:
+            edge[3] += sign * ease
+            edge[4] += sign
+        if edge[0] <= 0:
+            del edges[dst]
+            if not edges:
+                del self._edges[src]
+
+    def observe_market(self, role: str, market_analysis: Dict[str, Any]) -> int:
+        return self.observe(f"market:{self.canon.role_id(role)}", role,
+                            (market_analysis or {}).get("adjacent_safer_roles", []))
+
+    def observe_readiness(self, user_id: str, role: str, safer_roles: Iterable[str]) -> int:
+        return self.observe(f"readiness:{user_id}", role, safer_roles)
+
+    def observe_llm(self, role: str, safer_roles: Iterable[str]) -> int:
+        return self.observe(f"llm:{self.canon.role_id(role)}", role, safer_roles)
+
+    def load(self, store) -> Dict[str, int]:
+        """Build the graph from the store (roles market analyses + users' readiness results)."""
+        counts = {"roles": 0, "users": 0}
+        for doc in store.scan_roles(["display_role", "market_analysis"]):
+            if doc.get("market_analysis"):
+                self.observe_market(doc.get("display_role") or doc["role_key"], doc["market_analysis"])
+                counts["roles"] += 1
+        for doc in store.scan_users(["user_id", "profile.target_role", "market_analysis",
+                                     "readiness_assessment.safer_adjacent_roles"]):
+            role = (doc.get("profile") or {}).get("target_role")
+            if not role:
+                continue
+            if doc.get("market_analysis"):       # documents not yet migrated to market_ref
+                self.observe_market(role, doc["market_analysis"])
+            safer = (doc.get("readiness_assessment") or {}).get("safer_adjacent_roles")
+            if safer:
+                self.observe_readiness(doc.get("user_id", ""), role, safer)
+                counts["users"] += 1
+        return counts
+
+    # ─────────────────────────────────────────────────
+    # LOOKUP
+    # ─────────────────────────────────────────────────
+
+    @staticmethod
+    def _rank(edge: List[float]) -> float:
+        count, demand_sum, demand_n, ease_sum, ease_n = edge
+        demand = demand_sum / demand_n / 100.0 if demand_n else 0.5
+        ease = ease_sum / ease_n if ease_n else BARRIER_EASE["medium"]
+        return 0.5 * demand + 0.3 * ease + 0.2 * min(1.0, count / 10.0)
+
+    def safer_roles(self, role: str, k: int = 3) -> List[str]:
+        """Up to k safer adjacent roles for `role`, best first ([] if the role is unseen)."""
+        if not self.enabled:
+            return []
+        role_id = self.canon.role_id(role)
+        with self._lock:
+            self._stats["lookups"] += 1
+            edges = self._edges.get(role_id)
+            if not edges:
+                self._stats["misses"] += 1
+                return []
+            self._stats["hits"] += 1
+            ranked = sorted(edges.items(), key=lambda e: (-self._rank(e[1]), e[0]))
+            return [self._names.get(dst, dst) for dst, _ in ranked[:k]]
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "roles": len(self._edges),
+                "edges": sum(len(e) for e in self._edges.values()),
+                "sources": len(self._sources),
+                **self._stats,
+            }
+
+
+role_graph = RoleGraph.from_env()
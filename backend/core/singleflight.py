@@ -0,0 +1,64 @@
+"""
+Single-Flight Request Coalescing
+
+Concurrent callers asking for the same key share one in-flight task and
+receive their own deep copy of its result (or its exception).
+"""
+
+import asyncio
+import copy
+import json
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """Coalesce concurrent identical async calls into one in-flight task."""
+
+    def __init__(self, name: str = "singleflight"):
+        self.name = name
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._stats = {"leaders": 0, "followers": 0}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run fn() once per key at a time; concurrent callers share the outcome."""
+        task = self._inflight.get(key)
+        if task is not None and not task.done():
+            self._stats["followers"] += 1
+        else:
+            self._stats["leaders"] += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, k=key: self._forget(k, t))
+        result = await asyncio.shield(task)
+        return copy.deepcopy(result)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception retrieved — every waiter already saw it
+            task.exception()
+
+    @property
+    def inflight(self) -> int:
+        return len(self._inflight)
+
+    def stats(self) -> Dict[str, int]:
+        return {**self._stats, "inflight": self.inflight}
+
+
+def normalize_key(*parts: Any) -> str:
+    """
+    Stable key for agent inputs: strings are stripped and lower-cased,
+    dict keys sorted, so "ML Engineer " and "ml engineer" coalesce.
+    """
+    def _norm(value):
+        if isinstance(value, str):
+            return " ".join(value.split()).lower()
+        if isinstance(value, dict):
+            return {str(k): _norm(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [_norm(v) for v in value]
+        return value
+
+    return json.dumps([_norm(p) for p in parts], sort_keys=True, default=str)
@@ -0,0 +1,219 @@
+"""
+LLM Telemetry
+
+In-process metrics for every LLM call, exposed in Prometheus text format
+on GET /metrics (no prometheus_client dependency needed).
+
+Records, per (agent, op):
+  - latency histogram + a window of recent latencies for percentiles
+  - prompt / completion token counts from the Groq usage field
+  - request outcomes, error kinds and retry counts
+Cache, governor and single-flight stats are passed in at render time.
+"""
+
+import threading
+from collections import deque
+from typing import Any, Dict, Optional, Tuple
+
+LATENCY_BUCKETS = (0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 64.0)
+RECENT_WINDOW = 512
+
+
+def _labels(**labels: Any) -> str:
+    parts = []
+    for k, v in labels.items():
+        value = str(v).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", " ")
+        parts.append(f'{k}="{value}"')
+    return "{" + ",".join(parts) + "}"
+
+
+class _Series:
+    """Histogram + counters for one (agent, op) pair."""
+
+    def __init__(self):
+        self.bucket_counts = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.sum = 0.0
+        self.recent = deque(maxlen=RECENT_WINDOW)
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.outcomes: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+        self.retries = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+
+class LLMTelemetry:
+    """Thread-safe metrics registry shared by the sync and async LLM paths."""
+
+    def __init__(self):
+        self._series: Dict[Tuple[str, str], _Series] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, agent: str, op: str) -> _Series:
+        key = (agent, op)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _Series()
+        return series
+
+    # ─────────────────────────────────────────────────
+    # RECORDING
+    # ─────────────────────────────────────────────────
+
+    def observe(self, agent: str, op: str, latency: float, usage: Any = None,
+                outcome: str = "ok") -> None:
+        """Record one completed Groq round trip."""
+        prompt_tokens = getattr(usage, "prompt_tokens", None) or 0
+        completion_tokens = getattr(usage, "completion_tokens", None) or 0
+        with self._lock:
+            s = self._get(agent, op)
+            s.count += 1
+            s.sum += latency
+            s.recent.append(latency)
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if latency <= bound:
+                    s.bucket_counts[i] += 1
+            s.prompt_tokens += int(prompt_tokens)
+            s.completion_tokens += int(completion_tokens)
+            s.outcomes[outcome] = s.outcomes.get(outcome, 0) + 1
+
+    def count_error(self, agent: str, op: str, kind: str) -> None:
+        with self._lock:
+            s = self._get(agent, op)
+            s.errors[kind] = s.errors.get(kind, 0) + 1
+            s.outcomes["error"] = s.outcomes.get("error", 0) + 1
+
+    def count_retry(self, agent: str, op: str) -> None:
+        with self._lock:
+            self._get(agent, op).retries += 1
+
+    def count_hedge(self, agent: str, op: str, won: bool) -> None:
+        """A duplicate request was sent; `won` = the duplicate answered first."""
+        with self._lock:
+            s = self._get(agent, op)
+            s.hedges += 1
+            s.hedge_wins += int(won)
+
+    # ─────────────────────────────────────────────────
+    # QUERIES
+    # ─────────────────────────────────────────────────
+
+    def percentile(self, agent: str, op: str, q: float, min_samples: int = 20) -> Optional[float]:
+        """Latency percentile (q in 0..1) over the recent window, None if too few samples."""
+        with self._lock:
+            s = self._series.get((agent, op))
+            if s is None or len(s.recent) < min_samples:
+                return None
+            ordered = sorted(s.recent)
+        idx = min(len(ordered) - 1, max(0, int(round(q * (len(ordered) - 1)))))
+        return ordered[idx]
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """JSON-friendly per-series summary (used by /health-style views)."""
+        out = {}
+        for (agent, op), s in list(self._series.items()):
+            out[f"{agent}.{op}"] = {
+                "count": s.count,
+                "avg_latency": round(s.sum / s.count, 3) if s.count else 0.0,
+                "p99_latency": self.percentile(agent, op, 0.99, min_samples=1),
+                "prompt_tokens": s.prompt_tokens,
+                "completion_tokens": s.completion_tokens,
+                "errors": dict(s.errors),
+                "retries": s.retries,
+                "hedges": s.hedges,
+                "hedge_wins": s.hedge_wins,
+            }
+        return out
+
+    # ─────────────────────────────────────────────────
+    # PROMETHEUS EXPOSITION
+    # ─────────────────────────────────────────────────
+
+    def render_prometheus(self, cache_stats: Optional[dict] = None,
+                          governor_stats: Optional[dict] = None,
+                          flight_stats: Optional[dict] = None,
+                          repair_stats: Optional[dict] = None) -> str:
+        lines = []
+
+        def header(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        with self._lock:
+            series = sorted(self._series.items())
+
+            header("nexus_llm_request_duration_seconds", "histogram", "Groq round-trip latency per agent operation.")
+            for (agent, op), s in series:
+                # bucket_counts are already cumulative (observe() fills every bucket >= latency)
+                for bound, n in zip(LATENCY_BUCKETS, s.bucket_counts):
+                    lines.append(f"nexus_llm_request_duration_seconds_bucket{_labels(agent=agent, op=op, le=bound)} {n}")
+                lines.append(f"nexus_llm_request_duration_seconds_bucket{_labels(agent=agent, op=op, le='+Inf')} {s.count}")
+                lines.append(f"nexus_llm_request_duration_seconds_sum{_labels(agent=agent, op=op)} {s.sum:.6f}")
+                lines.append(f"nexus_llm_request_duration_seconds_count{_labels(agent=agent, op=op)} {s.count}")
+
+            header("nexus_llm_prompt_tokens_total", "counter", "Prompt tokens reported by Groq usage.")
+            for (agent, op), s in series:
+                lines.append(f"nexus_llm_prompt_tokens_total{_labels(agent=agent, op=op)} {s.prompt_tokens}")
+
+            header("nexus_llm_completion_tokens_total", "counter", "Completion tokens reported by Groq usage.")
+            for (agent, op), s in series:
+                lines.append(f"nexus_llm_completion_tokens_total{_labels(agent=agent, op=op)} {s.completion_tokens}")
+
+            header("nexus_llm_requests_total", "counter", "LLM requests by outcome.")
+            for (agent, op), s in series:
+                for outcome, n in sorted(s.outcomes.items()):
+                    lines.append(f"nexus_llm_requests_total{_labels(agent=agent, op=op, outcome=outcome)} {n}")
+
+            header("nexus_llm_errors_total", "counter", "LLM errors by exception kind.")
+            for (agent, op), s in series:
+                for kind, n in sorted(s.errors.items()):
+                    lines.append(f"nexus_llm_errors_total{_labels(agent=agent, op=op, kind=kind)} {n}")
+
+            header("nexus_llm_retries_total", "counter", "LLM retries after a 429 backoff.")
+            for (agent, op), s in series:
+                lines.append(f"nexus_llm_retries_total{_labels(agent=agent, op=op)} {s.retries}")
+
+            header("nexus_llm_hedges_total", "counter", "Hedged duplicate requests sent, and how many answered first.")
+            for (agent, op), s in series:
+                if s.hedges:
+                    lines.append(f"nexus_llm_hedges_total{_labels(agent=agent, op=op, result='sent')} {s.hedges}")
+                    lines.append(f"nexus_llm_hedges_total{_labels(agent=agent, op=op, result='won')} {s.hedge_wins}")
+
+        if cache_stats is not None:
+            header("nexus_llm_cache_lookups_total", "counter", "LLM response cache lookups by result.")
+            for agent, counts in sorted(cache_stats.get("by_agent", {}).items()):
+                lines.append(f"nexus_llm_cache_lookups_total{_labels(agent=agent, result='hit')} {counts.get('hits', 0)}")
+                lines.append(f"nexus_llm_cache_lookups_total{_labels(agent=agent, result='miss')} {counts.get('misses', 0)}")
+            header("nexus_llm_cache_hit_ratio", "gauge", "Overall LLM cache hit ratio.")
+            lines.append(f"nexus_llm_cache_hit_ratio {cache_stats.get('hit_ratio', 0.0)}")
+            header("nexus_llm_cache_entries", "gauge", "Entries held in the in-memory LLM cache.")
+            lines.append(f"nexus_llm_cache_entries {cache_stats.get('entries', 0)}")
+            header("nexus_llm_cache_saved_seconds_total", "counter", "Groq latency avoided by cache hits.")
+            lines.append(f"nexus_llm_cache_saved_seconds_total {cache_stats.get('saved_latency_seconds', 0.0)}")
+
+        if governor_stats is not None:
+            header("nexus_llm_concurrency_limit", "gauge", "Current adaptive concurrency limit.")
+            lines.append(f"nexus_llm_concurrency_limit {governor_stats.get('concurrency_limit', 0)}")
+            header("nexus_llm_in_flight", "gauge", "LLM calls currently admitted.")
+            lines.append(f"nexus_llm_in_flight {governor_stats.get('in_flight', 0)}")
+            header("nexus_llm_queue_depth", "gauge", "LLM calls waiting for admission.")
+            lines.append(f"nexus_llm_queue_depth {governor_stats.get('queue_depth', 0)}")
+            header("nexus_llm_throttled_total", "counter", "429 responses received from Groq.")
+            lines.append(f"nexus_llm_throttled_total {governor_stats.get('throttled_429', 0)}")
+            header("nexus_llm_queue_timeouts_total", "counter", "Calls rejected after waiting too long for admission.")
+            lines.append(f"nexus_llm_queue_timeouts_total {governor_stats.get('queue_timeouts', 0)}")
+
+        if flight_stats is not None:
+            header("nexus_llm_coalesced_total", "counter", "Requests served by joining an identical in-flight call.")
+            lines.append(f"nexus_llm_coalesced_total {flight_stats.get('followers', 0)}")
+
+        if repair_stats is not None:
+            header("nexus_llm_json_repairs_total", "counter", "Model outputs fixed by the local JSON repair pass, per fix.")
+            for name, n in sorted(repair_stats.get("by_repair", {}).items()):
+                lines.append(f"nexus_llm_json_repairs_total{_labels(repair=name)} {n}")
+            header("nexus_llm_json_repair_failures_total", "counter", "Outputs the local repair pass could not fix.")
+            lines.append(f"nexus_llm_json_repair_failures_total {repair_stats.get('failed', 0)}")
+
+        return "\n".join(lines) + "\n"
@@ -26,12 +26,15 @@ def _get_mongo_config():
     uri     = os.getenv("MONGO_URI", "").strip()
     db_name = os.getenv("MONGO_DB",  "nexus_ai")
     coll    = os.getenv("MONGO_COLL", "users")
+    roles   = os.getenv("MONGO_ROLES_COLL", "roles")
+    bank    = os.getenv("MONGO_QUESTION_BANK_COLL", "question_bank")
+    served  = os.getenv("MONGO_SERVED_QUESTIONS_COLL", "served_questions")
     if not uri:
         raise RuntimeError(
             "MONGO_URI is not set.\n"
             "Copy backend/.env.example -> backend/.env and fill in your Atlas connection string."
         )
-    return uri, db_name, coll
+    return uri, db_name, coll, roles, bank, served
 
 
 def _validate_no_sentinel_values(data: dict) -> None:
@@ -71,6 +74,9 @@ class Database:
     """
     _instance: Optional["Database"] = None
     _collection = None
+    _roles = None      # role-level shared data (market analysis), keyed by role_key
+    _bank  = None      # question pools, keyed by (kind, key)
+    _served = None     # questions served per user + assessment, until graded
 
     def __new__(cls):
         if cls._instance is None:
@@ -83,7 +89,7 @@ class Database:
             print("[DB] pymongo not installed. Run:  pip install 'pymongo[srv]'")
             return
         try:
-            uri, db_name, coll_name = _get_mongo_config()
+            uri, db_name, coll_name, roles_name, bank_name, served_name = _get_mongo_config()
             client = MongoClient(
                 uri,
                 server_api=ServerApi("1"),          # Atlas Stable API v1
@@ -101,14 +107,28 @@ class Database:
             self._collection.create_index([("last_updated", DESCENDING)])
             self._collection.create_index("profile.email")
             self._collection.create_index("profile.target_role")
-            print(f"[DB] Connected to MongoDB Atlas -> {db_name}.{coll_name}")
+            self._roles = db[roles_name]
+            self._roles.create_index("role_key", unique=True)
+            self._bank = db[bank_name]
+            self._bank.create_index([("kind", 1), ("key", 1)], unique=True)
+            self._served = db[served_name]
+            self._served.create_index([("user_id", 1), ("key", 1)], unique=True)
+            # Abandoned assessments are dropped by Mongo after a week
+            self._served.create_index("served_at", expireAfterSeconds=7 * 24 * 3600)
+            print(f"[DB] Connected to MongoDB Atlas -> {db_name}.{coll_name} (+ {roles_name})")
         except RuntimeError as e:
             print(f"[DB] Config error: {e}")
             self._collection = None
+            self._roles = None
+            self._bank = None
+            self._served = None
         except Exception as e:
             print(f"[DB] Atlas connection failed: {e}")
             print("[DB] Check MONGO_URI in .env and Atlas Network Access (whitelist your IP or 0.0.0.0/0).")
             self._collection = None
+            self._roles = None
+            self._bank = None
+            self._served = None
 
     @property
     def available(self) -> bool:
@@ -200,6 +220,133 @@ class Database:
             print(f"[DB] patch error: {e}")
             return False
 
+    def scan_users(self, fields: list) -> list:
+        """Every user document, projected to `fields` (for in-memory indexes built at startup)."""
+        if not self.available:
+            return []
+        try:
+            return list(self._collection.find({}, {**{f: 1 for f in fields}, "_id": 0}))
+        except Exception as e:
+            print(f"[DB] scan_users error: {e}")
+            return []
+
+    # ── Role-level shared data ────────────────────────────────────
+
+    def get_role(self, role_key: str) -> Optional[dict]:
+        """Fetch the shared document for a normalized role (None if missing)."""
+        if self._roles is None:
+            return None
+        try:
+            doc = self._roles.find_one({"role_key": role_key})
+            if doc:
+                doc.pop("_id", None)
+            return doc
+        except Exception as e:
+            print(f"[DB] get_role error: {e}")
+            return None
+
+    def upsert_role(self, role_key: str, patch: dict, unset: Optional[list] = None) -> bool:
+        """
+        Create or partially update the shared document for a normalized role.
+        `patch` keys may be dotted paths; `unset` lists paths to remove.
+        """
+        if self._roles is None:
+            return False
+        try:
+            _validate_no_sentinel_values(patch)
+            doc = {k: v for k, v in patch.items() if k != "_id"}
+            doc["role_key"] = role_key
+            update = {"$set": doc}
+            if unset:
+                update["$unset"] = {path: "" for path in unset}
+            self._roles.update_one({"role_key": role_key}, update, upsert=True)
+            return True
+        except ValueError as e:
+            print(f"[DB] VALIDATION ERROR - {e}")
+            return False
+        except Exception as e:
+            print(f"[DB] upsert_role error: {e}")
+            return False
+
+    def scan_roles(self, fields: list) -> list:
+        """Every roles document, projected to role_key + `fields`."""
+        if self._roles is None:
+            return []
+        try:
+            return list(self._roles.find({}, {**{f: 1 for f in fields}, "role_key": 1, "_id": 0}))
+        except Exception as e:
+            print(f"[DB] scan_roles error: {e}")
+            return []
+
+    # ── Question bank ─────────────────────────────────────────────
+
+    def get_question_pool(self, kind: str, key: str) -> Optional[dict]:
+        """Fetch a question pool ({kind, key, questions, updated_at}) or None."""
+        if self._bank is None:
+            return None
+        try:
+            doc = self._bank.find_one({"kind": kind, "key": key})
+            if doc:
+                doc.pop("_id", None)
+            return doc
+        except Exception as e:
+            print(f"[DB] get_question_pool error: {e}")
+            return None
+
+    def save_question_pool(self, kind: str, key: str, questions: list, updated_at: str) -> bool:
+        """Replace the question list of a pool (created if missing)."""
+        if self._bank is None:
+            return False
+        try:
+            self._bank.update_one(
+                {"kind": kind, "key": key},
+                {"$set": {"questions": questions, "updated_at": updated_at}},
+                upsert=True,
+            )
+            return True
+        except Exception as e:
+            print(f"[DB] save_question_pool error: {e}")
+            return False
+
+    # ── Served assessment questions ───────────────────────────────
+
+    def save_served_questions(self, user_id: str, key: str, doc: dict) -> bool:
+        """Record the questions a user was served for `key` (e.g. "action:<id>")."""
+        if self._served is None:
+            return False
+        try:
+            self._served.update_one(
+                {"user_id": user_id, "key": key},
+                {"$set": {**doc, "served_at": datetime.utcnow()}},
+                upsert=True,
+            )
+            return True
+        except Exception as e:
+            print(f"[DB] save_served_questions error: {e}")
+            return False
+
+    def get_served_questions(self, user_id: str, key: str) -> Optional[dict]:
+        """The record saved by save_served_questions(), or None."""
+        if self._served is None:
+            return None
+        try:
+            return self._served.find_one({"user_id": user_id, "key": key},
+                                         {"_id": 0, "user_id": 0, "key": 0, "served_at": 0})
+        except Exception as e:
+            print(f"[DB] get_served_questions error: {e}")
+            return None
+
+    def delete_served_questions(self, user_id: str, keys: list) -> bool:
+        """Forget served questions once they have been graded."""
+        if self._served is None:
+            return False
+        try:
+            self._served.delete_many({"user_id": user_id, "key": {"$in": list(keys)}})
+            return True
+        except Exception as e:
+            print(f"[DB] delete_served_questions error: {e}")
+            return False
+
 
 # Module-level singleton — imported everywhere as `from db import db`
 db = Database()
@@ -57,7 +57,10 @@ class RoadmapStepSchema(BaseModel):
 class ActiveRoadmapSchema(BaseModel):
     generated_for_role: str = ""
     steps: List[RoadmapStepSchema] = []
-    status: str = "not_started"
+    status: str = "not_started"   # not_started | generating | generated | failed
+    started_at: Optional[str] = None
+    completed_at: Optional[str] = None
+    error: Optional[str] = None
 
 
 class ProgressSchema(BaseModel):
@@ -94,6 +97,17 @@ class ResumeAnalysisSchema(BaseModel):
     processing_time_seconds: float = 0.0
 
 
+class MarketRefSchema(BaseModel):
+    role_key: str = ""               # → roles collection
+    role: str = ""
+    linked_at: Optional[str] = None
+
+
+class FeedbackMetaSchema(BaseModel):
+    fingerprint: str = ""            # hash of the FeedbackAgent inputs the report was built from
+    generated_at: Optional[str] = None
+
+
 class MetadataSchema(BaseModel):
     total_sessions: int = 0
     agent_interaction_count: Dict[str, Any] = {}
@@ -118,11 +132,22 @@ class UserDocument(BaseModel):
     current_actions: CurrentActionsSchema = Field(default_factory=CurrentActionsSchema)
     resume_analysis: ResumeAnalysisSchema = Field(default_factory=ResumeAnalysisSchema)
     metadata: MetadataSchema = Field(default_factory=MetadataSchema)
+    market_ref: MarketRefSchema = Field(default_factory=MarketRefSchema)
+    feedback_meta: FeedbackMetaSchema = Field(default_factory=FeedbackMetaSchema)
 
     # Internal confidence (maps to CLI confidence_score)
     confidence_score: int = 0
 
 
+class RoleDocument(BaseModel):
+    """Shared per-role document (roles collection) — one per normalized role."""
+    role_key: str
+    display_role: str = ""
+    market_analysis: Dict[str, Any] = {}
+    market_updated_at: Optional[str] = None
+    roadmap_templates: Dict[str, Any] = {}   # profile signature → {steps, created_at}
+
+
 # ═══════════════════════════════════════════════════════════════════
 #  REQUEST SCHEMAS (API inputs)
 # ═══════════════════════════════════════════════════════════════════
@@ -157,6 +182,18 @@ class ActionAssessRequest(BaseModel):
     answers: List[str]  # 10 answers to action questions
 
 
+class ActionSubmission(BaseModel):
+    """One action's answers inside a bulk assessment."""
+    action_id: str
+    answers: List[str]
+
+
+class ActionAssessBulkRequest(BaseModel):
+    """POST /api/action/assess/bulk — several actions assessed in one request"""
+    user_id: str
+    submissions: List[ActionSubmission]
+
+
 class ActionQuestionsRequest(BaseModel):
     """POST /api/action/questions — get questions for an action"""
     user_id: str
@@ -172,12 +209,14 @@ class RerouteRequest(BaseModel):
 class FeedbackRequest(BaseModel):
     """POST /api/feedback"""
     user_id: str
+    refresh: bool = False            # regenerate even if progress is unchanged
 
 
 class RoadmapRegenerateRequest(BaseModel):
     """POST /api/roadmap/regenerate"""
     user_id: str
     target_role: Optional[str] = None  # override role if switching
+    keep_progress: bool = False        # opt-in, same role: keep started months, rebuild the rest
 
 
 class HandsOnChatRequest(BaseModel):
@@ -212,6 +251,7 @@ class ReadinessResultResponse(BaseModel):
     safer_adjacent_roles: List[str]
     advanced_adjacent_roles: List[str]
     confidence_score: int
+    roadmap_status: str = ""      # roadmap is built in the background; poll /api/roadmap
 
 
 class DashboardResponse(BaseModel):
@@ -230,6 +270,11 @@ class RoadmapResponse(BaseModel):
     user_id: str
     roadmap: ActiveRoadmapSchema
     confidence_score: int
+    progress: Dict[str, Any] = {}   # stage, percent, elapsed_s, eta_s, error
+
+
+class RoadmapRegenerateResponse(RoadmapResponse):
+    regenerated: bool = True        # False: every month is under way, roadmap unchanged
 
 
 class ActionQuestionsResponse(BaseModel):
@@ -247,6 +292,19 @@ class ActionAssessResponse(BaseModel):
     reroute_check: Dict[str, Any]
 
 
+class ActionResult(BaseModel):
+    action_id: str
+    score: int
+    passed: bool
+    evaluation_summary: str
+
+
+class ActionAssessBulkResponse(BaseModel):
+    results: List[ActionResult]
+    updated_confidence_score: int
+    reroute_check: Dict[str, Any]
+
+
 class MarketResponse(BaseModel):
     user_id: str
     market_analysis: Dict[str, Any]
@@ -265,6 +323,7 @@ class RerouteResponse(BaseModel):
 class FeedbackResponse(BaseModel):
     user_id: str
     feedback_analysis: Dict[str, Any]
+    reused: bool = False             # stored report served (inputs unchanged)
 
 
 class HandsOnChatResponse(BaseModel):
@@ -6,13 +6,14 @@ No business logic lives here.
 """
 
 import os
+import math
 import asyncio
 from contextlib import asynccontextmanager
 from typing import Optional
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks, File, UploadFile, Form
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 import tempfile
 import time
 import shutil
@@ -30,13 +31,30 @@ from backend.database.schemas import (
     ReadinessEvaluateRequest, ReadinessResultResponse,
     ActionQuestionsRequest, ActionQuestionsResponse,
     ActionAssessRequest, ActionAssessResponse,
-    RoadmapRegenerateRequest, RoadmapResponse,
+    ActionAssessBulkRequest, ActionAssessBulkResponse,
+    RoadmapRegenerateRequest, RoadmapRegenerateResponse, RoadmapResponse,
     RerouteRequest, RerouteResponse,
     FeedbackRequest, FeedbackResponse,
     HandsOnChatRequest, HandsOnChatResponse,
     DashboardResponse,
 )
 from backend.agents import orchestrator_wrapper as ow
+from backend.agents.agentic_career_navigator import (
+    RoadmapGenerationError,
+    llm_backend,
+    llm_cache,
+    llm_flight,
+    llm_governor,
+    llm_router,
+    llm_telemetry,
+    prompt_builder,
+)
+from backend.core.llm_governor import LLMThrottledError
+from backend.core.json_repair import json_repair_stats
+from backend.core.http_clients import client_registry
+from backend.core.role_canon import role_canon
+from backend.core.answer_screen import answer_screen
+from backend.core.role_graph import role_graph
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -50,7 +68,13 @@ async def lifespan(app: FastAPI):
     print("╚══════════════════════════════════════════╝")
     print(f"  MongoDB: {'✓ Connected' if db.available else '✗ Not available'}")
     print(f"  GROQ_API_KEY: {'✓ Set' if os.getenv('GROQ_API_KEY') else '✗ MISSING'}")
+    print(f"  Groq HTTP pool: {'HTTP/2' if client_registry.http2 else 'HTTP/1.1'} keep-alive, "
+          f"max {client_registry.limits.max_connections} connections")
+    if db.available:
+        loaded = await asyncio.to_thread(role_graph.load, db)
+        print(f"  Role graph: {loaded['roles']} market analyses, {loaded['users']} readiness results")
     yield
+    await client_registry.aclose()
     print("Nexus-AI Backend shutting down.")
 
 
@@ -72,6 +96,15 @@ app.add_middleware(
 )
 
 
+def _throttled(e: LLMThrottledError) -> HTTPException:
+    """Groq saturation → 503 + Retry-After instead of a generic 500."""
+    return HTTPException(
+        status_code=503,
+        detail=str(e),
+        headers={"Retry-After": str(math.ceil(e.retry_after))},
+    )
+
+
 # ═══════════════════════════════════════════════════════════════════
 #  HEALTH CHECK
 # ═══════════════════════════════════════════════════════════════════
@@ -82,9 +115,39 @@ async def health():
         "status": "ok",
         "mongo": db.available,
         "groq_key_set": bool(os.getenv("GROQ_API_KEY")),
+        "llm_backend": llm_backend.describe(),
+        "llm_cache": llm_cache.stats(),
+        "llm_singleflight": llm_flight.stats(),
+        "llm_governor": llm_governor.stats(),
+        "llm_router": llm_router.stats(),
+        "prompt_builder": prompt_builder.stats(),
+        "json_repair": json_repair_stats.stats(),
+        "background_jobs": ow.background_job_stats(),
+        "role_canon": role_canon.stats(),
+        "question_bank": ow.question_bank.stats(),
+        "prefetch": ow.question_prefetch.stats(),
+        "roadmap_templates": ow.roadmap_templates.stats(),
+        "answer_screen": answer_screen.stats(),
+        "role_graph": role_graph.stats(),
     }
 
 
+# ═══════════════════════════════════════════════════════════════════
+#  METRICS
+#  GET /metrics — Prometheus text format (per-agent LLM telemetry)
+# ═══════════════════════════════════════════════════════════════════
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    body = llm_telemetry.render_prometheus(
+        cache_stats=llm_cache.stats(),
+        governor_stats=llm_governor.stats(),
+        flight_stats=llm_flight.stats(),
+        repair_stats=json_repair_stats.stats(),
+    )
+    return PlainTextResponse(body, media_type="text/plain; version=0.0.4")
+
+
 # ═══════════════════════════════════════════════════════════════════
 #  1. ONBOARDING
 #  POST /api/onboard
@@ -94,7 +157,7 @@ async def health():
 @app.post("/api/onboard", response_model=OnboardResponse)
 async def onboard(body: OnboardRequest):
     try:
-        result = ow.onboard_user(body.model_dump())
+        result = await ow.onboard_user(body.model_dump())
         
         # Ensure response includes all required fields
         exists_flag = result.get("exists", False)
@@ -111,6 +174,8 @@ async def onboard(body: OnboardRequest):
             profile=profile,
             exists=exists_flag,  # EXPLICIT - must be included!
         )
+    except LLMThrottledError as e:
+        raise _throttled(e)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -124,11 +189,13 @@ async def onboard(body: OnboardRequest):
 @app.post("/api/readiness/start", response_model=ReadinessQuestionsResponse)
 async def readiness_start(body: ReadinessStartRequest):
     try:
-        questions = ow.readiness_start(body.user_id)
+        questions = await ow.readiness_start(body.user_id)
         return ReadinessQuestionsResponse(
             user_id=body.user_id,
             questions=questions,
         )
+    except LLMThrottledError as e:
+        raise _throttled(e)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -139,16 +206,19 @@ async def readiness_start(body: ReadinessStartRequest):
 #  2b. READINESS — EVALUATE ANSWERS
 #  POST /api/readiness/evaluate
 #  GPT evaluates answers; only score+summary saved to MongoDB.
+#  The roadmap is then generated in the background (poll GET /api/roadmap).
 # ═══════════════════════════════════════════════════════════════════
 
 @app.post("/api/readiness/evaluate", response_model=ReadinessResultResponse)
 async def readiness_evaluate(body: ReadinessEvaluateRequest):
     try:
-        result = ow.readiness_evaluate(body.user_id, body.answers)
+        result = await ow.readiness_evaluate(body.user_id, body.answers)
         return ReadinessResultResponse(
             user_id=body.user_id,
             **result,
         )
+    except LLMThrottledError as e:
+        raise _throttled(e)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -163,7 +233,7 @@ async def readiness_evaluate(body: ReadinessEvaluateRequest):
 @app.get("/api/dashboard/{user_id}")
 async def dashboard(user_id: str):
     try:
-        return ow.get_dashboard(user_id)
+        return await ow.get_dashboard(user_id)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -173,12 +243,13 @@ async def dashboard(user_id: str):
 # ═══════════════════════════════════════════════════════════════════
 #  4a. ROADMAP — GET CURRENT
 #  GET /api/roadmap/{user_id}
+#  Includes stage progress while the roadmap is still generating.
 # ═══════════════════════════════════════════════════════════════════
 
 @app.get("/api/roadmap/{user_id}", response_model=RoadmapResponse)
 async def get_roadmap(user_id: str):
     try:
-        result = ow.get_roadmap(user_id)
+        result = await ow.get_roadmap(user_id)
         return RoadmapResponse(**result)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -191,11 +262,16 @@ async def get_roadmap(user_id: str):
 #  POST /api/roadmap/regenerate
 # ═══════════════════════════════════════════════════════════════════
 
-@app.post("/api/roadmap/regenerate", response_model=RoadmapResponse)
+@app.post("/api/roadmap/regenerate", response_model=RoadmapRegenerateResponse)
 async def roadmap_regenerate(body: RoadmapRegenerateRequest):
     try:
-        result = ow.regenerate_roadmap(body.user_id, body.target_role)
-        return RoadmapResponse(**result)
+        result = await ow.regenerate_roadmap(body.user_id, body.target_role, body.keep_progress)
+        return RoadmapRegenerateResponse(**result)
+    except LLMThrottledError as e:
+        raise _throttled(e)
+    except RoadmapGenerationError as e:
+        # The model kept returning an unusable roadmap — upstream failure, not "not found"
+        raise HTTPException(status_code=502, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -211,8 +287,10 @@ async def roadmap_regenerate(body: RoadmapRegenerateRequest):
 @app.post("/api/action/questions", response_model=ActionQuestionsResponse)
 async def action_questions(body: ActionQuestionsRequest):
     try:
-        result = ow.get_action_questions(body.user_id, body.action_id)
+        result = await ow.get_action_questions(body.user_id, body.action_id)
         return ActionQuestionsResponse(**result)
+    except LLMThrottledError as e:
+        raise _throttled(e)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -228,8 +306,29 @@ async def action_questions(body: ActionQuestionsRequest):
 @app.post("/api/action/assess", response_model=ActionAssessResponse)
 async def action_assess(body: ActionAssessRequest):
     try:
-        result = ow.assess_action(body.user_id, body.action_id, body.answers)
+        result = await ow.assess_action(body.user_id, body.action_id, body.answers)
         return ActionAssessResponse(**result)
+    except LLMThrottledError as e:
+        raise _throttled(e)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# ═══════════════════════════════════════════════════════════════════
+#  5c. ACTION — BULK ASSESS
+#  POST /api/action/assess/bulk
+#  Several actions evaluated concurrently; one MongoDB write, one reroute check.
+# ═══════════════════════════════════════════════════════════════════
+
+@app.post("/api/action/assess/bulk", response_model=ActionAssessBulkResponse)
+async def action_assess_bulk(body: ActionAssessBulkRequest):
+    try:
+        result = await ow.assess_actions(body.user_id, [s.model_dump() for s in body.submissions])
+        return ActionAssessBulkResponse(**result)
+    except LLMThrottledError as e:
+        raise _throttled(e)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -244,7 +343,9 @@ async def action_assess(body: ActionAssessRequest):
 @app.get("/api/market/{user_id}")
 async def market(user_id: str):
     try:
-        return ow.get_market(user_id)
+        return await ow.get_market(user_id)
+    except LLMThrottledError as e:
+        raise _throttled(e)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -259,8 +360,10 @@ async def market(user_id: str):
 @app.post("/api/reroute", response_model=RerouteResponse)
 async def reroute(body: RerouteRequest):
     try:
-        result = ow.handle_reroute(body.user_id, body.new_role)
+        result = await ow.handle_reroute(body.user_id, body.new_role)
         return RerouteResponse(**result)
+    except LLMThrottledError as e:
+        raise _throttled(e)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -275,8 +378,10 @@ async def reroute(body: RerouteRequest):
 @app.post("/api/feedback", response_model=FeedbackResponse)
 async def feedback(body: FeedbackRequest):
     try:
-        result = ow.generate_feedback(body.user_id)
+        result = await ow.generate_feedback(body.user_id, body.refresh)
         return FeedbackResponse(**result)
+    except LLMThrottledError as e:
+        raise _throttled(e)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -291,12 +396,14 @@ async def feedback(body: FeedbackRequest):
 @app.post("/api/hands-on/chat", response_model=HandsOnChatResponse)
 async def hands_on_chat(body: HandsOnChatRequest):
     try:
-        result = ow.hands_on_chat(
+        result = await ow.hands_on_chat(
             body.user_id,
             body.message,
             body.conversation_history,
         )
         return HandsOnChatResponse(**result)
+    except LLMThrottledError as e:
+        raise _throttled(e)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -315,8 +422,10 @@ async def extract_resume_skills(body: dict):
         if not resume_text:
             raise ValueError("resume_text is required")
         
-        result = ow.extract_skills_from_resume(resume_text)
+        result = await ow.extract_skills_from_resume(resume_text)
         return JSONResponse(content=result)
+    except LLMThrottledError as e:
+        raise _throttled(e)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -376,7 +485,7 @@ async def upload_resume(file: UploadFile = File(...), user_id: str = Form(...)):
             raise ValueError("Failed to create temporary file")
         
         # Process resume with ResumeAnalyzerAgent
-        result = ow.analyze_resume_file(
+        result = await ow.analyze_resume_file(
             user_id=user_id,
             file_path=tmp_path,
             file_name=file.filename
@@ -384,6 +493,8 @@ async def upload_resume(file: UploadFile = File(...), user_id: str = Form(...)):
         
         return JSONResponse(content=result)
     
+    except LLMThrottledError as e:
+        raise _throttled(e)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
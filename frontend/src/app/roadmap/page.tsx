@@ -10,6 +10,8 @@
  *   2. User answers all 10 (1 per screen)
  *   3. POST /api/action/assess     → ActionAssessmentAgent evaluates, updates score + confidence
  * After submit the action card refreshes to show passed/failed + score.
+ * The roadmap is built in the background after the readiness assessment:
+ * while progress.stage is "generating" the page polls GET /api/roadmap.
  */
 import { useEffect, useState, useCallback } from "react";
 import { motion, AnimatePresence } from "framer-motion";
@@ -412,6 +414,8 @@ function AssessmentModal({ action, userId, onClose, onComplete }: AssessmentModa
 }
 
 // ── Main page ────────────────────────────────────────────────────
+const ROADMAP_POLL_MS = 2000;
+
 export default function RoadmapPage() {
   const params   = useSearchParams();
   const storeUid = useStore((s) => s.userId);
@@ -432,6 +436,14 @@ export default function RoadmapPage() {
 
   useEffect(() => { fetchRoadmap(); }, [fetchRoadmap]);
 
+  // Poll while the background roadmap stage is still running
+  const stage = roadmap?.progress?.stage || roadmap?.roadmap?.status;
+  useEffect(() => {
+    if (stage !== "generating") return;
+    const timer = setTimeout(fetchRoadmap, ROADMAP_POLL_MS);
+    return () => clearTimeout(timer);
+  }, [stage, roadmap, fetchRoadmap]);
+
   // After assessment completes, close modal + refresh roadmap data
   function handleComplete(_result: any) {
     setAssessing(null);
@@ -531,7 +543,22 @@ export default function RoadmapPage() {
         </motion.div>
 
         {/* Roadmap steps accordion */}
-        {steps.length === 0 ? (
+        {steps.length === 0 && stage === "generating" ? (
+          <motion.div 
+            initial={{ opacity: 0, y: 10 }}
+            animate={{ opacity: 1, y: 0 }}
+            className="glass p-16 text-center rounded-2xl border border-white/[0.08]"
+          >
+            <div className="w-16 h-16 rounded-2xl bg-blue-500/10 flex items-center justify-center mx-auto mb-4">
+              <Loader2 className="text-blue-400 animate-spin" size={24} />
+            </div>
+            <p className="text-white/50 font-medium">Generating your roadmap… {roadmap?.progress?.percent ?? 0}%</p>
+            <p className="text-white/30 text-sm mt-2">
+              {roadmap?.progress?.eta_s ? `About ${Math.ceil(roadmap.progress.eta_s)}s left. ` : ""}
+              This page updates automatically.
+            </p>
+          </motion.div>
+        ) : steps.length === 0 ? (
           <motion.div 
             initial={{ opacity: 0, y: 10 }}
             animate={{ opacity: 1, y: 0 }}
@@ -540,8 +567,17 @@ export default function RoadmapPage() {
             <div className="w-16 h-16 rounded-2xl bg-blue-500/10 flex items-center justify-center mx-auto mb-4">
               <AlertCircle className="text-blue-400" size={24} />
             </div>
-            <p className="text-white/50 font-medium">No roadmap generated yet</p>
-            <p className="text-white/30 text-sm mt-2">Complete the readiness assessment first to generate your personalized 5-month roadmap.</p>
+            {stage === "failed" ? (
+              <>
+                <p className="text-white/50 font-medium">Roadmap generation failed</p>
+                <p className="text-white/30 text-sm mt-2">{roadmap?.progress?.error || roadmap?.roadmap?.error || "Please regenerate your roadmap."}</p>
+              </>
+            ) : (
+              <>
+                <p className="text-white/50 font-medium">No roadmap generated yet</p>
+                <p className="text-white/30 text-sm mt-2">Complete the readiness assessment first to generate your personalized 5-month roadmap.</p>
+              </>
+            )}
           </motion.div>
         ) : (
           <motion.div 
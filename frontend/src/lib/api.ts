@@ -111,9 +111,9 @@ export const getRoadmap = async (user_id: string) => {
   return res.data;
 };
 
-/** POST /api/roadmap/regenerate */
-export const regenerateRoadmap = async (user_id: string, target_role?: string) => {
-  const res = await api.post("/api/roadmap/regenerate", { user_id, target_role });
+/** POST /api/roadmap/regenerate — keep_progress keeps the months already started */
+export const regenerateRoadmap = async (user_id: string, target_role?: string, keep_progress = false) => {
+  const res = await api.post("/api/roadmap/regenerate", { user_id, target_role, keep_progress });
   return res.data;
 };
 
@@ -0,0 +1,81 @@
+"""Shared fixtures: an in-memory stand-in for the MongoDB `db` singleton."""
+
+import copy
+
+import pytest
+
+from backend.database.db import db
+
+
+def _set_path(doc, dotted, value):
+    """Apply one `$set` entry ("a.b.c": value) to a nested dict."""
+    parts = dotted.split(".")
+    for part in parts[:-1]:
+        doc = doc.setdefault(part, {})
+    doc[parts[-1]] = copy.deepcopy(value)
+
+
+class FakeStore:
+    """Dict-backed subset of backend.database.db.Database used by the wrapper."""
+
+    def __init__(self):
+        self.users = {}
+        self.roles = {}
+
+    def get_user(self, user_id):
+        return copy.deepcopy(self.users.get(user_id))
+
+    def upsert_user(self, user_id, doc):
+        self.users[user_id] = copy.deepcopy(doc)
+        return True
+
+    def find_by_email(self, email):
+        for doc in self.users.values():
+            if doc.get("profile", {}).get("email") == email:
+                return copy.deepcopy(doc)
+        return None
+
+    def patch_user(self, user_id, patch):
+        if user_id not in self.users:
+            return False
+        for key, value in patch.items():
+            _set_path(self.users[user_id], key, value)
+        return True
+
+    def get_role(self, role_key):
+        return copy.deepcopy(self.roles.get(role_key))
+
+    def upsert_role(self, role_key, patch, unset=None):
+        doc = self.roles.setdefault(role_key, {"role_key": role_key})
+        for key, value in patch.items():
+            _set_path(doc, key, value)
+        for dotted in unset or []:
+            *parents, leaf = dotted.split(".")
+            target = doc
+            for part in parents:
+                target = target.get(part, {})
+            target.pop(leaf, None)
+        return True
+
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    store = FakeStore()
+    for name in ("get_user", "upsert_user", "find_by_email", "patch_user",
+                 "get_role", "upsert_role"):
+        monkeypatch.setattr(db, name, getattr(store, name))
+    return store
+
+
+def make_user(user_id="u1", role="Data Engineer", **extra):
+    """Minimal onboarded user document."""
+    doc = {
+        "user_id": user_id,
+        "profile": {"email": f"{user_id}@example.com", "target_role": role,
+                    "skills": ["python", "sql"], "strengths": ["sql"], "weaknesses": ["cloud"]},
+        "career_state": {"current_target_role": role, "role_history": []},
+        "confidence_score": 50,
+        "progress": {"actions_completed": 0, "actions_failed": 0},
+    }
+    doc.update(extra)
+    return doc
@@ -0,0 +1,57 @@
+import asyncio
+import time
+
+import pytest
+
+from backend.core.agent_graph import AgentGraph, GraphCycleError
+
+
+def test_async_branches_run_concurrently_and_receive_dependencies():
+    async def slow(value):
+        await asyncio.sleep(0.05)
+        return value
+
+    graph = (AgentGraph("t")
+             .add("a", lambda deps: slow(1))
+             .add("b", lambda deps: slow(2))
+             .add("sum", lambda deps: slow(deps["a"] + deps["b"]), deps=("a", "b")))
+    start = time.time()
+    result = asyncio.run(graph.arun())
+    assert result.value("sum") == 3
+    assert time.time() - start < 0.14        # a and b overlapped
+
+
+def test_failure_skips_only_dependent_branches():
+    async def ok(deps):
+        return "ok"
+
+    async def boom(deps):
+        raise RuntimeError("down")
+
+    graph = (AgentGraph("t")
+             .add("bad", boom)
+             .add("child", ok, deps=("bad",))
+             .add("other", ok))
+    result = asyncio.run(graph.arun())
+    assert result.ok("other") and result.value("other") == "ok"
+    assert isinstance(result.error("bad"), RuntimeError)
+    assert result.branches["child"].skipped
+    assert sorted(result.failed) == ["bad", "child"]
+    assert result.value("child", "fallback") == "fallback"
+
+
+def test_sync_run_matches_async_semantics():
+    graph = (AgentGraph("t")
+             .add("a", lambda deps: 2)
+             .add("b", lambda deps: deps["a"] * 5, deps=("a",)))
+    result = graph.run()
+    assert result.value("b") == 10 and not result.failed
+
+
+def test_unknown_dependency_and_cycle_are_rejected():
+    with pytest.raises(GraphCycleError):
+        AgentGraph().add("a", lambda deps: 1, deps=("missing",)).run()
+    with pytest.raises(GraphCycleError):
+        (AgentGraph()
+         .add("a", lambda deps: 1, deps=("b",))
+         .add("b", lambda deps: 1, deps=("a",))).run()
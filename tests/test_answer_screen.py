@@ -0,0 +1,94 @@
+import asyncio
+
+from backend.agents import agentic_career_navigator as nav
+from backend.core.answer_screen import AnswerScreen
+
+CONCISE = [
+    ("Which structure gives O(1) average lookups: a hash table or a B-tree?", "Hash table"),
+    ("Which HTTP status code means the resource was not found?", "404"),
+    ("Which SQL clause filters rows after GROUP BY?", "HAVING"),
+    ("Which keyword turns a Python function into a generator?", "yield"),
+    ("What is the time complexity of binary search?", "It is O(log n)"),
+    ("Name a batteries-included Python web framework.", "Django"),
+    ("What does `None == None` evaluate to in Python?", "True"),
+    ("Which statement does nothing in Python?", "pass"),
+    ("Does HTTPS encrypt request headers?", "Yes"),
+    ("Which git command uploads local commits?", "git push"),
+]
+
+
+def _pairs(items):
+    return [{"question": q, "answer": a} for q, a in items]
+
+
+def test_concise_correct_answers_are_kept():
+    result = AnswerScreen().screen(_pairs(CONCISE))
+    assert result.dropped == 0
+    assert len(result.kept) == len(CONCISE)
+    assert not result.short_circuit
+
+
+def test_non_answers_are_dropped_but_still_evaluated():
+    items = CONCISE[:2] + [
+        ("What is a closure?", ""),
+        ("What is a mutex?", "idk"),
+        ("What is a deadlock?", "What is a deadlock?"),
+    ]
+    result = AnswerScreen().screen(_pairs(items))
+    assert result.reasons == {"blank": 1, "non_answer": 1, "copied_question": 1}
+    assert [p["answer"] for p in result.kept] == ["Hash table", "404"]
+    assert not result.short_circuit
+
+
+def test_copy_needs_both_word_sets_to_match():
+    screen = AnswerScreen()
+    question = "Which is faster for lookups, a hash table or a linked list?"
+    assert screen.classify(question, "A hash table") is None
+    assert screen.classify(question, "which is FASTER for lookups: hash table or linked list") == "copied_question"
+
+
+def test_repeats_count_only_for_substantial_answers():
+    pasted = "Indexes speed up reads because the database avoids a full scan"
+    items = [("What does an index do?", pasted), ("When is an index harmful?", pasted),
+             ("Is a primary key indexed?", "Yes"), ("Is a unique key indexed?", "Yes")]
+    result = AnswerScreen().screen(_pairs(items))
+    assert result.reasons == {"repeated": 1}
+    assert [p["answer"] for p in result.kept] == [pasted, "Yes", "Yes"]
+
+
+def test_only_long_unrelated_answers_are_off_topic():
+    screen = AnswerScreen()
+    recipe = ("Preheat oven, whisk eggs with sugar, fold flour gently, bake forty minutes "
+              "until golden, cool completely before slicing and serving warm")
+    closure = ("A function bundled together with references to its surrounding lexical "
+               "environment, capturing variables after the outer function returns")
+    items = [("What is a closure in JavaScript?", closure),
+             ("How does a JavaScript function capture variables?", "By reference"),
+             ("What is hoisting?", recipe)]
+    result = screen.screen(_pairs(items), context="JavaScript Developer")
+    assert result.reasons == {"off_topic": 1}
+    assert [p["answer"] for p in result.kept] == [closure, "By reference"]
+    assert screen.classify("What is hoisting?", "Cake") is None
+
+
+def test_all_non_answers_short_circuit_with_zero():
+    result = AnswerScreen().screen(_pairs([("Q1?", "idk"), ("Q2?", " "), ("Q3?", "N/A")]))
+    assert result.short_circuit
+    assert result.local_score == 0
+    assert result.kept == []
+
+
+def test_short_circuit_skips_the_llm(monkeypatch):
+    async def no_llm(*args, **kwargs):
+        raise AssertionError("the LLM must not be called")
+
+    monkeypatch.setattr(nav, "acall_llm", no_llm)
+    result = asyncio.run(nav.ActionAssessmentAgent()._aevaluate(
+        "SQL indexing", "Data Engineer", _pairs([("Q1?", "idk"), ("Q2?", "")])))
+    assert result["action_score"] == 0
+
+
+def test_disabled_screen_keeps_everything():
+    result = AnswerScreen(enabled=False).screen(_pairs([("Q?", "idk")]))
+    assert result.kept == [{"question": "Q?", "answer": "idk"}]
+    assert not result.short_circuit
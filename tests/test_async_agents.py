@@ -0,0 +1,54 @@
+import asyncio
+import json
+import time
+
+from backend.agents import agentic_career_navigator as nav
+from backend.agents import orchestrator_wrapper as ow
+from tests.conftest import make_user
+
+ROADMAP = json.dumps({"steps": [
+    {"month": m, "step_title": f"Month {m}",
+     "actions": [{"action_title": f"Task {m}.{w}"} for w in range(1, 5)]}
+    for m in range(1, 6)
+]})
+
+
+def _scripted_llm(monkeypatch, reply, delay=0.0):
+    calls = []
+
+    async def fake(system, user, max_tokens=2048, **kwargs):
+        calls.append(user)
+        await asyncio.sleep(delay)
+        return reply
+
+    monkeypatch.setattr(nav, "acall_llm", fake)
+    return calls
+
+
+def test_agent_runs_overlap_on_one_event_loop(monkeypatch):
+    _scripted_llm(monkeypatch, ROADMAP, delay=0.1)
+    agent = nav.RoadmapAgent()
+
+    async def run():
+        return await asyncio.gather(
+            agent.arun({"target_role": "Data Engineer", "skills": ["sql"]}),
+            agent.arun({"target_role": "Cloud Engineer", "skills": ["aws"]}),
+        )
+
+    start = time.time()
+    first, second = asyncio.run(run())
+    assert time.time() - start < 0.18
+    assert first["generated_for_role"] == "Data Engineer"
+    assert [a["action_id"] for a in second["steps"][4]["actions"]] == [
+        "action_17", "action_18", "action_19", "action_20"]
+
+
+def test_wrapper_awaits_agents_and_persists(fake_db, monkeypatch):
+    _scripted_llm(monkeypatch, ROADMAP)
+    fake_db.users["u1"] = make_user(progress={"actions_completed": 3, "actions_failed": 1})
+
+    result = asyncio.run(ow.regenerate_roadmap("u1"))
+    stored = fake_db.users["u1"]
+    assert len(result["roadmap"]["steps"]) == 5
+    assert stored["active_roadmap"]["steps"] == result["roadmap"]["steps"]
+    assert stored["progress"] == {"actions_completed": 0, "actions_failed": 0}
@@ -0,0 +1,42 @@
+import asyncio
+
+from backend.core.background_jobs import BackgroundJobs
+
+
+def test_new_job_for_a_key_supersedes_the_old_one():
+    async def run():
+        jobs, done = BackgroundJobs(), []
+
+        async def work(name, delay):
+            await asyncio.sleep(delay)
+            done.append(name)
+
+        first = jobs.start("user", lambda: work("first", 0.05))
+        jobs.start("user", lambda: work("second", 0.01))
+        await asyncio.sleep(0.1)
+        return jobs, done, first
+
+    jobs, done, first = asyncio.run(run())
+    assert done == ["second"] and first.cancelled()
+    assert jobs.stats() == {"started": 2, "completed": 1, "failed": 0, "cancelled": 1, "running": 0}
+
+
+def test_running_cancel_and_failures():
+    async def run():
+        jobs = BackgroundJobs()
+
+        async def boom():
+            raise RuntimeError("down")
+
+        jobs.start("a", lambda: asyncio.sleep(1))
+        jobs.start("b", boom)
+        running = jobs.running("a")
+        cancelled = jobs.cancel("a")
+        await asyncio.sleep(0.01)
+        return jobs, running, cancelled
+
+    jobs, running, cancelled = asyncio.run(run())
+    assert running and cancelled
+    assert not jobs.running("a") and jobs.get("a") is None
+    assert not jobs.cancel("a")
+    assert jobs.stats()["failed"] == 1 and jobs.stats()["cancelled"] == 1
@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+
+from backend.agents import orchestrator_wrapper as ow
+from backend.core.llm_governor import LLMThrottledError
+from tests.conftest import make_user
+
+SCORES = {"Task 1.1": 80, "Task 1.2": 30, "Task 2.1": 90}
+
+
+def _roadmap():
+    return {"steps": [{"month": m, "step_title": f"Month {m}",
+                       "actions": [{"action_id": f"action_{(m - 1) * 4 + w}", "week": w,
+                                    "action_title": f"Task {m}.{w}", "status": "pending", "score": None}
+                                   for w in range(1, 5)]}
+                      for m in (1, 2)]}
+
+
+@pytest.fixture
+def bulk(fake_db, monkeypatch):
+    """A user with served questions for three actions and scripted agents."""
+    fake_db.users["u1"] = make_user(active_roadmap=_roadmap(), career_state={
+        "current_target_role": "Data Engineer", "role_history": ["Data Analyst"]})
+    for action_id, title in (("action_1", "Task 1.1"), ("action_2", "Task 1.2"), ("action_5", "Task 2.1")):
+        ow._session_cache.setdefault("u1", {})[f"action_q_{action_id}"] = {
+            "questions": [f"{title} question {i}?" for i in range(10)], "action_title": title}
+
+    calls = {"evaluate": [], "reroute": 0, "writes": 0}
+
+    async def evaluate(title, role, qa_pairs):
+        calls["evaluate"].append(title)
+        if title == "throttled":
+            raise LLMThrottledError("busy", retry_after=3)
+        return {"action_score": SCORES[title], "evaluation_summary": f"{title} reviewed"}
+
+    async def reroute(input_data):
+        calls["reroute"] += 1
+        return {"reroute_suggestion": False, "suggested_roles": []}
+
+    patch_user = fake_db.patch_user
+
+    def counting_patch(user_id, patch):
+        calls["writes"] += 1
+        return patch_user(user_id, patch)
+
+    monkeypatch.setattr(ow._action_agent, "_aevaluate", evaluate)
+    monkeypatch.setattr(ow._rerouting_agent, "arun", reroute)
+    monkeypatch.setattr(ow, "_prefetch_action_questions", lambda *a, **kw: None)
+    monkeypatch.setattr(ow.db, "patch_user", counting_patch)
+    yield calls
+    ow._session_cache.pop("u1", None)
+
+
+def test_bulk_applies_in_roadmap_order_with_one_write(fake_db, bulk):
+    submissions = [{"action_id": a, "answers": ["answer"] * 10} for a in ("action_5", "action_1", "action_2")]
+    result = asyncio.run(ow.assess_actions("u1", submissions))
+
+    assert [(r["action_id"], r["passed"]) for r in result["results"]] == [
+        ("action_1", True), ("action_2", False), ("action_5", True)]
+    assert result["updated_confidence_score"] == 51
+    assert bulk["writes"] == 1 and bulk["reroute"] == 1
+    stored = fake_db.users["u1"]
+    assert stored["progress"]["actions_completed"] == 2 and stored["progress"]["actions_failed"] == 1
+    assert stored["active_roadmap"]["steps"][1]["actions"][0]["score"] == 90
+    assert not ow._session_cache["u1"]
+
+
+def test_throttled_evaluation_writes_nothing(fake_db, bulk):
+    ow._session_cache["u1"]["action_q_action_2"]["action_title"] = "throttled"
+    submissions = [{"action_id": a, "answers": ["answer"] * 10} for a in ("action_1", "action_2")]
+    with pytest.raises(LLMThrottledError):
+        asyncio.run(ow.assess_actions("u1", submissions))
+    assert bulk["writes"] == 0
+    assert fake_db.users["u1"]["confidence_score"] == 50
+
+
+def test_empty_and_duplicate_submissions_are_rejected(fake_db, bulk):
+    with pytest.raises(ValueError):
+        asyncio.run(ow.assess_actions("u1", []))
+    with pytest.raises(ValueError):
+        asyncio.run(ow.assess_actions("u1", [{"action_id": "action_1", "answers": []}] * 2))
+
+
+def test_single_endpoint_shares_the_same_helpers(fake_db, bulk):
+    result = asyncio.run(ow.assess_action("u1", "action_2", ["answer"] * 10))
+    assert result["score"] == 30 and not result["passed"]
+    assert result["updated_confidence_score"] == 49
+    assert bulk["writes"] == 1 and bulk["reroute"] == 1
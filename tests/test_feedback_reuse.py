@@ -0,0 +1,62 @@
+import asyncio
+from datetime import date, timedelta
+
+import pytest
+
+from backend.agents import orchestrator_wrapper as ow
+from tests.conftest import make_user
+
+
+@pytest.fixture
+def feedback_agent(monkeypatch):
+    calls = []
+
+    async def fake(input_data, use_cache=True):
+        calls.append((input_data, use_cache))
+        checkpoint = (date.today() + timedelta(days=14)).isoformat()
+        return {"feedback_analysis": {"summary": f"report {len(calls)}",
+                                      "next_checkpoint_date": checkpoint}}
+
+    monkeypatch.setattr(ow._feedback_agent, "arun", fake)
+    return calls
+
+
+def test_unchanged_inputs_reuse_the_stored_report(fake_db, feedback_agent):
+    fake_db.users["u1"] = make_user()
+    first = asyncio.run(ow.generate_feedback("u1"))
+    second = asyncio.run(ow.generate_feedback("u1"))
+
+    assert len(feedback_agent) == 1
+    assert (first["reused"], second["reused"]) == (False, True)
+    assert second["feedback_analysis"] == first["feedback_analysis"]
+    assert fake_db.users["u1"]["feedback_meta"]["fingerprint"]
+
+
+def test_progress_refresh_and_checkpoint_regenerate(fake_db, feedback_agent):
+    fake_db.users["u1"] = make_user()
+    asyncio.run(ow.generate_feedback("u1"))
+
+    fake_db.users["u1"]["progress"]["actions_completed"] = 1
+    assert not asyncio.run(ow.generate_feedback("u1"))["reused"]
+
+    assert not asyncio.run(ow.generate_feedback("u1", refresh=True))["reused"]
+    assert [use_cache for _, use_cache in feedback_agent] == [True, True, False]
+
+    fake_db.users["u1"]["feedback_analysis"]["next_checkpoint_date"] = date.today().isoformat()
+    assert not asyncio.run(ow.generate_feedback("u1"))["reused"]
+    assert len(feedback_agent) == 4
+
+
+def test_fingerprint_ignores_role_spelling_and_completion_noise():
+    base = {"target_role": "Data Engineer", "confidence_score": 50, "completed_actions_count": 2,
+            "failed_actions_count": 1, "roadmap_progress_percentage": 15.0}
+    same = dict(base, target_role="  data   engineer", roadmap_progress_percentage=15.01)
+    other = dict(base, confidence_score=51)
+    assert ow._feedback_fingerprint(base) == ow._feedback_fingerprint(same)
+    assert ow._feedback_fingerprint(base) != ow._feedback_fingerprint(other)
+
+
+def test_report_without_fingerprint_regenerates_once(fake_db, feedback_agent):
+    fake_db.users["u1"] = make_user(feedback_analysis={"summary": "legacy"})
+    assert not asyncio.run(ow.generate_feedback("u1"))["reused"]
+    assert asyncio.run(ow.generate_feedback("u1"))["reused"]
@@ -0,0 +1,81 @@
+import asyncio
+import itertools
+import time
+
+import pytest
+
+from backend.core.hedging import HedgePolicy, ahedge, hedge_sync
+from backend.core.telemetry import LLMTelemetry
+
+
+def test_policy_ops_and_learned_delay():
+    policy = HedgePolicy(ops=["A.questions"], default_delay=8.0, min_delay=1.0, min_samples=5)
+    assert policy.enabled("A", "questions") and not policy.enabled("A", "run")
+    telemetry = LLMTelemetry()
+    assert policy.delay("A", "questions", telemetry) == 8.0
+    for latency in (0.1, 0.2, 0.3, 0.4, 3.0):
+        telemetry.observe("A", "questions", latency)
+    assert policy.delay("A", "questions", telemetry) == 3.0
+    telemetry = LLMTelemetry()
+    for _ in range(5):
+        telemetry.observe("A", "questions", 0.1)
+    assert policy.delay("A", "questions", telemetry) == 1.0          # floor
+
+
+def _async_attempts(*delays):
+    order = itertools.count()
+
+    async def fn():
+        n = next(order)
+        await asyncio.sleep(delays[n])
+        return n
+    return fn
+
+
+def test_fast_primary_is_not_hedged():
+    result = asyncio.run(ahedge(_async_attempts(0.0, 0.0), delay=0.5))
+    assert result.value == 0 and not result.hedged
+
+
+def test_slow_primary_loses_to_the_hedge():
+    result = asyncio.run(ahedge(_async_attempts(1.0, 0.0), delay=0.02))
+    assert result.value == 1 and result.hedged and result.hedge_won
+
+
+def test_no_hedge_without_capacity():
+    result = asyncio.run(ahedge(_async_attempts(0.05, 0.0), delay=0.01, can_hedge=lambda: False))
+    assert result.value == 0 and not result.hedged
+
+
+def test_one_failed_attempt_does_not_fail_the_call():
+    calls = itertools.count()
+
+    async def fn():
+        if next(calls) == 0:
+            await asyncio.sleep(0.05)
+            raise RuntimeError("primary failed")
+        await asyncio.sleep(0.1)
+        return "hedge"
+
+    assert asyncio.run(ahedge(fn, delay=0.01)).value == "hedge"
+
+
+def test_both_failing_raises():
+    async def fn():
+        await asyncio.sleep(0.02)
+        raise RuntimeError("down")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(ahedge(fn, delay=0.01))
+
+
+def test_sync_hedge():
+    calls = itertools.count()
+
+    def fn():
+        n = next(calls)
+        time.sleep(0.3 if n == 0 else 0.0)
+        return n
+
+    result = hedge_sync(fn, delay=0.02)
+    assert result.value == 1 and result.hedge_won
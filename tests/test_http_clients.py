@@ -0,0 +1,39 @@
+import asyncio
+
+from backend.core.http_clients import ClientRegistry
+
+
+def test_clients_are_cached_per_key_and_share_one_pool():
+    registry = ClientRegistry(http2=False)
+    assert registry.stats()["sync_pool_open"] is False          # lazy
+    a, again, b = registry.groq("key-a"), registry.groq("key-a"), registry.groq("key-b")
+    assert a is again and a is not b
+    assert registry.stats()["sync_clients"] == 2
+    assert registry._http is not None and registry.stats()["sync_pool_open"]
+    registry.close()
+    assert registry.stats()["sync_clients"] == 0 and not registry.stats()["sync_pool_open"]
+
+
+def test_async_clients_and_shutdown():
+    async def run():
+        registry = ClientRegistry(http2=False)
+        assert registry.async_groq("k") is registry.async_groq("k")
+        open_before = registry.stats()["async_pool_open"]
+        await registry.aclose()
+        return open_before, registry.stats()
+
+    open_before, stats = asyncio.run(run())
+    assert open_before and not stats["async_pool_open"] and stats["async_clients"] == 0
+
+
+def test_pool_limits_come_from_the_constructor():
+    stats = ClientRegistry(max_connections=7, max_keepalive=3, keepalive_expiry=9.0, http2=False).stats()
+    assert (stats["max_connections"], stats["max_keepalive"], stats["keepalive_expiry_s"]) == (7, 3, 9.0)
+    assert stats["http2"] is False
+
+
+def test_sdk_never_retries_behind_the_governor():
+    registry = ClientRegistry(http2=False)
+    assert registry.groq("k").max_retries == 0
+    assert registry.async_groq("k").max_retries == 0
+    registry.close()
@@ -0,0 +1,95 @@
+import asyncio
+import json
+
+from backend.agents import agentic_career_navigator as nav
+from backend.agents import orchestrator_wrapper as ow
+from tests.conftest import make_user
+
+
+def _steps(statuses):
+    """Roadmap steps; `statuses` holds one string of p(ending)/c(ompleted)/f(ailed) per month."""
+    names = {"p": "pending", "c": "completed", "f": "failed"}
+    return [{"month": m, "step_title": f"Month {m}",
+             "actions": [{"action_id": f"action_{(m - 1) * 4 + w}", "week": w,
+                          "action_title": f"Task {m}.{w}", "status": names[s],
+                          "score": None if s == "p" else (80 if s == "c" else 30)}
+                         for w, s in enumerate(month, 1)]}
+            for m, month in enumerate(statuses, 1)]
+
+
+def _remaining_llm(monkeypatch):
+    prompts = []
+
+    async def fake(system, user, max_tokens=2048, **kwargs):
+        prompts.append(user)
+        first = int(user.split("Generate ONLY months ")[1][0])
+        return json.dumps({"steps": [
+            {"month": m, "step_title": f"New month {m}",
+             "actions": [{"action_title": f"New {m}.{w}"} for w in range(1, 5)]}
+            for m in range(first, 6)
+        ]})
+
+    monkeypatch.setattr(nav, "acall_llm", fake)
+    return prompts
+
+
+def test_started_months_end_at_the_last_assessed_month():
+    steps = _steps(["ccpp", "pppp", "pfpp", "pppp", "pppp"])
+    assert ow._started_months(steps) == steps[:3]
+    assert ow._started_months(_steps(["pppp"] * 5)) == []
+    assert ow._started_months([]) == []
+
+
+def test_arun_remaining_keeps_months_and_continues_ids(monkeypatch):
+    prompts = _remaining_llm(monkeypatch)
+    kept = _steps(["cccc", "cfpp"])
+    result = asyncio.run(nav.RoadmapAgent().arun_remaining(
+        {"target_role": "Data Engineer", "skills": ["sql"]}, kept))
+
+    assert result["steps"][:2] == kept
+    assert [s["month"] for s in result["steps"]] == [1, 2, 3, 4, 5]
+    assert result["steps"][2]["actions"][0]["action_id"] == "action_9"
+    assert result["steps"][4]["actions"][3]["action_id"] == "action_20"
+    assert "Generate ONLY months 3 to 5" in prompts[0]
+    assert "Task 2.2 (failed, 30/100)" in prompts[0]
+
+
+def test_regenerate_keeps_started_months_and_progress(fake_db, monkeypatch):
+    _remaining_llm(monkeypatch)
+    fake_db.users["u1"] = make_user(active_roadmap={"steps": _steps(["ccpp", "pppp", "pppp", "pppp", "pppp"])},
+                                    progress={"actions_completed": 2, "actions_failed": 0})
+
+    result = asyncio.run(ow.regenerate_roadmap("u1", keep_progress=True))
+    steps = fake_db.users["u1"]["active_roadmap"]["steps"]
+    assert steps[0]["actions"][0]["status"] == "completed"
+    assert steps[1]["step_title"] == "New month 2"
+    assert result["roadmap"]["steps"] == steps
+    assert fake_db.users["u1"]["progress"]["actions_completed"] == 2
+    assert result["regenerated"]
+
+
+def test_regenerate_rebuilds_everything_unless_asked_to_keep_progress(fake_db, monkeypatch):
+    calls = []
+
+    async def fake_build(roadmap_input, fresh=False):
+        calls.append(roadmap_input)
+        return {"steps": _steps(["pppp"] * 5)}
+
+    monkeypatch.setattr(ow, "_build_roadmap", fake_build)
+    fake_db.users["u1"] = make_user(active_roadmap={"steps": _steps(["ccpp", "pppp", "pppp", "pppp", "pppp"])},
+                                    progress={"actions_completed": 2, "actions_failed": 0})
+
+    result = asyncio.run(ow.regenerate_roadmap("u1"))
+    assert len(calls) == 1 and result["regenerated"]
+    assert fake_db.users["u1"]["active_roadmap"]["steps"][0]["actions"][0]["status"] == "pending"
+    assert fake_db.users["u1"]["progress"]["actions_completed"] == 0
+
+
+def test_regenerate_reports_when_every_month_is_started(fake_db, monkeypatch):
+    monkeypatch.setattr(nav, "acall_llm", None)          # any LLM call would fail
+    started = _steps(["cppp", "pfpp", "pcpp", "cppp", "ppcp"])
+    fake_db.users["u1"] = make_user(active_roadmap={"steps": started, "status": "generated"})
+
+    result = asyncio.run(ow.regenerate_roadmap("u1", keep_progress=True))
+    assert result["regenerated"] is False
+    assert result["roadmap"]["steps"] == started
@@ -0,0 +1,51 @@
+import json
+
+import pytest
+
+from backend.core.json_repair import RepairStats, repair_json
+
+
+@pytest.mark.parametrize("raw, expected, repair", [
+    ('{"a": 1, // note\n "b": 2}', {"a": 1, "b": 2}, "comments"),
+    ("{'a': 'it\\'s'}", {"a": "it's"}, "single_quotes"),
+    ('{"a": True, "b": None, "c": NaN}', {"a": True, "b": None, "c": None}, "python_literals"),
+    ('{a: 1, b_2: "x"}', {"a": 1, "b_2": "x"}, "unquoted_keys"),
+    ('{"a": "line\nbreak"}', {"a": "line\nbreak"}, "control_chars"),
+    ('{"a": [1, 2,], }', {"a": [1, 2]}, "trailing_commas"),
+    ('{"a": [1, 2}', {"a": [1, 2]}, "mismatched_close"),
+    ('{"a": 1} Hope this helps!', {"a": 1}, "trailing_text"),
+])
+def test_each_repair(raw, expected, repair):
+    fixed, repairs = repair_json(raw)
+    assert json.loads(fixed) == expected
+    assert repair in repairs
+
+
+def test_truncated_output_is_closed():
+    fixed, repairs = repair_json('Sure! {"steps": [{"title": "Month 1", "actions": ["a", "b')
+    assert "truncated" in repairs
+    assert json.loads(fixed)["steps"][0]["actions"][0] == "a"
+
+
+def test_truncated_dangling_key_is_dropped_and_partial_literal_completed():
+    assert json.loads(repair_json('{"a": 1, "b"')[0]) == {"a": 1}
+    assert json.loads(repair_json('{"a": [1, tr')[0]) == {"a": [1, True]}
+    assert json.loads(repair_json('{"a": ')[0]) == {"a": None}
+
+
+def test_valid_json_needs_no_repair():
+    text = '{"a": "x // not a comment", "b": [1, {"c": null}]}'
+    fixed, repairs = repair_json(text)
+    assert repairs == [] and json.loads(fixed) == json.loads(text)
+
+
+def test_no_json_is_returned_unchanged():
+    assert repair_json("no json here") == ("no json here", [])
+
+
+def test_stats_count_fixes_only_on_success():
+    stats = RepairStats()
+    stats.record(["comments", "truncated"], ok=True)
+    stats.record(["comments"], ok=False)
+    assert stats.stats() == {"attempts": 2, "repaired": 1, "failed": 1,
+                             "by_repair": {"comments": 1, "truncated": 1}}
@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+from backend.core.json_stream import IncrementalJSONValidator, StreamDiverged, StreamShape
+
+ROADMAP = StreamShape(root="object", arrays={"steps": (2, 2), "steps[].actions": (2, 3)})
+
+
+def _roadmap(actions_per_step):
+    return json.dumps({"steps": [{"title": "a [b] {c}", "actions": [{"id": i} for i in range(n)]}
+                                 for n in actions_per_step]})
+
+
+def _feed(shape, text, chunk=7):
+    v = IncrementalJSONValidator(shape)
+    for i in range(0, len(text), chunk):
+        if v.feed(text[i:i + chunk]):
+            break
+    return v
+
+
+def test_valid_document_completes_across_chunks():
+    v = _feed(ROADMAP, "Here you go:\n```json\n" + _roadmap([2, 3]) + "\n```")
+    assert v.complete
+
+
+def test_too_many_items_diverges_before_the_end():
+    text = _roadmap([2, 4])
+    with pytest.raises(StreamDiverged) as err:
+        _feed(ROADMAP, text)
+    assert "steps[].actions" in err.value.reason
+    assert err.value.chars < len(text)
+
+
+def test_too_few_items_diverges_when_the_array_closes():
+    with pytest.raises(StreamDiverged, match="at least 2"):
+        _feed(ROADMAP, _roadmap([1, 2]))
+
+
+def test_wrong_root_type():
+    with pytest.raises(StreamDiverged):
+        _feed(StreamShape(root="object"), "[1, 2]")
+    assert _feed(StreamShape(root=None), "[1, 2]").complete
+
+
+def test_brackets_and_escapes_inside_strings_are_ignored():
+    text = json.dumps({"steps": ["x \\\" ] }", "y"]})
+    assert _feed(StreamShape(arrays={"steps": (2, 2)}), text, chunk=1).complete
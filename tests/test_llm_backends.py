@@ -0,0 +1,55 @@
+import asyncio
+import json
+
+import pytest
+from groq import InternalServerError, RateLimitError
+
+from backend.core.llm_backends import GroqBackend, StubBackend, backend_from_env
+
+
+def _messages(text):
+    return [{"role": "system", "content": "sys"}, {"role": "user", "content": text}]
+
+
+def test_stub_is_deterministic_per_prompt():
+    stub = StubBackend(latency_ms=0, sigma=0)
+    prompt = _messages("Target Role: Data Engineer\nQ&A Session:\nQ: a\nA: b")
+    first = stub.complete("m", prompt, 500, agent="ReadinessAssessmentAgent", op="evaluate")
+    second = stub.complete("m", prompt, 500, agent="ReadinessAssessmentAgent", op="evaluate")
+    assert first.content == second.content
+    assert 30 <= json.loads(first.content)["readiness_score"] <= 90
+    assert first.usage.completion_tokens > 0
+
+
+def test_stub_injects_sdk_errors():
+    with pytest.raises(RateLimitError):
+        StubBackend(latency_ms=0, sigma=0, rate_limit_rate=1.0).complete("m", _messages("x"), 10)
+    with pytest.raises(InternalServerError):
+        StubBackend(latency_ms=0, sigma=0, error_rate=1.0).complete("m", _messages("x"), 10)
+
+
+def test_backend_from_env(monkeypatch):
+    monkeypatch.setenv("LLM_BACKEND", "stub")
+    assert isinstance(backend_from_env(lambda: "key"), StubBackend)
+    monkeypatch.setenv("LLM_BACKEND", "nope")
+    assert isinstance(backend_from_env(lambda: "key"), GroqBackend)
+
+
+def test_stub_malformed_roadmap_drops_month_two_actions():
+    stub = StubBackend(latency_ms=0, sigma=0, malformed_rate=1.0)
+    content = stub.complete("m", _messages("Target Role    : Data Engineer"), 2500,
+                            agent="RoadmapAgent", op="run").content
+    steps = json.loads(content)["steps"]
+    assert len(steps[1]["actions"]) == 2
+
+
+def test_stub_stream_reassembles_to_the_completion():
+    async def run():
+        stub = StubBackend(latency_ms=0, sigma=0)
+        chunks = [c async for c in stub.astream("m", _messages("Target Role: X"), 500,
+                                                agent="FeedbackAgent", op="run")]
+        full = (await stub.acomplete("m", _messages("Target Role: X"), 500, agent="FeedbackAgent", op="run")).content
+        return chunks, full
+
+    chunks, full = asyncio.run(run())
+    assert len(chunks) > 1 and "".join(chunks) == full
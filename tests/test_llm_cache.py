@@ -0,0 +1,102 @@
+import asyncio
+import threading
+import time
+
+from backend.core.llm_cache import LLMCache, _parse_ttls
+
+
+def test_key_covers_every_request_field():
+    cache = LLMCache()
+    key = cache.make_key("m", "sys", "user", 100)
+    assert key == cache.make_key("m", "sys", "user", 100)
+    assert key != cache.make_key("m2", "sys", "user", 100)
+    assert key != cache.make_key("m", "sys", "user2", 100)
+    assert key != cache.make_key("m", "sys", "user", 200)
+
+
+def test_hit_miss_and_per_agent_ttl():
+    cache = LLMCache(ttls={"NoCache": 0})
+    assert cache.get("k", "RoadmapAgent") is None
+    cache.set("k", "v", "RoadmapAgent", latency=2.0)
+    assert cache.get("k", "RoadmapAgent") == "v"
+    cache.set("k2", "v", "NoCache")
+    assert cache.get("k2", "NoCache") is None
+    stats = cache.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1
+    assert stats["saved_latency_seconds"] == 2.0
+
+
+def test_expired_entries_are_misses():
+    cache = LLMCache(ttls={"A": 60})
+    cache.set("k", "v", "A")
+    value, _, latency = cache._entries["k"]
+    cache._entries["k"] = (value, time.time() - 1, latency)
+    assert cache.get("k", "A") is None
+
+
+def test_lru_eviction():
+    cache = LLMCache(max_entries=2)
+    for key in ("a", "b"):
+        cache.set(key, key)
+    cache.get("a")
+    cache.set("c", "c")
+    assert cache.get("b") is None
+    assert cache.get("a") == "a" and cache.get("c") == "c"
+
+
+def test_set_replaces_a_bypassed_entry():
+    cache = LLMCache()
+    cache.set("k", "old", "RoadmapAgent")
+    cache.set("k", "new", "RoadmapAgent")
+    assert cache.get("k", "RoadmapAgent") == "new"
+
+
+def test_discard_drops_memory_and_disk_entries(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = LLMCache(db_path=path)
+    cache.set("k", "v", "RoadmapAgent")
+    cache.discard("k")
+    assert cache.get("k", "RoadmapAgent") is None
+    assert LLMCache(db_path=path).get("k", "RoadmapAgent") is None
+
+
+def test_disk_store_survives_a_new_instance(tmp_path):
+    path = str(tmp_path / "cache.db")
+    LLMCache(db_path=path).set("k", "v", "RoadmapAgent")
+    fresh = LLMCache(db_path=path)
+    assert fresh.get("k", "RoadmapAgent") == "v"
+    assert fresh.stats()["disk_hits"] == 1
+
+
+def test_async_disk_access_runs_off_the_event_loop(tmp_path):
+    cache = LLMCache(db_path=str(tmp_path / "cache.db"))
+    threads = []
+    db_get, db_set = cache._db_get, cache._db_set
+
+    def record(fn):
+        def wrapper(*args):
+            threads.append(threading.get_ident())
+            return fn(*args)
+        return wrapper
+
+    cache._db_get, cache._db_set = record(db_get), record(db_set)
+
+    async def run():
+        await cache.aset("k", "v", "RoadmapAgent")
+        cache._entries.clear()
+        return await cache.aget("k", "RoadmapAgent"), threading.get_ident()
+
+    value, loop_thread = asyncio.run(run())
+    assert value == "v" and cache.stats()["disk_hits"] == 1
+    assert len(threads) == 2 and loop_thread not in threads
+
+
+def test_async_memory_hit_skips_the_disk(tmp_path):
+    cache = LLMCache(db_path=str(tmp_path / "cache.db"))
+    cache.set("k", "v", "RoadmapAgent")
+    cache._db_get = lambda key: (_ for _ in ()).throw(AssertionError("disk read"))
+    assert asyncio.run(cache.aget("k", "RoadmapAgent")) == "v"
+
+
+def test_parse_ttls_skips_invalid_parts():
+    assert _parse_ttls("A=10, B=x,C") == {"A": 10}
@@ -0,0 +1,108 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from backend.core.llm_governor import (
+    BACKGROUND, INTERACTIVE, NORMAL, LLMGovernor, LLMThrottledError, TokenBucket,
+    estimate_tokens, retry_after_seconds,
+)
+
+
+def test_token_bucket_debt_and_unlimited():
+    bucket = TokenBucket(60)              # 1 per second
+    assert bucket.take(60) == 0.0
+    assert bucket.take(1) == pytest.approx(1.0, abs=0.05)
+    assert bucket.delay(1) > 0
+    assert TokenBucket(0).take(10**6) == 0.0
+
+
+def test_priority_defaults_per_agent():
+    assert LLMGovernor.priority_for("ReadinessAssessmentAgent") == INTERACTIVE
+    assert LLMGovernor.priority_for("MarketIntelligenceAgent") == BACKGROUND
+    assert LLMGovernor.priority_for("Unknown") == NORMAL
+    assert LLMGovernor.priority_for("MarketIntelligenceAgent", INTERACTIVE) == INTERACTIVE
+
+
+def test_queued_waiters_are_admitted_by_priority():
+    async def run():
+        gov, order = LLMGovernor(max_concurrency=1), []
+        await gov.acquire(NORMAL)
+        assert not gov.has_capacity()
+
+        async def waiter(name, priority):
+            await gov.acquire(priority)
+            order.append(name)
+            gov.release(ok=True, latency=0.1)
+
+        tasks = [asyncio.ensure_future(waiter("background", BACKGROUND)),
+                 asyncio.ensure_future(waiter("interactive", INTERACTIVE))]
+        await asyncio.sleep(0)
+        gov.release(ok=True, latency=0.1)
+        await asyncio.gather(*tasks)
+        return order
+
+    assert asyncio.run(run()) == ["interactive", "background"]
+
+
+def test_queue_timeout_raises_throttled():
+    async def run():
+        gov = LLMGovernor(max_concurrency=1, queue_timeout=0.01)
+        await gov.acquire()
+        with pytest.raises(LLMThrottledError):
+            await gov.acquire()
+        return gov.stats()
+
+    assert asyncio.run(run())["queue_timeouts"] == 1
+
+
+def test_sync_path_is_capped_by_the_concurrency_limit():
+    gov, peak, lock = LLMGovernor(max_concurrency=2), [0, 0], threading.Lock()
+
+    def call():
+        gov.acquire_sync()
+        with lock:
+            peak[0] += 1
+            peak[1] = max(peak[1], peak[0])
+        time.sleep(0.02)
+        with lock:
+            peak[0] -= 1
+        gov.release_sync(ok=True, latency=0.02)
+
+    threads = [threading.Thread(target=call) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert peak[1] == 2
+    assert gov.stats()["admitted"] == 6 and gov.stats()["sync_in_flight"] == 0
+
+
+def test_sync_queue_timeout_and_429_feedback():
+    gov = LLMGovernor(max_concurrency=2, queue_timeout=0.01)
+    gov.acquire_sync()
+    gov.acquire_sync()
+    with pytest.raises(LLMThrottledError):
+        gov.acquire_sync()
+    gov.release_sync(ok=False, throttled=True)
+    assert gov.limit == 1 and gov.stats()["queue_timeouts"] == 1
+
+
+def test_aimd_halves_on_429_and_grows_back():
+    gov = LLMGovernor(max_concurrency=8, latency_target=10)
+    gov.on_throttled()
+    assert gov.limit == 4
+    for _ in range(4):
+        gov._observe_latency(1.0)
+    assert gov.limit == 5
+    gov._observe_latency(30.0)            # over the latency target
+    assert gov.limit == 2
+
+
+def test_estimate_tokens_and_retry_after():
+    assert estimate_tokens("x" * 400) == 101
+    exc = SimpleNamespace(response=SimpleNamespace(headers={"retry-after": "7"}))
+    assert retry_after_seconds(exc, attempt=0) == 7.0
+    assert retry_after_seconds(ValueError(), attempt=3) == 8.0
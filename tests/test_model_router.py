@@ -0,0 +1,54 @@
+from backend.core.model_router import FAST, HEAVY, ModelRouter, _parse_models, _parse_pairs
+
+TIERS = {FAST: ["fast-a", "fast-b"], HEAVY: ["heavy-a", "heavy-b"]}
+
+
+def _router(**kwargs):
+    return ModelRouter("default", tier_models=TIERS, **kwargs)
+
+
+def test_ops_map_to_tiers():
+    router = _router(routes={"RoadmapAgent.personalize": FAST})
+    assert router.primary("ReadinessAssessmentAgent", "questions") == "fast-a"
+    assert router.primary("RoadmapAgent", "run") == "heavy-a"
+    assert router.primary("RoadmapAgent", "personalize") == "fast-a"
+    assert router.primary("Unknown", "op") == "heavy-a"
+    assert router.primary("ResumeAnalyzerAgent", "parse_resume") == "heavy-a"
+
+
+def test_disabled_router_uses_the_default_model():
+    router = _router(enabled=False)
+    assert router.primary("RoadmapAgent", "run") == "default"
+    assert router.candidates("RoadmapAgent", "run") == ["default"]
+
+
+def test_slow_primary_is_demoted_but_still_probed():
+    router = _router(probe_every=3)
+    router.record("heavy-a", "RoadmapAgent", "run", ok=True, latency=60.0)
+    router.record("heavy-b", "RoadmapAgent", "run", ok=True, latency=10.0)
+    firsts = [router.candidates("RoadmapAgent", "run")[0] for _ in range(3)]
+    assert firsts == ["heavy-b", "heavy-b", "heavy-a"]
+    assert router.primary("RoadmapAgent", "run") == "heavy-a"      # cache keys stay stable
+
+
+def test_repeated_errors_put_a_model_in_cooldown():
+    router = _router(error_threshold=2)
+    for _ in range(2):
+        router.record("fast-a", "ReroutingAgent", "safer_roles", ok=False)
+    assert router.candidates("ReroutingAgent", "safer_roles") == ["fast-b", "fast-a"]
+    assert router.stats()["models"]["fast-a"]["cooldown_remaining_s"] > 0
+
+
+def test_rate_limits_never_start_a_cooldown():
+    router = _router(error_threshold=2)
+    for _ in range(3):
+        router.record("fast-a", "ReroutingAgent", "safer_roles", ok=False, throttled=True)
+    router.record("fast-a", "ReroutingAgent", "safer_roles", ok=False)
+    assert router.candidates("ReroutingAgent", "safer_roles") == ["fast-a", "fast-b"]
+    assert router.stats()["models"]["fast-a"]["errors"] == 4
+
+
+def test_env_parsers():
+    assert _parse_pairs("A.op=fast, B.op = heavy,bad") == {"A.op": "fast", "B.op": "heavy"}
+    assert _parse_models(" m1, ,m2", ["d"]) == ["m1", "m2"]
+    assert _parse_models(None, ["d"]) == ["d"]
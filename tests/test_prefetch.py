@@ -0,0 +1,62 @@
+import asyncio
+
+from backend.core.prefetch import Prefetcher
+
+
+def _item(label, calls, result=True):
+    async def fn():
+        calls.append(label)
+        if isinstance(result, Exception):
+            raise result
+        return result
+    return label, fn
+
+
+def _drain(prefetcher, owner, items):
+    async def run():
+        prefetcher.schedule(owner, items)
+        await asyncio.sleep(0.05)
+    asyncio.run(run())
+
+
+def test_items_run_in_order_and_failures_are_counted():
+    prefetcher, calls = Prefetcher(per_minute=60), []
+    _drain(prefetcher, "u", [_item("a", calls), _item("b", calls, False),
+                             _item("c", calls, RuntimeError("down"))])
+    assert calls == ["a", "b", "c"]
+    stats = prefetcher.stats()
+    assert (stats["fetched"], stats["already_warm"], stats["failed"]) == (1, 1, 1)
+
+
+def test_budget_and_capacity_skip_items_instead_of_queueing():
+    prefetcher, calls = Prefetcher(per_minute=1), []
+    _drain(prefetcher, "u", [_item("a", calls), _item("b", calls)])
+    assert calls == ["a"] and prefetcher.stats()["skipped"] == 1
+
+    busy, calls = Prefetcher(can_run=lambda: False), []
+    _drain(busy, "u", [_item("a", calls)])
+    assert calls == [] and busy.stats()["skipped"] == 1
+
+
+def test_rescheduling_replaces_the_owners_job():
+    async def run():
+        prefetcher, calls = Prefetcher(), []
+
+        async def slow():
+            await asyncio.sleep(0.05)
+            calls.append("old")
+            return True
+
+        prefetcher.schedule("u", [("old", slow)])
+        await asyncio.sleep(0)
+        prefetcher.schedule("u", [_item("new", calls)])
+        await asyncio.sleep(0.1)
+        return calls
+
+    assert asyncio.run(run()) == ["new"]
+
+
+def test_disabled_prefetcher_schedules_nothing():
+    prefetcher, calls = Prefetcher(enabled=False), []
+    _drain(prefetcher, "u", [_item("a", calls)])
+    assert calls == [] and prefetcher.stats()["jobs"]["started"] == 0
@@ -0,0 +1,48 @@
+import json
+
+import pytest
+
+from backend.core.prompt_builder import (
+    PromptBuilder, compact_text, compile_schema, trim_items, trim_qa, trim_text,
+)
+
+
+def test_schema_is_compact_and_slots_render_as_json():
+    schema = compile_schema({"role": "{{role}}", "progress": "{{progress}}", "items": ["<x>"]})
+    assert schema.slots == {"role", "progress"}
+    rendered = schema.render(role='Data "Eng"', progress=42.5)
+    assert json.loads(rendered) == {"role": 'Data "Eng"', "progress": 42.5, "items": ["<x>"]}
+    assert " " not in compile_schema({"a": [1, 2]}).render()
+    with pytest.raises(KeyError):
+        schema.render(role="x")
+
+
+def test_compact_and_trim_text():
+    assert compact_text("a   b\n\n\n  c") == "a b\nc"
+    assert trim_text("short", 100) == "short"
+    cut = trim_text("word " * 200, 10)
+    assert cut.endswith(" …") and len(cut) <= 10 * 4 + 2
+    assert trim_text("word " * 200, 0).count("word") == 200
+
+
+def test_trim_items_dedupes_and_respects_budget():
+    assert trim_items(["Python", "python ", "SQL", ""], 100) == ["Python", "SQL"]
+    assert trim_items(["x" * 40, "y" * 40, "z" * 40], 15) == ["x" * 40]
+    assert len(trim_items(["a", "b", "c"], 0)) == 3
+
+
+def test_trim_qa_keeps_questions_whole():
+    pairs = [{"question": "Q" * 40, "answer": "long answer " * 100} for _ in range(2)]
+    trimmed = trim_qa(pairs, 100)
+    assert all(p["question"] == "Q" * 40 for p in trimmed)
+    assert all(len(p["answer"]) < len(pairs[0]["answer"]) for p in trimmed)
+
+
+def test_builder_counts_trimmed_tokens():
+    builder = PromptBuilder(budgets={"A.skills": 5})
+    assert builder.items("A", "skills", ["python"] + ["skill%d" % i for i in range(20)])
+    assert builder.items("B", "skills", ["x", "y"]) == "x, y"      # no budget → untouched
+    stats = builder.stats()
+    assert stats["tokens_trimmed"]["A"] > 0 and "B" not in stats["tokens_trimmed"]
+    rendered = builder.qa("A", "qa", [{"question": "Q1", "answer": "A1"}])
+    assert rendered == "Q: Q1\nA: A1"
@@ -0,0 +1,77 @@
+import asyncio
+
+from backend.core.question_bank import QuestionBank, normalize_title
+
+
+class FakeStore:
+    def __init__(self):
+        self.pools = {}
+
+    def get_question_pool(self, kind, key):
+        return self.pools.get((kind, key))
+
+    def save_question_pool(self, kind, key, questions, updated_at):
+        self.pools[(kind, key)] = {"questions": list(questions), "updated_at": updated_at}
+        return True
+
+
+def _generator(calls):
+    async def generate(avoid):
+        calls.append(list(avoid))
+        start = sum(len(c) for c in calls) * 10
+        return [f"Question {start + i}?" for i in range(10)]
+    return generate
+
+
+def test_normalize_title():
+    assert normalize_title("  Build a REST API (Flask)! ") == "build a rest api flask"
+
+
+def test_empty_pool_fills_blocking_then_serves_from_bank():
+    async def run():
+        calls = []
+        bank = QuestionBank(store=FakeStore(), min_pool=10)
+        first = await bank.aget("action", "sql", 5, _generator(calls))
+        second = await bank.aget("action", "sql", 5, _generator(calls))
+        return calls, first, second, bank.stats()
+
+    calls, first, second, stats = asyncio.run(run())
+    assert len(calls) == 1
+    assert len(first) == len(set(first)) == 5
+    assert len(second) == 5
+    assert stats["blocking_fills"] == 1 and stats["served_from_bank"] == 1
+
+
+def test_thin_pool_is_topped_up_in_background_with_avoid_hints():
+    async def run():
+        calls = []
+        store = FakeStore()
+        bank = QuestionBank(store=store, min_pool=20, topup_interval=0)
+        await bank.aget("readiness", "data_engineer", 5, _generator(calls))
+        await asyncio.sleep(0.05)
+        return calls, store
+
+    calls, store = asyncio.run(run())
+    assert len(calls) == 2
+    assert calls[1]                       # the top-up saw the banked questions
+    assert len(store.pools[("readiness", "data_engineer")]["questions"]) == 20
+
+
+def test_pool_dedupes_and_keeps_newest():
+    async def run():
+        bank = QuestionBank(max_pool=3)
+        await bank._add("action", "k", ["A?", "a?", "B?"])
+        return await bank._add("action", "k", ["C?", "D?"])
+
+    assert asyncio.run(run()).questions == ["B?", "C?", "D?"]
+
+
+def test_disabled_bank_always_generates():
+    async def run():
+        calls = []
+        bank = QuestionBank(enabled=False)
+        await bank.aget("action", "k", 3, _generator(calls))
+        await bank.aget("action", "k", 3, _generator(calls))
+        return calls
+
+    assert len(asyncio.run(run())) == 2
@@ -0,0 +1,98 @@
+import asyncio
+import json
+
+import pytest
+
+from backend.agents import agentic_career_navigator as nav
+from backend.core.llm_backends import LLMBackend, LLMResult
+from backend.core.llm_cache import LLMCache
+
+INPUT = {"target_role": "Data Engineer", "weaknesses": ["cloud"], "skills": ["sql"]}
+
+
+def _month(m, actions=4, title="Task"):
+    return {"month": m, "step_title": f"Month {m}",
+            "actions": [{"action_title": f"{title} {m}.{w}"} for w in range(1, actions + 1)]}
+
+
+def _scripted_llm(monkeypatch, replies):
+    """Fake acall_llm answering from `replies[op]` (a list, consumed in order)."""
+    calls = []
+
+    async def fake(system, user, max_tokens=2048, agent="default", op="call", **kwargs):
+        calls.append((op, user))
+        return replies[op].pop(0)
+
+    monkeypatch.setattr(nav, "acall_llm", fake)
+    return calls
+
+
+def test_only_broken_months_are_requested_again(monkeypatch):
+    first = [_month(1), _month(2, actions=2), _month(3), _month(4), _month(5)]
+    calls = _scripted_llm(monkeypatch, {
+        "run": [json.dumps({"steps": first})],
+        "repair": [json.dumps({"steps": [_month(2, title="Fixed")]})],
+    })
+    result = asyncio.run(nav.RoadmapAgent().arun(INPUT))
+
+    assert [op for op, _ in calls] == ["run", "repair"]
+    assert "Write ONLY month(s) 2," in calls[1][1]
+    assert "Month 1: Month 1" in calls[1][1]
+    steps = result["steps"]
+    assert [s["month"] for s in steps] == [1, 2, 3, 4, 5]
+    assert steps[1]["actions"][0] == {"action_title": "Fixed 2.1", "action_id": "action_5",
+                                      "week": 1, "status": "pending", "score": None}
+
+
+def test_extra_actions_and_months_are_trimmed_without_a_call(monkeypatch):
+    first = [_month(1, actions=6)] + [_month(m) for m in range(2, 7)]
+    calls = _scripted_llm(monkeypatch, {"run": [json.dumps({"steps": first})]})
+    result = asyncio.run(nav.RoadmapAgent().arun(INPUT))
+
+    assert [op for op, _ in calls] == ["run"]
+    assert len(result["steps"]) == 5
+    assert [a["action_id"] for a in result["steps"][0]["actions"]] == [
+        "action_1", "action_2", "action_3", "action_4"]
+
+
+def test_unrepairable_months_fail_after_the_configured_attempts(monkeypatch):
+    broken = json.dumps({"steps": [_month(1)]})
+    calls = _scripted_llm(monkeypatch, {"run": [broken], "repair": ["not json"] * nav.ROADMAP_REPAIR_ATTEMPTS})
+    with pytest.raises(nav.RoadmapGenerationError, match=r"\[2, 3, 4, 5\]"):
+        asyncio.run(nav.RoadmapAgent().arun(INPUT))
+    assert [op for op, _ in calls].count("repair") == nav.ROADMAP_REPAIR_ATTEMPTS
+
+
+class _ScriptedBackend(LLMBackend):
+    """Backend answering from `replies[op]` in order, so the real cache path runs."""
+
+    def __init__(self, replies):
+        self.replies, self.calls = replies, []
+
+    async def acomplete(self, model, messages, max_tokens, agent="default", op="call"):
+        self.calls.append(op)
+        return LLMResult(self.replies[op].pop(0))
+
+
+def test_rejected_answers_are_not_served_from_the_cache(monkeypatch):
+    broken = json.dumps({"steps": [_month(1)]})
+    good = json.dumps({"steps": [_month(m) for m in range(1, 6)]})
+    attempts = nav.ROADMAP_REPAIR_ATTEMPTS
+    backend = _ScriptedBackend({"run": [broken, good], "repair": ["not json"] * attempts})
+    monkeypatch.setattr(nav, "llm_backend", backend)
+    monkeypatch.setattr(nav, "llm_cache", LLMCache())
+
+    with pytest.raises(nav.RoadmapGenerationError):
+        asyncio.run(nav.RoadmapAgent().arun(INPUT))
+    result = asyncio.run(nav.RoadmapAgent().arun(INPUT))
+
+    assert backend.calls == ["run"] + ["repair"] * attempts + ["run"]
+    assert [s["month"] for s in result["steps"]] == [1, 2, 3, 4, 5]
+
+
+def test_parse_months_matches_by_month_then_position():
+    agent = nav.RoadmapAgent()
+    raw = json.dumps({"steps": [_month(4), {"step_title": "x", "actions": []}, _month(9)]})
+    good, bad = agent._parse_months(raw, [3, 4, 5])
+    assert sorted(good) == [4, 5] and bad == [3]
+    assert agent._parse_months("garbage", [1, 2]) == ({}, [1, 2])
@@ -0,0 +1,75 @@
+import asyncio
+
+from backend.core.roadmap_templates import (
+    RoadmapTemplates, _jaccard, profile_signature, skill_clusters,
+)
+from tests.conftest import FakeStore
+
+
+STEPS = [{"month": 1, "actions": [{"title": "SQL basics", "status": "completed", "score": 80}]}]
+
+
+def test_signature_is_coarse():
+    assert skill_clusters(["Power BI", "Python 3"]) == {"data", "programming"}
+    assert profile_signature({"skills": ["SQL", "Python"]}) == "data+programming:novice"
+    assert profile_signature({"skills": [], "strengths": []}) == "none:novice"
+
+
+def test_empty_cluster_sets_never_match_each_other():
+    assert _jaccard(set(), set()) == 0.0
+    assert _jaccard({"data"}, set()) == 0.0
+    assert _jaccard({"data", "ml"}, {"data"}) == 0.5
+
+
+def test_exact_and_near_hits_serve_fresh_copies():
+    async def run():
+        templates = RoadmapTemplates(store=FakeStore())
+        await templates.aput("data engineer", {"skills": ["sql", "python", "aws"]}, STEPS)
+        exact = await templates.aget("data engineer", {"skills": ["postgres", "java", "docker"]})
+        near = await templates.aget("data engineer", {"skills": ["sql", "python", "pandas"]})
+        miss = await templates.aget("data engineer", {"skills": ["figma", "ux", "ios"]})
+        return templates, exact, near, miss
+
+    templates, exact, near, miss = asyncio.run(run())
+    assert exact[0]["actions"][0] == {"title": "SQL basics", "status": "pending", "score": None}
+    assert near is not None and miss is None
+    assert STEPS[0]["actions"][0]["status"] == "completed"
+    stats = templates.stats()
+    assert (stats["exact_hits"], stats["near_hits"], stats["misses"]) == (1, 1, 1)
+
+
+def test_templates_persist_to_the_store_and_are_capped():
+    async def run():
+        store = FakeStore()
+        writer = RoadmapTemplates(store=store, max_per_role=2)
+        for skills in (["sql"], ["figma"], ["aws"]):
+            await writer.aput("role", {"skills": skills}, STEPS)
+        reader = RoadmapTemplates(store=store, similarity=1.0)
+        return store, await reader.aget("role", {"skills": ["docker"]})
+
+    store, served = asyncio.run(run())
+    assert sorted(store.roles["role"]["roadmap_templates"]) == ["cloud:novice", "design:novice"]
+    assert served is not None
+
+
+def test_workers_storing_different_signatures_keep_both():
+    async def run():
+        store = FakeStore()
+        first, second = RoadmapTemplates(store=store), RoadmapTemplates(store=store)
+        await first._load("role")
+        await second._load("role")          # both workers start from an empty role
+        await first.aput("role", {"skills": ["sql"]}, STEPS)
+        await second.aput("role", {"skills": ["figma"]}, STEPS)
+        return store
+
+    store = asyncio.run(run())
+    assert sorted(store.roles["role"]["roadmap_templates"]) == ["data:novice", "design:novice"]
+
+
+def test_expired_templates_are_ignored():
+    async def run():
+        templates = RoadmapTemplates(ttl=-1)
+        await templates.aput("role", {"skills": ["sql"]}, STEPS)
+        return await templates.aget("role", {"skills": ["sql"]})
+
+    assert asyncio.run(run()) is None
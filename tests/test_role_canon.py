@@ -0,0 +1,43 @@
+from backend.core.role_canon import RoleCanonicalizer, normalize_role
+
+
+def test_normalize_expands_abbreviations_and_joins_spellings():
+    assert normalize_role("Sr. ML Eng.") == "senior machine learning engineer"
+    assert normalize_role("Front-End Dev") == "frontend developer"
+    assert normalize_role("   ") == ""
+
+
+def test_variants_map_to_one_canonical_role():
+    canon = RoleCanonicalizer()
+    ids = {canon.role_id(t) for t in ("Machine Learning Engineer", "ML Engineer",
+                                      "machine-learning eng", "MLE")}
+    assert ids == {"machine learning engineer"}
+    assert canon.canonicalize("mle").matched_by == "alias"
+    assert canon.canonicalize("ML Engineer").name == "Machine Learning Engineer"
+
+
+def test_close_spelling_matches_fuzzily():
+    result = RoleCanonicalizer().canonicalize("Data Enginer")
+    assert result.matched_by == "fuzzy" and result.role_id == "data engineer"
+
+
+def test_unknown_roles_pass_through_normalized_and_are_not_learned():
+    canon = RoleCanonicalizer()
+    first = canon.canonicalize("Quantum Computing Researcher")
+    assert first.matched_by == "new" and first.role_id == "quantum computing researcher"
+    assert first.name == "Quantum Computing Researcher"
+    variant = canon.canonicalize("Quantum Computing Researchr")
+    assert variant.matched_by == "new" and variant.role_id == "quantum computing researchr"
+    # A fresh process derives the same keys
+    assert RoleCanonicalizer().role_id("quantum computing researchr") == variant.role_id
+    assert canon.stats()["known_roles"] == RoleCanonicalizer().stats()["known_roles"]
+
+
+def test_lookups_are_memoized_and_register_resets_the_memo():
+    canon = RoleCanonicalizer(roles={"Data Engineer": []})
+    canon.role_id("data engineer")
+    canon.role_id("data engineer")
+    assert canon.stats()["memo_hits"] == 1
+    canon.register("Data Engineer", ["pipeline wrangler"])
+    assert canon.role_id("Pipeline Wrangler") == "data engineer"
+    assert canon.canonicalize("") is None
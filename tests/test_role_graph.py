@@ -0,0 +1,94 @@
+import asyncio
+
+from backend.agents import agentic_career_navigator as nav
+from backend.core.role_graph import RoleGraph
+
+
+def test_unseen_role_has_no_suggestions():
+    assert RoleGraph().safer_roles("Data Scientist") == []
+
+
+def test_ranking_prefers_demand_and_easy_entry():
+    graph = RoleGraph()
+    graph.observe_market("Data Scientist", {"adjacent_safer_roles": [
+        {"role": "BI Developer", "demand_score": 40, "entry_barrier": "high"},
+        {"role": "Data Analyst", "demand_score": 90, "entry_barrier": "low"},
+        {"role": "Analytics Engineer", "demand_score": 70, "entry_barrier": "medium"},
+    ]})
+    assert graph.safer_roles("data scientist") == ["Data Analyst", "Analytics Engineer", "BI Developer"]
+    assert graph.safer_roles("Data Scientist", k=1) == ["Data Analyst"]
+
+
+def test_reobserving_a_source_replaces_it():
+    graph = RoleGraph()
+    graph.observe_llm("Data Scientist", ["Data Analyst", "BI Developer"])
+    graph.observe_llm("Data Scientist", ["Analytics Engineer"])
+    assert graph.safer_roles("Data Scientist") == ["Analytics Engineer"]
+    assert graph.stats()["edges"] == 1
+
+
+def test_sources_accumulate_and_self_edges_are_ignored():
+    graph = RoleGraph()
+    graph.observe_readiness("u1", "Data Scientist", ["Data Analyst", "Data Scientist"])
+    graph.observe_readiness("u2", "Data Scientist", ["Data Analyst", "BI Developer"])
+    assert graph.safer_roles("Data Scientist")[0] == "Data Analyst"
+    assert graph.stats()["edges"] == 2
+
+
+class FakeStore:
+    def scan_roles(self, fields):
+        return [{"role_key": "data_scientist", "display_role": "Data Scientist",
+                 "market_analysis": {"adjacent_safer_roles": [{"role": "Data Analyst"}]}}]
+
+    def scan_users(self, fields):
+        return [{"user_id": "u1", "profile": {"target_role": "Data Engineer"},
+                 "readiness_assessment": {"safer_adjacent_roles": ["Data Analyst"]}},
+                {"user_id": "u2", "profile": {}}]
+
+
+def test_load_from_store():
+    graph = RoleGraph()
+    assert graph.load(FakeStore()) == {"roles": 1, "users": 1}
+    assert graph.safer_roles("Data Engineer") == ["Data Analyst"]
+
+
+def test_disabled_graph_learns_nothing():
+    graph = RoleGraph(enabled=False)
+    assert graph.observe_llm("Data Scientist", ["Data Analyst"]) == 0
+    assert graph.safer_roles("Data Scientist") == []
+
+
+def test_rerouting_agent_answers_seen_roles_from_the_graph(monkeypatch):
+    calls = []
+
+    async def fake_llm(system, user, max_tokens=2048, **kwargs):
+        calls.append(user)
+        return '["Data Analyst", "BI Developer", "Analytics Engineer"]'
+
+    graph = RoleGraph()
+    monkeypatch.setattr(nav, "role_graph", graph)
+    monkeypatch.setattr(nav, "acall_llm", fake_llm)
+    agent = nav.ReroutingAgent()
+
+    first = asyncio.run(agent._aget_safer_roles("Data Scientist"))
+    again = asyncio.run(agent._aget_safer_roles("data scientist"))
+    assert first == ["Data Analyst", "BI Developer", "Analytics Engineer"]
+    assert sorted(again) == sorted(first)
+    assert len(calls) == 1
+
+
+def test_thin_graph_is_topped_up_from_the_llm(monkeypatch):
+    calls = []
+
+    async def fake_llm(system, user, max_tokens=2048, **kwargs):
+        calls.append(user)
+        return '["Data Analyst", "BI Developer", "Analytics Engineer"]'
+
+    graph = RoleGraph()
+    graph.observe_llm("Data Scientist", ["Data Engineer"])
+    monkeypatch.setattr(nav, "role_graph", graph)
+    monkeypatch.setattr(nav, "acall_llm", fake_llm)
+
+    roles = asyncio.run(nav.ReroutingAgent()._aget_safer_roles("Data Scientist"))
+    assert roles == ["Data Engineer", "Data Analyst", "BI Developer"]
+    assert len(calls) == 1
@@ -0,0 +1,69 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from backend.agents import orchestrator_wrapper as ow
+from tests.conftest import make_user
+
+
+def _market_agent(monkeypatch, fail=False):
+    calls = []
+
+    async def fake(input_data):
+        calls.append(input_data["target_role"])
+        await asyncio.sleep(0.01)
+        if fail:
+            raise RuntimeError("LLM down")
+        return {"market_analysis": {"role_title": input_data["target_role"], "demand_score": 70}}
+
+    monkeypatch.setattr(ow._market_agent, "arun", fake)
+    return calls
+
+
+def test_users_of_one_role_share_a_single_analysis(fake_db, monkeypatch):
+    calls = _market_agent(monkeypatch)
+    fake_db.users["a"] = make_user("a", role="Data Engineer")
+    fake_db.users["b"] = make_user("b", role="  data   engineer ")
+
+    async def run():
+        return await asyncio.gather(ow.get_market("a"), ow.get_market("b"))
+
+    first, second = asyncio.run(run())
+    assert calls == ["Data Engineer"]
+    assert first["market_analysis"] == second["market_analysis"]
+    assert fake_db.roles["data engineer"]["market_analysis"]["demand_score"] == 70
+    assert fake_db.users["a"]["market_ref"]["role_key"] == "data engineer"
+    assert fake_db.users["b"]["market_ref"]["role_key"] == "data engineer"
+
+
+def test_embedded_copy_is_migrated_to_a_reference(fake_db, monkeypatch):
+    _market_agent(monkeypatch)
+    fake_db.users["a"] = make_user("a", market_analysis={"role_title": "old copy"})
+
+    asyncio.run(ow.get_market("a"))
+    assert fake_db.users["a"]["market_analysis"] == {}
+    assert fake_db.users["a"]["market_ref"]["role"] == "Data Engineer"
+
+
+def test_stale_entry_is_regenerated_or_served_when_that_fails(fake_db, monkeypatch):
+    stale = (datetime.utcnow() - timedelta(seconds=ow.ROLE_MARKET_TTL_S + 60)).isoformat()
+    fake_db.roles["data engineer"] = {"role_key": "data engineer", "market_updated_at": stale,
+                                      "market_analysis": {"role_title": "stale"}}
+    fake_db.users["a"] = make_user("a")
+
+    _market_agent(monkeypatch, fail=True)
+    assert asyncio.run(ow.get_market("a"))["market_analysis"]["role_title"] == "stale"
+
+    calls = _market_agent(monkeypatch)
+    assert asyncio.run(ow.get_market("a"))["market_analysis"]["demand_score"] == 70
+    assert calls == ["Data Engineer"]
+    assert asyncio.run(ow.get_market("a"))["market_analysis"]["demand_score"] == 70
+    assert calls == ["Data Engineer"]
+
+
+def test_missing_entry_and_failed_generation_raises(fake_db, monkeypatch):
+    _market_agent(monkeypatch, fail=True)
+    fake_db.users["a"] = make_user("a")
+    with pytest.raises(RuntimeError):
+        asyncio.run(ow.get_market("a"))
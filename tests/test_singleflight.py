@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+from backend.core.singleflight import SingleFlight, normalize_key
+
+
+def test_concurrent_callers_share_one_call():
+    async def run():
+        flight, calls = SingleFlight(), []
+
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"items": [1]}
+
+        results = await asyncio.gather(*(flight.do("k", work) for _ in range(5)))
+        return flight, calls, results
+
+    flight, calls, results = asyncio.run(run())
+    assert len(calls) == 1
+    assert flight.stats() == {"leaders": 1, "followers": 4, "inflight": 0}
+    results[0]["items"].append(2)          # every caller got its own copy
+    assert results[1] == {"items": [1]}
+
+
+def test_sequential_calls_run_again():
+    async def run():
+        flight, calls = SingleFlight(), []
+
+        async def work():
+            calls.append(1)
+            return len(calls)
+
+        return [await flight.do("k", work), await flight.do("k", work)]
+
+    assert asyncio.run(run()) == [1, 2]
+
+
+def test_exception_is_shared_by_every_waiter():
+    async def run():
+        flight = SingleFlight()
+
+        async def boom():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("down")
+
+        return await asyncio.gather(flight.do("k", boom), flight.do("k", boom), return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+def test_cancelled_waiter_does_not_cancel_the_flight():
+    async def run():
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.02)
+            return "done"
+
+        first = asyncio.ensure_future(flight.do("k", work))
+        second = asyncio.ensure_future(flight.do("k", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(run()) == "done"
+
+
+def test_normalize_key_ignores_case_whitespace_and_key_order():
+    assert normalize_key("Agent", {"role": " ML  Engineer", "n": 1}) == \
+        normalize_key("Agent", {"n": 1, "role": "ml engineer"})
+    assert normalize_key("Agent", {"role": "ML Engineer"}) != normalize_key("Agent", {"role": "Data Engineer"})
@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+
+from backend.core.telemetry import LLMTelemetry
+
+
+def test_percentile_needs_enough_samples():
+    t = LLMTelemetry()
+    for latency in range(1, 11):
+        t.observe("RoadmapAgent", "run", float(latency))
+    assert t.percentile("RoadmapAgent", "run", 0.5, min_samples=20) is None
+    assert t.percentile("RoadmapAgent", "run", 0.5, min_samples=5) in (5.0, 6.0)
+    assert t.percentile("RoadmapAgent", "run", 1.0, min_samples=1) == 10.0
+    assert t.percentile("Other", "run", 0.5, min_samples=1) is None
+
+
+def test_summary_counts_tokens_errors_and_retries():
+    t = LLMTelemetry()
+    t.observe("A", "op", 1.0, usage=SimpleNamespace(prompt_tokens=10, completion_tokens=5))
+    t.observe("A", "op", 3.0)
+    t.count_error("A", "op", "APITimeoutError")
+    t.count_retry("A", "op")
+    s = t.summary()["A.op"]
+    assert s["count"] == 2 and s["avg_latency"] == 2.0
+    assert s["prompt_tokens"] == 10 and s["completion_tokens"] == 5
+    assert s["errors"] == {"APITimeoutError": 1}
+    assert s["retries"] == 1
+
+
+def test_summary_counts_hedges_and_wins():
+    t = LLMTelemetry()
+    t.observe("A", "op", 1.0)
+    t.count_hedge("A", "op", won=True)
+    t.count_hedge("A", "op", won=False)
+    s = t.summary()["A.op"]
+    assert s["hedges"] == 2 and s["hedge_wins"] == 1
+
+
+def test_prometheus_histogram_is_cumulative():
+    t = LLMTelemetry()
+    t.observe("A", "op", 0.3)
+    t.observe("A", "op", 3.0)
+    text = t.render_prometheus(cache_stats={"by_agent": {"A": {"hits": 2, "misses": 1}}, "hit_ratio": 0.667},
+                               governor_stats={"concurrency_limit": 4}, flight_stats={"followers": 3})
+    assert 'nexus_llm_request_duration_seconds_bucket{agent="A",op="op",le="0.25"} 0' in text
+    assert 'nexus_llm_request_duration_seconds_bucket{agent="A",op="op",le="0.5"} 1' in text
+    assert 'nexus_llm_request_duration_seconds_bucket{agent="A",op="op",le="4.0"} 2' in text
+    assert 'nexus_llm_request_duration_seconds_count{agent="A",op="op"} 2' in text
+    assert 'nexus_llm_cache_lookups_total{agent="A",result="hit"} 2' in text
+    assert "nexus_llm_concurrency_limit 4" in text
+    assert "nexus_llm_coalesced_total 3" in text
+    assert text.endswith("\n")